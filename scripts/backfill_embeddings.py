@@ -20,8 +20,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from src.processing.embeddings import build_identity_text, generate_embedding
-from src.storage.db import get_connection, upsert_player_embedding
+from src.processing.embeddings import build_identity_text, generate_embeddings
+from src.storage.db import get_connection, upsert_player_embeddings_bulk
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,13 +33,20 @@ logger = logging.getLogger(__name__)
 REQUESTS_PER_MINUTE = 2500
 DELAY_BETWEEN_BATCHES = 60 / (REQUESTS_PER_MINUTE / 100)  # seconds
 
+# Consecutive failed batches before giving up (e.g. the API is down)
+MAX_CONSECUTIVE_FAILURES = 3
+
 
 async def get_roster_players_without_embeddings(
     conn,
     year: int,
     limit: int = 1000,
+    exclude_ids: list[int] | None = None,
 ) -> list[dict]:
-    """Get roster players that don't have embeddings yet."""
+    """Get roster players that don't have embeddings yet.
+
+    exclude_ids skips players that already failed in this run.
+    """
     cur = conn.cursor()
     await cur.execute(
         """
@@ -54,10 +61,11 @@ async def get_roster_players_without_embeddings(
         LEFT JOIN scouting.player_embeddings pe ON r.id::text = pe.roster_id
         WHERE r.year = %s
         AND pe.id IS NULL
+        AND r.id <> ALL(%s)
         ORDER BY r.team, r.last_name
         LIMIT %s
         """,
-        (year, limit),
+        (year, exclude_ids or [], limit),
     )
     columns = [desc[0] for desc in cur.description]
     rows = await cur.fetchall()
@@ -80,10 +88,16 @@ async def backfill_embeddings(
         Stats dict with processed, skipped, errors counts
     """
     stats = {"processed": 0, "skipped": 0, "errors": 0}
+    # Players whose batch failed are not fetched again this run, so a
+    # failing batch can't be retried forever
+    failed_ids: list[int] = []
+    consecutive_failures = 0
 
     async with get_connection() as conn:
         while True:
-            players = await get_roster_players_without_embeddings(conn, year, batch_size)
+            players = await get_roster_players_without_embeddings(
+                conn, year, batch_size, exclude_ids=failed_ids
+            )
 
             if not players:
                 logger.info("No more players to process")
@@ -91,43 +105,52 @@ async def backfill_embeddings(
 
             logger.info(f"Processing batch of {len(players)} players")
 
-            for player in players:
+            identity_texts = [
+                build_identity_text(
+                    {
+                        "name": player["name"],
+                        "position": player["position"],
+                        "team": player["team"],
+                        "year": player["year"],
+                        "hometown": player["hometown"] if player["hometown"] != ", " else None,
+                    }
+                )
+                for player in players
+            ]
+
+            if dry_run:
+                for identity_text in identity_texts:
+                    logger.info(f"[DRY RUN] Would embed: {identity_text}")
+                stats["processed"] += len(players)
+            else:
+                # Generate embeddings for the whole batch in one API call
                 try:
-                    # Build identity text
-                    identity_text = build_identity_text(
+                    results = await generate_embeddings(identity_texts)
+                    rows = [
                         {
-                            "name": player["name"],
-                            "position": player["position"],
-                            "team": player["team"],
-                            "year": player["year"],
-                            "hometown": player["hometown"] if player["hometown"] != ", " else None,
+                            "roster_id": str(player["id"]),
+                            "identity_text": result.identity_text,
+                            "embedding": result.embedding,
                         }
-                    )
-
-                    if dry_run:
-                        logger.info(f"[DRY RUN] Would embed: {identity_text}")
-                        stats["processed"] += 1
-                        continue
-
-                    # Generate embedding
-                    result = await generate_embedding(identity_text)
-
-                    # Store in database
-                    await upsert_player_embedding(
-                        conn=conn,
-                        roster_id=str(player["id"]),
-                        identity_text=result.identity_text,
-                        embedding=result.embedding,
-                    )
-
-                    stats["processed"] += 1
-
-                    if stats["processed"] % 100 == 0:
-                        logger.info(f"Processed {stats['processed']} players")
-
+                        for player, result in zip(players, results, strict=True)
+                    ]
+                    # Store the whole batch in one round trip and commit
+                    await upsert_player_embeddings_bulk(conn, rows)
                 except Exception as e:
-                    logger.error(f"Error processing {player['name']}: {e}")
-                    stats["errors"] += 1
+                    logger.error(f"Error embedding batch of {len(players)} players: {e}")
+                    stats["errors"] += len(players)
+                    await conn.rollback()
+                    failed_ids.extend(player["id"] for player in players)
+                    consecutive_failures += 1
+                    if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                        logger.error(
+                            f"Stopping after {consecutive_failures} failed batches in a row"
+                        )
+                        break
+                else:
+                    consecutive_failures = 0
+                    stats["processed"] += len(rows)
+                    logger.info(f"Processed {stats['processed']} players")
 
             # In dry run mode, only run one batch to preview
             if dry_run:
@@ -142,33 +142,43 @@ async def seed_test_data():
     logger.info(f"Seeded {inserted} test reports")
 
 
-async def review_pending_links():
-    """Interactive review of pending player links."""
+async def review_pending_links(page_size: int = 50):
+    """Interactive review of pending player links, one page at a time."""
     async with get_connection() as conn:
-        pending = await get_pending_links(conn, status="pending", limit=50)
-        print(f"\n{len(pending)} pending links to review\n")
-
-        for link in pending:
-            print(f"ID: {link['id']}")
-            print(f"  Source: {link['source_name']} ({link['source_team']})")
-            print(f"  Candidate: roster_id={link['candidate_roster_id']}")
-            print(f"  Score: {link['match_score']:.2%} ({link['match_method']})")
-            print(f"  Context: {link['source_context']}")
-
-            action = input("\n  [a]pprove / [r]eject / [s]kip / [q]uit: ").lower()
-
-            if action == "a":
-                await update_pending_link_status(conn, link["id"], "approved")
-                print("  -> Approved")
-            elif action == "r":
-                await update_pending_link_status(conn, link["id"], "rejected")
-                print("  -> Rejected")
-            elif action == "q":
-                break
-            else:
-                print("  -> Skipped")
-
-            print()
+        after = None
+        while True:
+            pending = await get_pending_links(conn, status="pending", limit=page_size, after=after)
+            if after is None:
+                print(f"\n{len(pending)} pending links to review\n")
+            elif pending:
+                print(f"\n{len(pending)} more pending links\n")
+            if not pending:
+                return
+
+            for link in pending:
+                print(f"ID: {link['id']}")
+                print(f"  Source: {link['source_name']} ({link['source_team']})")
+                print(f"  Candidate: roster_id={link['candidate_roster_id']}")
+                print(f"  Score: {link['match_score']:.2%} ({link['match_method']})")
+                print(f"  Context: {link['source_context']}")
+
+                action = input("\n  [a]pprove / [r]eject / [s]kip / [q]uit: ").lower()
+
+                if action == "a":
+                    await update_pending_link_status(conn, link["id"], "approved")
+                    print("  -> Approved")
+                elif action == "r":
+                    await update_pending_link_status(conn, link["id"], "rejected")
+                    print("  -> Rejected")
+                elif action == "q":
+                    return
+                else:
+                    print("  -> Skipped")
+
+                print()
+
+            # Skipped links stay pending; the cursor moves past them
+            after = (pending[-1]["created_at"], pending[-1]["id"])
 
 
 async def async_main():
@@ -194,6 +204,11 @@ async def async_main():
         default=50,
         help="Number of reports to process per batch",
     )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Summarize reports via the Message Batches API (cheaper, not realtime)",
+    )
     parser.add_argument(
         "--crawl-247",
         action="store_true",
@@ -227,6 +242,12 @@ async def async_main():
         action="store_true",
         help="Run grading pipeline to update player grades",
     )
+    parser.add_argument(
+        "--grade-batches",
+        type=int,
+        default=1,
+        help="Maximum batches of --batch-size players to grade (default: 1)",
+    )
     parser.add_argument(
         "--review-links",
         action="store_true",
@@ -299,7 +320,10 @@ async def async_main():
 
     if args.process or args.all:
         logger.info("Processing reports...")
-        sr = await run_stage("process", process_reports(batch_size=args.batch_size))
+        sr = await run_stage(
+            "process",
+            process_reports(batch_size=args.batch_size, use_batch_api=args.batch_api),
+        )
         stage_results.append(sr)
         _log_stage(sr)
 
@@ -311,7 +335,10 @@ async def async_main():
 
     if args.grade or args.all:
         logger.info("Running grading pipeline...")
-        sr = await run_stage("grade", run_grading_pipeline(batch_size=args.batch_size))
+        sr = await run_stage(
+            "grade",
+            run_grading_pipeline(batch_size=args.batch_size, max_batches=args.grade_batches),
+        )
         stage_results.append(sr)
         _log_stage(sr)
 
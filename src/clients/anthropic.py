@@ -2,7 +2,17 @@
 
 import os
 
-from anthropic import AsyncAnthropic
+from anthropic import AsyncAnthropic, Timeout
+
+# Realtime calls generate at most ~1000 tokens: fail fast on connect and on a
+# stalled reply. The client keeps one pooled HTTP session for the life of the
+# process.
+REQUEST_TIMEOUT = Timeout(30.0, connect=5.0)
+
+# For calls that generate thousands of tokens in one reply, applied per call
+# with client.with_options(timeout=LONG_REQUEST_TIMEOUT)
+LONG_REQUEST_TIMEOUT = Timeout(300.0, connect=5.0)
+MAX_RETRIES = 2
 
 _client: AsyncAnthropic | None = None
 
@@ -14,5 +24,9 @@ def get_anthropic_client() -> AsyncAnthropic:
     """
     global _client
     if _client is None:
-        _client = AsyncAnthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+        _client = AsyncAnthropic(
+            api_key=os.environ.get("ANTHROPIC_API_KEY"),
+            timeout=REQUEST_TIMEOUT,
+            max_retries=MAX_RETRIES,
+        )
     return _client
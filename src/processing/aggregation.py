@@ -1,18 +1,19 @@
 # src/processing/aggregation.py
 """Player profile aggregation from scouting reports."""
 
+import json
 import logging
 
 from ..clients.anthropic import get_anthropic_client
 from ..config import CLAUDE_MODEL
-from ..storage.db import get_connection
+from ..storage.db import get_read_connection
 
 logger = logging.getLogger(__name__)
 
 
 async def get_player_reports(player_id: int) -> list[dict]:
     """Get all reports linked to a player."""
-    async with get_connection() as conn:
+    async with get_read_connection() as conn:
         cur = conn.cursor()
 
         await cur.execute(
@@ -20,7 +21,7 @@ async def get_player_reports(player_id: int) -> list[dict]:
             SELECT id, source_url, source_name, raw_text, summary,
                    sentiment_score, crawled_at
             FROM scouting.reports
-            WHERE %s = ANY(player_ids)
+            WHERE player_ids @> ARRAY[%s::bigint]
             ORDER BY crawled_at DESC
             """,
             (player_id,),
@@ -75,8 +76,6 @@ Example: {{"arm_strength": 8, "mobility": 7, "leadership": 9}}""",
     )
 
     try:
-        import json
-
         response_text = response.content[0].text.strip()
         if response_text.startswith("```"):
             response_text = response_text.split("```")[1]
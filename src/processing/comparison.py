@@ -1,12 +1,18 @@
 """Player comparison engine for head-to-head analysis."""
 
 import logging
+import time
 from dataclasses import dataclass
 
+import numpy as np
+import psycopg
+from psycopg import errors as pg_errors
+
 from ..storage.db import (
     find_similar_by_embedding,
+    find_similar_by_traits,
     get_connection,
-    get_player_pff_grades,
+    get_latest_pff_grades,
     get_scouting_player,
 )
 
@@ -25,6 +31,12 @@ TRAIT_CATEGORIES = [
     "upside",
 ]
 
+# How long the in-process trait matrix is reused before reloading
+TRAIT_MATRIX_TTL_SECONDS = 300
+
+# Rows fetched per round trip when (re)loading the trait matrix
+TRAIT_MATRIX_FETCH_SIZE = 8192
+
 
 @dataclass
 class PlayerComparison:
@@ -38,6 +50,71 @@ class PlayerComparison:
     advantages: dict
 
 
+@dataclass
+class TraitMatrix:
+    """Unit trait vectors for all scouted players, one row per player."""
+
+    player_ids: np.ndarray  # int64, shape (N,)
+    vectors: np.ndarray  # float32, shape (N, len(TRAIT_CATEGORIES))
+    info: list[tuple[str, str | None, str | None]]  # (name, team, position) per row
+    loaded_at: float
+
+
+_trait_matrix: TraitMatrix | None = None
+
+
+async def _get_trait_matrix(conn: psycopg.AsyncConnection) -> TraitMatrix:
+    """Return the cached trait matrix, reloading it once it is stale.
+
+    Rows come from the pre-normalized traits_unit column (migration 007), so
+    the matrix is ready for cosine scoring as a plain matrix-vector product.
+    """
+    global _trait_matrix
+    now = time.monotonic()
+    if _trait_matrix is not None and now - _trait_matrix.loaded_at < TRAIT_MATRIX_TTL_SECONDS:
+        return _trait_matrix
+
+    # Server-side cursor: rows are streamed in chunks straight into compact
+    # arrays instead of materializing every row tuple at once.
+    cur = conn.cursor(name="trait_matrix_scan")
+    await cur.execute(
+        """
+        SELECT id, name, team, position, traits_unit
+        FROM scouting.players
+        WHERE traits_unit IS NOT NULL
+        """
+    )
+    id_chunks = [np.empty(0, dtype=np.int64)]
+    vector_chunks = [np.empty((0, len(TRAIT_CATEGORIES)), dtype=np.float32)]
+    info = []
+    while rows := await cur.fetchmany(TRAIT_MATRIX_FETCH_SIZE):
+        id_chunks.append(np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)))
+        vector_chunks.append(np.array([row[4] for row in rows], dtype=np.float32))
+        info.extend((row[1], row[2], row[3]) for row in rows)
+    await cur.close()
+
+    _trait_matrix = TraitMatrix(
+        player_ids=np.concatenate(id_chunks),
+        vectors=np.concatenate(vector_chunks),
+        info=info,
+        loaded_at=now,
+    )
+    return _trait_matrix
+
+
+def _top_k(scores: np.ndarray, limit: int) -> np.ndarray:
+    """Indices of the `limit` highest scores, best first.
+
+    Uses argpartition so only the selected entries are sorted, O(N + k log k)
+    instead of a full O(N log N) sort.
+    """
+    k = min(limit, scores.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
 def build_radar_data(
     traits: dict,
     max_value: float = 10.0,
@@ -54,17 +131,11 @@ def build_radar_data(
     if not traits:
         return []
 
-    result = []
-    for trait, value in traits.items():
-        normalized = (value / max_value) * 10 if max_value != 10 else value
-        result.append(
-            {
-                "trait": trait,
-                "value": round(normalized, 1),
-            }
-        )
+    if max_value == 10:
+        return [{"trait": trait, "value": round(value, 1)} for trait, value in traits.items()]
 
-    return result
+    scale = 10.0 / max_value
+    return [{"trait": trait, "value": round(value * scale, 1)} for trait, value in traits.items()]
 
 
 async def compare_players(player1_id: int, player2_id: int) -> PlayerComparison:
@@ -120,16 +191,17 @@ async def compare_players(player1_id: int, player2_id: int) -> PlayerComparison:
         }
 
         # PFF comparison
-        pff1 = await get_player_pff_grades(conn, player1_id)
-        pff2 = await get_player_pff_grades(conn, player2_id)
+        latest_pff = await get_latest_pff_grades(conn, [player1_id, player2_id])
+        pff1 = latest_pff.get(player1_id)
+        pff2 = latest_pff.get(player2_id)
 
         pff_comparison = None
         if pff1 and pff2:
             pff_comparison = {
-                "player1_overall": pff1[0].get("overall_grade"),
-                "player2_overall": pff2[0].get("overall_grade"),
-                "player1_snaps": pff1[0].get("snaps"),
-                "player2_snaps": pff2[0].get("snaps"),
+                "player1_overall": pff1.get("overall_grade"),
+                "player2_overall": pff2.get("overall_grade"),
+                "player1_snaps": pff1.get("snaps"),
+                "player2_snaps": pff2.get("snaps"),
             }
 
         return PlayerComparison(
@@ -163,7 +235,9 @@ async def find_similar_players(
 ) -> list[dict]:
     """Find players with similar profiles using pgvector embeddings.
 
-    Falls back to trait-based cosine similarity if no embedding exists.
+    Falls back to trait-based cosine similarity if no embedding exists,
+    ranked in Postgres via the traits_vec index, or in numpy when that
+    column is unavailable.
     """
     async with get_connection() as conn:
         player = await get_scouting_player(conn, player_id)
@@ -218,49 +292,42 @@ async def find_similar_players(
 
         logger.warning("No embedding for player %d, using trait-based similarity", player_id)
 
-        import numpy as np
+        try:
+            similar = await find_similar_by_traits(conn, player_id, limit=limit)
+        except (pg_errors.UndefinedColumn, pg_errors.UndefinedFunction):
+            # traits_vec (migration 008) not applied yet; rank in Python instead
+            await conn.rollback()
+        else:
+            for s in similar:
+                s["similarity"] = round(float(s["similarity"]), 3)
+            return similar
 
         player_traits = player["traits"]
-        player_vector = np.array([player_traits.get(t, 0) for t in TRAIT_CATEGORIES])
-
-        if np.linalg.norm(player_vector) == 0:
-            return []
-
-        await cur.execute(
-            """
-            SELECT id, name, team, position, traits
-            FROM scouting.players
-            WHERE id != %s
-            AND traits IS NOT NULL
-            AND traits != '{}'
-            """,
-            (player_id,),
+        player_vector = np.array(
+            [player_traits.get(t, 0) for t in TRAIT_CATEGORIES], dtype=np.float32
         )
 
-        similarities = []
-        for row in await cur.fetchall():
-            other_id, name, team, position, other_traits = row
-            if not other_traits:
-                continue
+        player_norm_sq = np.vdot(player_vector, player_vector)
+        if player_norm_sq == 0:
+            return []
+        player_unit = player_vector / np.sqrt(player_norm_sq)
 
-            other_vector = np.array([other_traits.get(t, 0) for t in TRAIT_CATEGORIES])
+        matrix = await _get_trait_matrix(conn)
+        scores = matrix.vectors @ player_unit
+        scores[matrix.player_ids == player_id] = -np.inf
 
-            if np.linalg.norm(other_vector) == 0:
+        results = []
+        for i in _top_k(scores, limit):
+            if not np.isfinite(scores[i]):
                 continue
-
-            similarity = np.dot(player_vector, other_vector) / (
-                np.linalg.norm(player_vector) * np.linalg.norm(other_vector)
-            )
-
-            similarities.append(
+            name, team, position = matrix.info[i]
+            results.append(
                 {
-                    "player_id": other_id,
+                    "player_id": int(matrix.player_ids[i]),
                     "name": name,
                     "team": team,
                     "position": position,
-                    "similarity": round(float(similarity), 3),
+                    "similarity": round(float(scores[i]), 3),
                 }
             )
-
-        similarities.sort(key=lambda x: x["similarity"], reverse=True)
-        return similarities[:limit]
+        return results
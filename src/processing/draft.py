@@ -1,15 +1,12 @@
 """Draft board and projection system."""
 
 import logging
-from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, timedelta
 from enum import Enum
 
-import numpy as np
-
 from ..storage.db import get_connection
-from .trends import TrendDirection, calculate_trend
+from .trends import TrendDirection, classify_slope
 
 logger = logging.getLogger(__name__)
 
@@ -91,82 +88,109 @@ def get_projection(draft_score: float) -> DraftProjection:
         return DraftProjection.UDFA
 
 
-async def _batch_load_pff_grades(
+async def _batch_load_draft_inputs(
     conn,
     player_ids: list[int],
-) -> dict[int, float]:
-    """Batch-load the most recent PFF overall grade for each player.
+    days: int = 90,
+) -> dict[int, tuple[float | None, float, str]]:
+    """Batch-load latest PFF grade and recent trend for each player in one query.
+
+    The trend slope is computed in Postgres with regr_slope over the snapshot
+    index, matching calculate_trend's least-squares fit.
 
     Returns:
-        Map of player_id -> overall_grade (most recent season first).
+        Map of player_id -> (pff_grade, slope, direction_value). Players with
+        no PFF grade or fewer than 3 timeline points get None / UNKNOWN.
     """
     if not player_ids:
         return {}
     cur = conn.cursor()
+    cutoff = date.today() - timedelta(days=days)
     await cur.execute(
         """
-        SELECT player_id, overall_grade
-        FROM scouting.pff_grades
-        WHERE player_id = ANY(%s)
-        ORDER BY season DESC, week DESC NULLS FIRST
+        WITH ids AS (
+            SELECT DISTINCT unnest(%(ids)s::int[]) AS id
+        ),
+        pff AS (
+            SELECT DISTINCT ON (g.player_id) g.player_id, g.overall_grade
+            FROM scouting.pff_grades g
+            JOIN ids ON g.player_id = ids.id
+            ORDER BY g.player_id, g.season DESC, g.week DESC NULLS FIRST
+        ),
+        tl AS (
+            SELECT player_id, regr_slope(grade_at_time, idx) AS slope
+            FROM (
+                SELECT t.player_id, t.grade_at_time,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY t.player_id ORDER BY t.snapshot_date
+                       ) AS idx
+                FROM scouting.player_timeline t
+                JOIN ids ON t.player_id = ids.id
+                WHERE t.snapshot_date >= %(cutoff)s
+                  AND t.grade_at_time IS NOT NULL
+            ) t
+            GROUP BY player_id
+            HAVING COUNT(*) >= 3
+        )
+        SELECT COALESCE(pff.player_id, tl.player_id), pff.overall_grade, tl.slope
+        FROM pff
+        FULL JOIN tl ON tl.player_id = pff.player_id
         """,
-        (player_ids,),
+        {"ids": player_ids, "cutoff": cutoff},
     )
-    pff_map: dict[int, float] = {}
-    for pid, grade in await cur.fetchall():
-        if pid not in pff_map:  # keep most recent (first due to ORDER BY)
-            pff_map[pid] = float(grade)
-    return pff_map
 
+    inputs: dict[int, tuple[float | None, float, str]] = {}
+    for pid, pff_grade, slope in await cur.fetchall():
+        pff_grade = float(pff_grade) if pff_grade is not None else None
+        if slope is None:
+            inputs[pid] = (pff_grade, 0.0, TrendDirection.UNKNOWN.value)
+        else:
+            inputs[pid] = (pff_grade, slope, classify_slope(slope).value)
 
-async def _batch_load_trends(
-    conn,
-    player_ids: list[int],
-    days: int = 90,
-) -> dict[int, tuple[float, str]]:
-    """Batch-load timeline data and compute trend slope/direction in-memory.
+    return inputs
 
-    Returns:
-        Map of player_id -> (slope, direction_value).
+
+async def _build_draft_players(conn, rows: list[tuple]) -> list[DraftPlayer]:
+    """Score player rows into DraftPlayers, sorted by draft score.
+
+    Rows are (id, name, position, team, class_year, composite_grade,
+    current_status) as selected by the draft board queries.
     """
-    if not player_ids:
-        return {}
-    cur = conn.cursor()
-    cutoff = date.today() - timedelta(days=days)
-    await cur.execute(
-        """
-        SELECT player_id, grade_at_time, snapshot_date
-        FROM scouting.player_timeline
-        WHERE player_id = ANY(%s)
-          AND snapshot_date >= %s
-          AND grade_at_time IS NOT NULL
-        ORDER BY player_id, snapshot_date ASC
-        """,
-        (player_ids, cutoff),
-    )
+    # Batch-load PFF grades and trends (1 query instead of 2N)
+    inputs = await _batch_load_draft_inputs(conn, [row[0] for row in rows])
+
+    players = []
+    for row in rows:
+        player_id, name, pos, team, year, grade, status = row
+
+        pff_grade, slope, direction = inputs.get(
+            player_id, (None, 0.0, TrendDirection.UNKNOWN.value)
+        )
 
-    # Group grades by player
-    grades_by_player: dict[int, list[float]] = defaultdict(list)
-    for pid, grade, _ in await cur.fetchall():
-        grades_by_player[pid].append(float(grade))
-
-    trend_map: dict[int, tuple[float, str]] = {}
-    for pid in player_ids:
-        grades = grades_by_player.get(pid, [])
-        if len(grades) < 3:
-            trend_map[pid] = (0.0, TrendDirection.UNKNOWN.value)
-            continue
-
-        direction = calculate_trend(grades)
-        x = np.arange(len(grades))
-        y = np.array(grades)
-        n = len(grades)
-        slope = float(
-            (n * np.sum(x * y) - np.sum(x) * np.sum(y)) / (n * np.sum(x**2) - np.sum(x) ** 2)
+        draft_score = calculate_draft_score(
+            composite_grade=grade,
+            pff_grade=pff_grade,
+            trend_slope=slope,
         )
-        trend_map[pid] = (slope, direction.value)
 
-    return trend_map
+        players.append(
+            DraftPlayer(
+                player_id=player_id,
+                name=name,
+                position=pos or "Unknown",
+                team=team or "Unknown",
+                class_year=year,
+                draft_score=round(draft_score, 1),
+                projection=get_projection(draft_score),
+                composite_grade=grade,
+                pff_grade=round(pff_grade, 1) if pff_grade else None,
+                trend_direction=direction,
+            )
+        )
+
+    # Sort by draft score
+    players.sort(key=lambda x: x.draft_score, reverse=True)
+    return players
 
 
 async def build_draft_board(
@@ -209,44 +233,7 @@ async def build_draft_board(
         await cur.execute(query, params)
         rows = await cur.fetchall()
 
-        player_ids = [row[0] for row in rows]
-
-        # Batch-load PFF grades and trends (2 queries instead of 2N)
-        pff_map = await _batch_load_pff_grades(conn, player_ids)
-        trend_map = await _batch_load_trends(conn, player_ids)
-
-        players = []
-        for row in rows:
-            player_id, name, pos, team, year, grade, status = row
-
-            pff_grade = pff_map.get(player_id)
-            slope, direction = trend_map.get(player_id, (0.0, TrendDirection.UNKNOWN.value))
-
-            draft_score = calculate_draft_score(
-                composite_grade=grade,
-                pff_grade=pff_grade,
-                trend_slope=slope,
-            )
-
-            projection = get_projection(draft_score)
-
-            players.append(
-                DraftPlayer(
-                    player_id=player_id,
-                    name=name,
-                    position=pos or "Unknown",
-                    team=team or "Unknown",
-                    class_year=year,
-                    draft_score=round(draft_score, 1),
-                    projection=projection,
-                    composite_grade=grade,
-                    pff_grade=round(pff_grade, 1) if pff_grade else None,
-                    trend_direction=direction,
-                )
-            )
-
-        # Sort by draft score
-        players.sort(key=lambda x: x.draft_score, reverse=True)
+        players = await _build_draft_players(conn, rows)
         return players[:limit]
 
 
@@ -274,39 +261,4 @@ async def get_team_draft_prospects(team: str) -> list[DraftPlayer]:
         )
         rows = await cur.fetchall()
 
-        player_ids = [row[0] for row in rows]
-
-        # Batch-load PFF grades and trends (2 queries instead of 2N)
-        pff_map = await _batch_load_pff_grades(conn, player_ids)
-        trend_map = await _batch_load_trends(conn, player_ids)
-
-        players = []
-        for row in rows:
-            player_id, name, pos, team_name, year, grade, status = row
-
-            pff_grade = pff_map.get(player_id)
-            slope, direction = trend_map.get(player_id, (0.0, TrendDirection.UNKNOWN.value))
-
-            draft_score = calculate_draft_score(
-                composite_grade=grade,
-                pff_grade=pff_grade,
-                trend_slope=slope,
-            )
-
-            players.append(
-                DraftPlayer(
-                    player_id=player_id,
-                    name=name,
-                    position=pos or "Unknown",
-                    team=team_name or "Unknown",
-                    class_year=year,
-                    draft_score=round(draft_score, 1),
-                    projection=get_projection(draft_score),
-                    composite_grade=grade,
-                    pff_grade=round(pff_grade, 1) if pff_grade else None,
-                    trend_direction=direction,
-                )
-            )
-
-        players.sort(key=lambda x: x.draft_score, reverse=True)
-        return players
+        return await _build_draft_players(conn, rows)
@@ -1,22 +1,40 @@
 """Player identity embedding generation using OpenAI."""
 
 import os
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, Timeout
 
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSIONS = 1536
 
+# Max inputs per embeddings request (API limit is 2048)
+EMBEDDING_BATCH_SIZE = 512
+
+# Query embeddings kept in process (LRU), keyed by identity text. Stored as
+# float32 arrays (pgvector's own precision), about 6 KB each
+EMBEDDING_CACHE_SIZE = 4096
+
+REQUEST_TIMEOUT = Timeout(30.0, connect=5.0)
+MAX_RETRIES = 2
+
 # Lazy-initialized client (None until first use, allows mocking in tests)
 openai_client: AsyncOpenAI | None = None
 
+_embedding_cache: OrderedDict[str, array] = OrderedDict()
+
 
 def _get_client() -> AsyncOpenAI:
     """Get or create async OpenAI client."""
     global openai_client
     if openai_client is None:
-        openai_client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        openai_client = AsyncOpenAI(
+            api_key=os.environ.get("OPENAI_API_KEY"),
+            timeout=REQUEST_TIMEOUT,
+            max_retries=MAX_RETRIES,
+        )
     return openai_client
 
 
@@ -58,19 +76,83 @@ def build_identity_text(player: dict) -> str:
 async def generate_embedding(identity_text: str) -> EmbeddingResult:
     """Generate embedding vector for identity text.
 
+    Repeat lookups of the same text (re-runs, retries) are served from an
+    in-process LRU cache instead of calling the API again. Vectors come back
+    at float32 precision whether or not they were cached.
+
     Args:
         identity_text: Player identity string
 
     Returns:
         EmbeddingResult with text and 1536-dim vector
     """
+    results = await generate_cached_embeddings([identity_text])
+    return results[0]
+
+
+async def generate_cached_embeddings(identity_texts: list[str]) -> list[EmbeddingResult]:
+    """generate_embeddings() through the in-process LRU cache.
+
+    Only texts missing from the cache are sent to the API (once each), and
+    their vectors are cached. Vectors come back at float32 precision whether
+    or not they were cached.
+
+    Args:
+        identity_texts: Player identity strings
+
+    Returns:
+        EmbeddingResults in the same order as identity_texts
+    """
+    unique_texts = list(dict.fromkeys(identity_texts))
+    vectors: dict[str, array] = {}
+    for text in unique_texts:
+        cached = _embedding_cache.get(text)
+        if cached is not None:
+            _embedding_cache.move_to_end(text)
+            vectors[text] = cached
+
+    misses = [text for text in unique_texts if text not in vectors]
+    if misses:
+        for result in await generate_embeddings(misses):
+            vectors[result.identity_text] = array("f", result.embedding)
+            _embedding_cache[result.identity_text] = vectors[result.identity_text]
+            if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
+
+    return [
+        EmbeddingResult(identity_text=text, embedding=vectors[text].tolist())
+        for text in identity_texts
+    ]
+
+
+async def generate_embeddings(
+    identity_texts: list[str],
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+) -> list[EmbeddingResult]:
+    """Generate embedding vectors for many identity texts.
+
+    Sends up to batch_size texts per API request instead of one per call.
+
+    Args:
+        identity_texts: Player identity strings
+        batch_size: Max texts per request
+
+    Returns:
+        EmbeddingResults in the same order as identity_texts
+    """
     client = _get_client()
-    response = await client.embeddings.create(
-        model=EMBEDDING_MODEL,
-        input=identity_text,
-    )
-
-    return EmbeddingResult(
-        identity_text=identity_text,
-        embedding=response.data[0].embedding,
-    )
+    results: list[EmbeddingResult] = []
+
+    for start in range(0, len(identity_texts), batch_size):
+        chunk = identity_texts[start : start + batch_size]
+        response = await client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=chunk,
+        )
+        data = sorted(response.data, key=lambda d: d.index)
+        results.extend(
+            EmbeddingResult(identity_text=text, embedding=item.embedding)
+            for text, item in zip(chunk, data)
+        )
+
+    return results
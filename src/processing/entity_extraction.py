@@ -1,14 +1,18 @@
 """Player entity extraction from scouting content."""
 
+import json
 import logging
 import re
 from typing import TypedDict
 
-from ..clients.anthropic import get_anthropic_client
+from ..clients.anthropic import LONG_REQUEST_TIMEOUT, get_anthropic_client
 from ..config import CLAUDE_MODEL
 
 logger = logging.getLogger(__name__)
 
+# Reports sent to Claude per request by extract_player_mentions_claude_batch()
+CLAUDE_BATCH_SIZE = 8
+
 # Common CFB position abbreviations
 POSITIONS = [
     "QB",
@@ -38,45 +42,21 @@ POSITIONS = [
     "ATH",
 ]
 
-# Regex to find "Position Name" patterns
-POSITION_NAME_PATTERN = re.compile(
-    rf"\b({'|'.join(POSITIONS)})\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)", re.IGNORECASE
-)
-
-# Regex to find capitalized names (2-4 words)
-NAME_PATTERN = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\b")
-
+# Name words use possessive quantifiers (++): giving back a letter or a space
+# can never produce a match, so this stops the engine backtracking into them.
+_NAME_WORDS = r"[A-Z][a-z]++(?:\s++[A-Z][a-z]++)"
 
-def normalize_name(name: str) -> str:
-    """Normalize a name for matching.
+# Regex to find "Position Name" patterns. Positions are tried longest first
+# and only they are case-insensitive; the name must still be capitalized.
+_POSITION_ALTERNATION = "|".join(sorted(POSITIONS, key=len, reverse=True))
+POSITION_NAME_PATTERN = re.compile(rf"\b(?i:({_POSITION_ALTERNATION}))\s++({_NAME_WORDS}+)")
 
-    - Lowercase
-    - Remove extra whitespace
-    - Remove apostrophes and periods
-    """
-    name = name.lower().strip()
-    name = re.sub(r"['\".]", "", name)
-    name = re.sub(r"\s+", " ", name)
-    return name
-
-
-def extract_player_mentions(text: str) -> list[str]:
-    """Extract potential player names from text using regex patterns.
-
-    This is a fast heuristic extraction. For higher accuracy,
-    use extract_player_mentions_claude().
-    """
-    players = set()
-
-    # Find "Position Name" patterns
-    for match in POSITION_NAME_PATTERN.finditer(text):
-        name = match.group(2).strip()
-        if len(name.split()) >= 2:  # At least first + last
-            players.add(name)
+# Regex to find capitalized names (2-4 words)
+NAME_PATTERN = re.compile(rf"\b({_NAME_WORDS}{{1,3}})\b")
 
-    # Find standalone capitalized names that look like player names
-    # Filter out common non-names
-    SKIP_WORDS = {
+# First words that mark a capitalized phrase as a non-name
+SKIP_WORDS = frozenset(
+    {
         "The",
         "This",
         "That",
@@ -123,17 +103,48 @@ def extract_player_mentions(text: str) -> list[str]:
         "Georgia",
         "Michigan",  # Team names
     }
+)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name for matching.
+
+    - Lowercase
+    - Remove extra whitespace
+    - Remove apostrophes and periods
+    """
+    name = name.lower().strip()
+    name = re.sub(r"['\".]", "", name)
+    name = re.sub(r"\s+", " ", name)
+    return name
+
+
+def extract_player_mentions(text: str) -> list[str]:
+    """Extract potential player names from text using regex patterns.
+
+    This is a fast heuristic extraction. For higher accuracy,
+    use extract_player_mentions_claude().
+    """
+    players = set()
+
+    # Find "Position Name" patterns. This is a separate pass: a standalone
+    # name span can start with a skip word and swallow a title-case position
+    # ("Michigan Edge Josaiah Stewart"), and the name after it must survive.
+    for match in POSITION_NAME_PATTERN.finditer(text):
+        # "Position Name" always has at least first + last
+        players.add(match.group(2))
 
+    # Find standalone capitalized names that look like player names
     for match in NAME_PATTERN.finditer(text):
-        name = match.group(1).strip()
-        words = name.split()
+        name = match.group(1)
+        first, _, _ = name.partition(" ")
 
         # Skip if first word is a common non-name
-        if words[0] in SKIP_WORDS:
+        if first in SKIP_WORDS:
             continue
 
-        # Must be 2-4 words, not all caps
-        if 2 <= len(words) <= 4 and not name.isupper():
+        # Must be 2-4 words (guaranteed by the pattern), not all caps
+        if not name.isupper():
             players.add(name)
 
     return list(players)
@@ -152,6 +163,10 @@ async def extract_player_mentions_claude(text: str) -> list[PlayerMention]:
     """Extract player mentions using Claude for higher accuracy.
 
     Use this for processing important content where accuracy matters.
+
+    Raises:
+        ValueError: If Claude's reply can't be parsed. An unparseable reply
+            is a failed extraction, not a text without players.
     """
     client = get_anthropic_client()
 
@@ -181,18 +196,90 @@ Example:
     )
 
     try:
-        import json
+        result = _parse_json_response(response.content[0].text)
+        return [PlayerMention(**p) for p in result]
+    except Exception as e:
+        raise ValueError(f"Failed to parse Claude response: {e}") from e
 
-        response_text = response.content[0].text.strip()
 
-        # Handle markdown code blocks
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
+async def extract_player_mentions_claude_batch(
+    texts: list[str],
+) -> list[list[PlayerMention] | None]:
+    """Extract player mentions from several texts with a single Claude request.
 
-        result = json.loads(response_text)
-        return [PlayerMention(**p) for p in result]
-    except Exception as e:
-        logger.warning(f"Failed to parse Claude response: {e}")
+    Each text is sent as a numbered <doc> block so the request overhead and
+    instructions are shared across documents. Results are parsed per document:
+    a malformed or missing entry only fails that document.
+
+    Returns:
+        One list of mentions per input text, in input order; None for a
+        document whose mentions could not be parsed.
+    """
+    if not texts:
         return []
+
+    docs = "\n\n".join(f'<doc i="{i}">\n{text[:3000]}\n</doc>' for i, text in enumerate(texts))
+
+    # Up to 1000 output tokens per document: too long for the realtime timeout
+    client = get_anthropic_client().with_options(timeout=LONG_REQUEST_TIMEOUT)
+
+    response = await client.messages.create(
+        model=CLAUDE_MODEL,
+        max_tokens=1000 * len(texts),
+        messages=[
+            {
+                "role": "user",
+                "content": f"""Extract all college football player names mentioned in each document.
+
+{docs}
+
+Return a JSON object keyed by document number ("0", "1", ...). Each value is a
+JSON array of objects with these fields:
+- name: The player's full name
+- position: Their position if mentioned (QB, RB, WR, etc.) or null
+- team: Their team if mentioned or null
+- context: One of "starter", "recruit", "transfer", "draft_prospect", "general"
+
+Include every document number, using [] when no players are mentioned.
+Return only the JSON object, no other text.
+
+Example:
+{{"0": [{{"name": "Arch Manning", "position": "QB", "team": "Texas", "context": "starter"}}],
+ "1": []}}""",
+            }
+        ],
+    )
+
+    try:
+        result = _parse_json_response(response.content[0].text)
+        if not isinstance(result, dict):
+            raise ValueError(f"expected a JSON object, got {type(result).__name__}")
+    except Exception as e:
+        logger.warning(f"Failed to parse Claude batch response: {e}")
+        return [None for _ in texts]
+
+    batch = []
+    for i in range(len(texts)):
+        if str(i) not in result:
+            logger.warning(f"Claude batch response has no entry for doc {i}")
+            batch.append(None)
+            continue
+        try:
+            batch.append([PlayerMention(**p) for p in result[str(i)]])
+        except Exception as e:
+            logger.warning(f"Failed to parse Claude mentions for doc {i}: {e}")
+            batch.append(None)
+    return batch
+
+
+def _parse_json_response(response_text: str):
+    """Parse a JSON response from Claude, tolerating a markdown code block."""
+    response_text = response_text.strip()
+
+    # Handle markdown code blocks
+    if response_text.startswith("```"):
+        response_text = response_text.split("```")[1]
+        if response_text.startswith("json"):
+            response_text = response_text[4:]
+
+    return json.loads(response_text)
@@ -1,92 +1,190 @@
 """Entity linking pipeline - connects reports to player profiles."""
 
+import asyncio
+import hashlib
 import logging
 from datetime import datetime
 
 from ..storage.db import (
+    cache_mentions,
+    get_cached_mentions,
     get_connection,
-    link_report_to_player,
-    upsert_scouting_player,
+    get_read_connection,
+    link_report_to_players,
+    upsert_scouting_players_bulk,
 )
-from .entity_extraction import extract_player_mentions, extract_player_mentions_claude
-from .player_matching import match_player_with_review
+from .entity_extraction import (
+    CLAUDE_BATCH_SIZE,
+    PlayerMention,
+    extract_player_mentions,
+    extract_player_mentions_claude,
+    extract_player_mentions_claude_batch,
+    normalize_name,
+)
+from .player_matching import find_deterministic_matches, match_players_with_review
 
 logger = logging.getLogger(__name__)
 
+# Reports linked concurrently by run_entity_linking. Each holds at most one
+# pooled connection at a time, so keep this below MAX_POOL_CONNECTIONS.
+LINKING_CONCURRENCY = 8
+
+# Batched Claude extraction requests in flight at once. Each asks for up to
+# 1000 output tokens per report in the chunk, so keep this small
+EXTRACTION_CONCURRENCY = 2
+
+# Processed reports with no player links yet, oldest first
+_UNLINKED_REPORTS_SQL = """
+    SELECT id, source_url, source_name, content_type, raw_text, team_ids
+    FROM scouting.reports
+    WHERE processed_at IS NOT NULL
+    AND (player_ids IS NULL OR array_length(player_ids, 1) IS NULL)
+    ORDER BY crawled_at ASC
+    LIMIT %s
+"""
+
+
+def _content_hash(text: str) -> bytes:
+    """Key for scouting.mentions_cache."""
+    return hashlib.sha256(text.encode()).digest()
+
+
+async def _load_cached_mentions(content_hashes: list[bytes]) -> dict[bytes, list[PlayerMention]]:
+    """Fetch cached Claude extraction results in one query."""
+    async with get_read_connection() as conn:
+        return await get_cached_mentions(conn, content_hashes)
+
+
+async def _store_cached_mentions(entries: list[tuple[bytes, list[PlayerMention]]]) -> None:
+    """Persist Claude extraction results for reuse by later runs.
+
+    Best effort: a failed cache write is logged and never fails linking.
+    """
+    try:
+        async with get_connection() as conn:
+            await cache_mentions(conn, entries)
+    except Exception as e:
+        logger.warning(f"Failed to cache mentions for {len(entries)} reports: {e}")
+
 
 async def link_report_entities(
     report: dict,
     use_claude: bool = False,
+    mentions: list[PlayerMention] | None = None,
+    current_year: int | None = None,
 ) -> list[int]:
     """Extract and link player entities from a report.
 
     Args:
         report: Report dict with id, raw_text, team_ids.
         use_claude: Use Claude for entity extraction (more accurate, costs tokens).
+        mentions: Mentions already extracted for this report (e.g. by a batched
+            Claude call); skips extraction when given.
+        current_year: Class year for new unlinked players; defaults to this year.
 
     Returns:
         List of scouting.players IDs that were linked.
     """
-    async with get_connection() as conn:
-        linked_player_ids = []
-
-        # Extract player mentions
-        if use_claude:
+    # Extract player mentions
+    if mentions is not None:
+        names = [(m["name"], m.get("position"), m.get("team")) for m in mentions]
+    elif use_claude:
+        content_hash = _content_hash(report["raw_text"])
+        cached = await _load_cached_mentions([content_hash])
+        mentions = cached.get(content_hash)
+        if mentions is None:
             mentions = await extract_player_mentions_claude(report["raw_text"])
-            names = [(m["name"], m.get("position"), m.get("team")) for m in mentions]
+            await _store_cached_mentions([(content_hash, mentions)])
+        names = [(m["name"], m.get("position"), m.get("team")) for m in mentions]
+    else:
+        names = [(name, None, None) for name in extract_player_mentions(report["raw_text"])]
+
+    # Each distinct player is matched and upserted once, however often named;
+    # the first spelling seen is kept
+    unique_names = {}
+    for name, position, team in names:
+        unique_names.setdefault((normalize_name(name), position, team), (name, position, team))
+    names = list(unique_names.values())
+
+    # Get team context from report
+    team_context = report.get("team_ids", [])
+    default_team = team_context[0] if team_context else None
+    if current_year is None:
+        current_year = datetime.now().year
+
+    # Prefetch exact name + team roster matches for all mentions in one query
+    deterministic = await find_deterministic_matches(
+        [(name, str(team or default_team)) for name, _, team in names if team or default_team],
+        year=2025,
+    )
+
+    # Mentions without an exact hit go through the vector and fuzzy tiers
+    # together: one embedding request and one roster fetch for all of them
+    matches = [
+        deterministic.get((name.lower(), str(team or default_team).lower()))
+        if team or default_team
+        else None
+        for name, _, team in names
+    ]
+    misses = [i for i, match in enumerate(matches) if not match]
+    pending_link_ids: dict[int, int] = {}
+    if misses:
+        reviewed = await match_players_with_review(
+            [(names[i][0], names[i][2] or default_team, names[i][1]) for i in misses],
+            year=2025,
+            source_context={
+                "report_id": report["id"],
+                "source_url": report.get("source_url"),
+            },
+        )
+        for i, (match, pending_link_id) in zip(misses, reviewed):
+            matches[i] = match
+            if pending_link_id:
+                pending_link_ids[i] = pending_link_id
+
+    # Resolve every mention first, then write all players in one batch
+    players_to_upsert = []
+    for i, ((name, position, team), match) in enumerate(zip(names, matches)):
+        if i in pending_link_ids:
+            logger.info(f"Created pending link {pending_link_ids[i]} for {name}")
+            continue  # Skip this player, needs review
+
+        if match:
+            # Create/update scouting player linked to roster/recruit
+            players_to_upsert.append(
+                {
+                    "name": f"{match.first_name} {match.last_name}",
+                    "team": match.team,
+                    "position": match.position,
+                    "class_year": match.year,
+                    "current_status": "active" if match.source == "roster" else "recruit",
+                    "roster_player_id": int(match.source_id) if match.source == "roster" else None,
+                    "recruit_id": int(match.source_id) if match.source == "recruit" else None,
+                }
+            )
         else:
-            names = [(name, None, None) for name in extract_player_mentions(report["raw_text"])]
-
-        # Get team context from report
-        team_context = report.get("team_ids", [])
-        default_team = team_context[0] if team_context else None
-
-        for name, position, team in names:
-            # Try to find existing roster/recruit match
-            match, pending_link_id = await match_player_with_review(
-                name,
-                team=team or default_team,
-                position=position,
-                year=2025,
-                source_context={
-                    "report_id": report["id"],
-                    "source_url": report.get("source_url"),
-                },
+            # Create scouting player without link (new mention)
+            players_to_upsert.append(
+                {
+                    "name": name,
+                    "team": team or default_team or "Unknown",
+                    "position": position,
+                    "class_year": current_year,
+                    "current_status": "active",
+                }
             )
 
-            if pending_link_id:
-                logger.info(f"Created pending link {pending_link_id} for {name}")
-                continue  # Skip this player, needs review
-
-            if match:
-                # Create/update scouting player linked to roster/recruit
-                player_id = await upsert_scouting_player(
-                    conn,
-                    name=f"{match.first_name} {match.last_name}",
-                    team=match.team,
-                    position=match.position,
-                    class_year=match.year,
-                    current_status="active" if match.source == "roster" else "recruit",
-                    roster_player_id=int(match.source_id) if match.source == "roster" else None,
-                    recruit_id=int(match.source_id) if match.source == "recruit" else None,
-                )
-            else:
-                # Create scouting player without link (new mention)
-                player_id = await upsert_scouting_player(
-                    conn,
-                    name=name,
-                    team=team or default_team or "Unknown",
-                    position=position,
-                    class_year=datetime.now().year,  # Dynamic current year
-                    current_status="active",
-                )
+    if not players_to_upsert:
+        return []
 
-            # Link report to player
-            await link_report_to_player(conn, report["id"], player_id)
-            linked_player_ids.append(player_id)
-            logger.debug(f"Linked player {player_id} ({name}) to report {report['id']}")
+    async with get_connection() as conn:
+        linked_player_ids = await upsert_scouting_players_bulk(conn, players_to_upsert)
 
-        return linked_player_ids
+        # Link report to all players in one UPDATE
+        await link_report_to_players(conn, report["id"], linked_player_ids)
+        logger.debug(f"Linked players {linked_player_ids} to report {report['id']}")
+
+    return linked_player_ids
 
 
 async def run_entity_linking(
@@ -102,20 +200,10 @@ async def run_entity_linking(
     Returns:
         Stats dict.
     """
-    async with get_connection() as conn:
+    async with get_read_connection() as conn:
         # Get reports that are processed but have no player links
         cur = conn.cursor()
-        await cur.execute(
-            """
-            SELECT id, source_url, source_name, content_type, raw_text, team_ids
-            FROM scouting.reports
-            WHERE processed_at IS NOT NULL
-            AND (player_ids IS NULL OR array_length(player_ids, 1) IS NULL)
-            ORDER BY crawled_at ASC
-            LIMIT %s
-            """,
-            (batch_size,),
-        )
+        await cur.execute(_UNLINKED_REPORTS_SQL, (batch_size,))
         columns = [desc[0] for desc in cur.description]
         reports = [dict(zip(columns, row)) for row in await cur.fetchall()]
 
@@ -124,15 +212,80 @@ async def run_entity_linking(
     linked = 0
     errors = 0
     total_players = 0
+    current_year = datetime.now().year
+
+    sem = asyncio.Semaphore(LINKING_CONCURRENCY)
+    extract_sem = asyncio.Semaphore(EXTRACTION_CONCURRENCY)
+
+    async def _link_one(report: dict, mentions: list[PlayerMention] | None) -> None:
+        nonlocal linked, errors, total_players
+        async with sem:
+            try:
+                player_ids = await link_report_entities(
+                    report, use_claude=use_claude, mentions=mentions, current_year=current_year
+                )
+                total_players += len(player_ids)
+                linked += 1
+            except Exception as e:
+                logger.error(f"Error linking report {report['id']}: {e}")
+                errors += 1
+
+    # Claude results cached by earlier runs, fetched for the whole batch at once
+    content_hashes = {}
+    cached = {}
+    if use_claude and reports:
+        content_hashes = {r["id"]: _content_hash(r["raw_text"]) for r in reports}
+        cached = await _load_cached_mentions(list(set(content_hashes.values())))
+
+    async def _link_chunk(chunk: list[dict]) -> None:
+        nonlocal errors
+        chunk_mentions = [None] * len(chunk)
+
+        if use_claude:
+            chunk_mentions = [cached.get(content_hashes[r["id"]]) for r in chunk]
+            misses = [i for i, mentions in enumerate(chunk_mentions) if mentions is None]
+
+            if misses:
+                # One Claude request extracts mentions for the uncached reports
+                try:
+                    async with extract_sem:
+                        extracted = await extract_player_mentions_claude_batch(
+                            [chunk[i]["raw_text"] for i in misses]
+                        )
+                except Exception as e:
+                    logger.error(f"Error extracting mentions for {len(misses)} reports: {e}")
+                    extracted = [None] * len(misses)
+
+                for i, mentions in zip(misses, extracted):
+                    chunk_mentions[i] = mentions
+                # Only successful parses are cached; failed reports stay
+                # unlinked and are extracted again next run
+                extracted_entries = [
+                    (content_hashes[chunk[i]["id"]], chunk_mentions[i])
+                    for i in misses
+                    if chunk_mentions[i] is not None
+                ]
+                if extracted_entries:
+                    await _store_cached_mentions(extracted_entries)
+
+                failed = {i for i in misses if chunk_mentions[i] is None}
+                if failed:
+                    errors += len(failed)
+                    chunk = [r for i, r in enumerate(chunk) if i not in failed]
+                    chunk_mentions = [m for m in chunk_mentions if m is not None]
+
+        await asyncio.gather(
+            *(_link_one(report, mentions) for report, mentions in zip(chunk, chunk_mentions))
+        )
+
+    if use_claude:
+        chunks = [
+            reports[i : i + CLAUDE_BATCH_SIZE] for i in range(0, len(reports), CLAUDE_BATCH_SIZE)
+        ]
+    else:
+        chunks = [reports]
 
-    for report in reports:
-        try:
-            player_ids = await link_report_entities(report, use_claude=use_claude)
-            total_players += len(player_ids)
-            linked += 1
-        except Exception as e:
-            logger.error(f"Error linking report {report['id']}: {e}")
-            errors += 1
+    await asyncio.gather(*(_link_chunk(chunk) for chunk in chunks))
 
     return {
         "reports_processed": len(reports),
@@ -1,97 +1,201 @@
 # src/processing/grading.py
 """Player grading and timeline update pipeline."""
 
+import json
 import logging
-from datetime import date
+from datetime import UTC, date, datetime
 
 from ..storage.db import (
     get_connection,
-    insert_timeline_snapshot,
+    get_grading_fingerprints,
+    get_read_connection,
 )
 from .aggregation import aggregate_player_profile
 
 logger = logging.getLogger(__name__)
 
+# Players with reports but no grade, or stale grades, in keyset order. The
+# containment test lets the EXISTS probe use the GIN index on player_ids.
+_PLAYERS_NEEDING_UPDATE_TEMPLATE = """
+    SELECT p.id, p.name, p.team, p.class_year, p.last_updated
+    FROM scouting.players p
+    WHERE (p.composite_grade IS NULL
+           OR p.last_updated < NOW() - INTERVAL '7 days')
+    AND EXISTS (
+        SELECT 1 FROM scouting.reports r
+        WHERE r.player_ids @> ARRAY[p.id::bigint]
+    )
+    {keyset}
+    ORDER BY p.last_updated, p.id
+    LIMIT %s
+"""
+_PLAYERS_NEEDING_UPDATE_SQL = _PLAYERS_NEEDING_UPDATE_TEMPLATE.format(keyset="")
+# Later pages stop at the run's start: grading rewrites last_updated, so the
+# players a run has already handled would otherwise sort back in at the end
+_PLAYERS_NEEDING_UPDATE_AFTER_SQL = _PLAYERS_NEEDING_UPDATE_TEMPLATE.format(
+    keyset="AND (p.last_updated, p.id) > (%s, %s) AND p.last_updated < %s"
+)
 
-async def get_players_needing_update(limit: int = 50) -> list[dict]:
-    """Get players who haven't been graded recently."""
-    async with get_connection() as conn:
-        cur = conn.cursor()
 
-        # Players with reports but no grade, or stale grades
-        await cur.execute(
-            """
-            SELECT DISTINCT p.id, p.name, p.team, p.class_year
-            FROM scouting.players p
-            JOIN scouting.reports r ON p.id = ANY(r.player_ids)
-            WHERE p.composite_grade IS NULL
-               OR p.last_updated < NOW() - INTERVAL '7 days'
-            ORDER BY p.last_updated ASC NULLS FIRST
-            LIMIT %s
-            """,
-            (limit,),
-        )
+async def get_players_needing_update(
+    limit: int = 50,
+    after: tuple[datetime, int] | None = None,
+    started_at: datetime | None = None,
+) -> list[dict]:
+    """Get players who haven't been graded recently, stalest first.
+
+    Args:
+        limit: Maximum players to return
+        after: Keyset cursor, the (last_updated, id) of the last player from
+            the previous page
+        started_at: When the paging run started (default: now); pages after
+            the first skip players last updated since then
+
+    Returns:
+        Player dicts with id, name, team, class_year, last_updated
+    """
+    if after is None:
+        sql, params = _PLAYERS_NEEDING_UPDATE_SQL, (limit,)
+    else:
+        sql = _PLAYERS_NEEDING_UPDATE_AFTER_SQL
+        params = (*after, started_at or datetime.now(UTC), limit)
+
+    async with get_read_connection() as conn:
+        cur = conn.cursor()
+        await cur.execute(sql, params)
         columns = [desc[0] for desc in cur.description]
         return [dict(zip(columns, row)) for row in await cur.fetchall()]
 
 
-async def update_player_grade(player_id: int) -> dict:
-    """Aggregate reports, update grade, and create timeline snapshot."""
-    async with get_connection() as conn:
-        # Get aggregated data
-        agg = await aggregate_player_profile(player_id)
+async def update_player_grade(
+    player_id: int,
+    force: bool = False,
+    today: date | None = None,
+) -> dict | None:
+    """Aggregate reports, update grade, and create timeline snapshot.
+
+    Players whose linked reports are unchanged since their last grade are
+    skipped (only last_updated is touched) unless force is set. today is the
+    snapshot date; batch callers pass it once instead of per player.
+
+    Returns:
+        The aggregation dict, or None if the player was skipped.
+    """
+    async with get_read_connection() as conn:
+        fingerprint, graded_fingerprint = await get_grading_fingerprints(conn, player_id)
+
+    if not force and fingerprint is not None and fingerprint == graded_fingerprint:
+        async with get_connection() as conn:
+            # Move the player to the back of the staleness queue
+            cur = conn.cursor()
+            await cur.execute(
+                "UPDATE scouting.players SET last_updated = NOW() WHERE id = %s",
+                (player_id,),
+            )
+            await conn.commit()
+        return None
+
+    # Aggregation reads reports on the read pool and calls Claude, so do it
+    # before taking a write connection
+    agg = await aggregate_player_profile(player_id)
 
-        # Update player record
+    async with get_connection() as conn:
+        # Update the player, snapshot the timeline, and record the graded
+        # fingerprint in one statement and one commit
         cur = conn.cursor()
         await cur.execute(
             """
-            UPDATE scouting.players
-            SET composite_grade = %s,
-                traits = %s,
-                last_updated = NOW()
-            WHERE id = %s
-            """,
-            (
-                agg["composite_grade"],
-                agg["traits"] if agg["traits"] else None,
-                player_id,
+            WITH upd AS (
+                UPDATE scouting.players
+                SET composite_grade = %(grade)s,
+                    traits = %(traits)s,
+                    last_updated = NOW()
+                WHERE id = %(player_id)s
+                RETURNING id
             ),
+            snap AS (
+                INSERT INTO scouting.player_timeline
+                    (player_id, snapshot_date, sentiment_score, grade_at_time,
+                     traits_at_time, sources_count)
+                SELECT id, %(snapshot_date)s, %(sentiment)s, %(grade)s,
+                       %(traits)s, %(sources_count)s
+                FROM upd
+                -- Regrading on the same day replaces that day's snapshot
+                ON CONFLICT (player_id, snapshot_date) DO UPDATE SET
+                    sentiment_score = EXCLUDED.sentiment_score,
+                    grade_at_time = EXCLUDED.grade_at_time,
+                    traits_at_time = EXCLUDED.traits_at_time,
+                    sources_count = EXCLUDED.sources_count
+                RETURNING player_id
+            )
+            INSERT INTO scouting.player_grading_state (player_id, reports_fingerprint)
+            SELECT player_id, %(fingerprint)s::text
+            FROM snap
+            WHERE %(fingerprint)s::text IS NOT NULL
+            ON CONFLICT (player_id) DO UPDATE SET
+                reports_fingerprint = EXCLUDED.reports_fingerprint,
+                graded_at = NOW()
+            """,
+            {
+                "player_id": player_id,
+                "grade": agg["composite_grade"],
+                "traits": json.dumps(agg["traits"]) if agg["traits"] else None,
+                "snapshot_date": today or date.today(),
+                "sentiment": agg["sentiment_score"],
+                "sources_count": agg["report_count"] or 0,
+                "fingerprint": fingerprint,
+            },
         )
         await conn.commit()
 
-        # Create timeline snapshot
-        await insert_timeline_snapshot(
-            conn,
-            player_id=player_id,
-            snapshot_date=date.today(),
-            sentiment_score=agg["sentiment_score"],
-            grade_at_time=agg["composite_grade"],
-            traits_at_time=agg["traits"],
-            sources_count=agg["report_count"],
-        )
-
-        return agg
+    return agg
 
 
-async def run_grading_pipeline(batch_size: int = 50) -> dict:
-    """Run grading pipeline on players needing updates."""
-    players = await get_players_needing_update(batch_size)
-    logger.info(f"Found {len(players)} players needing grade updates")
+async def run_grading_pipeline(batch_size: int = 50, max_batches: int = 1) -> dict:
+    """Run grading pipeline on players needing updates.
 
+    Pages through the staleness queue with a keyset cursor, so players that
+    fail to grade in one batch are not fetched again by the next. Players
+    this run grades or skips get a fresh last_updated and are not fetched
+    again at the end of the scan either.
+    """
+    found = 0
     updated = 0
+    skipped = 0
     errors = 0
+    cursor = None
+    today = date.today()
+    started_at = datetime.now(UTC)
 
-    for player in players:
-        try:
-            result = await update_player_grade(player["id"])
-            logger.debug(f"Updated {player['name']}: grade={result['composite_grade']}")
-            updated += 1
-        except Exception as e:
-            logger.error(f"Error grading {player['name']}: {e}")
-            errors += 1
+    for _ in range(max_batches):
+        players = await get_players_needing_update(
+            batch_size, after=cursor, started_at=started_at
+        )
+        logger.info(f"Found {len(players)} players needing grade updates")
+        if not players:
+            break
+        found += len(players)
+
+        for player in players:
+            try:
+                result = await update_player_grade(player["id"], today=today)
+                if result is None:
+                    logger.debug(f"Skipped {player['name']}: reports unchanged")
+                    skipped += 1
+                    continue
+                logger.debug(f"Updated {player['name']}: grade={result['composite_grade']}")
+                updated += 1
+            except Exception as e:
+                logger.error(f"Error grading {player['name']}: {e}")
+                errors += 1
+
+        if len(players) < batch_size:
+            break
+        cursor = (players[-1]["last_updated"], players[-1]["id"])
 
     return {
-        "players_found": len(players),
+        "players_found": found,
         "players_updated": updated,
+        "players_skipped": skipped,
         "errors": errors,
     }
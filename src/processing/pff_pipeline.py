@@ -1,75 +1,106 @@
 """PFF grade pipeline - fetch and store PFF grades for scouting players."""
 
+import asyncio
 import logging
 import os
 
 from ..clients.pff import PFFClient
-from ..storage.db import get_connection, upsert_pff_grade
+from ..storage.db import (
+    get_connection,
+    record_pff_not_found_bulk,
+    upsert_pff_grades_bulk,
+)
 
 logger = logging.getLogger(__name__)
 
+# PFF lookups in flight at once
+PFF_CONCURRENCY = 5
 
-async def fetch_and_store_pff_grade(
-    client: PFFClient,
-    conn,
-    player: dict,
-) -> bool | None:
-    """Fetch a PFF grade for a single player and store it.
+# Request start rate against the PFF API, independent of concurrency
+PFF_REQUESTS_PER_SECOND = 5.0
+
+# Players looked up before their results are written in one batch
+PFF_FLUSH_SIZE = 100
+
+# Players without a recent PFF grade or a recent known miss
+_PLAYERS_NEEDING_PFF_SQL = """
+    SELECT p.id, p.name, p.team, p.position
+    FROM scouting.players p
+    WHERE NOT EXISTS (
+        SELECT 1 FROM scouting.pff_grades g
+        WHERE g.player_id = p.id
+          AND g.fetched_at > NOW() - INTERVAL '30 days'
+    )
+    AND NOT EXISTS (
+        SELECT 1 FROM scouting.pff_not_found n
+        WHERE n.player_id = p.id
+          AND n.checked_at > NOW() - INTERVAL '30 days'
+    )
+    ORDER BY p.last_updated DESC
+    LIMIT %s
+"""
+
+
+class _RateLimiter:
+    """Async context manager spacing request starts at a fixed rate."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def __aexit__(self, *args):
+        return False
+
+
+async def fetch_pff_grade(client: PFFClient, player: dict) -> dict | None:
+    """Look up a PFF grade for a single player without storing it.
 
     Args:
         client: Initialized PFF API client.
-        conn: Async database connection.
         player: Dict with keys id, name, team, position.
 
     Returns:
-        True if a grade was stored, False if not found, None on error.
+        Keyword arguments for upsert_pff_grade (one row of
+        upsert_pff_grades_bulk), or None if not found.
     """
-    player_id = player["id"]
     name = player["name"]
     team = player.get("team")
 
-    try:
-        pff_grade = await client.get_player_by_name(name, team=team)
-        if pff_grade is None:
-            logger.debug("No PFF grade found for %s (%s)", name, team)
-            return False
-
-        position_grades = {
-            k: getattr(pff_grade, k)
-            for k in (
-                "passing_grade",
-                "rushing_grade",
-                "receiving_grade",
-                "blocking_grade",
-                "defense_grade",
-                "coverage_grade",
-                "pass_rush_grade",
-                "run_defense_grade",
-            )
-            if getattr(pff_grade, k) is not None
-        }
-
-        await upsert_pff_grade(
-            conn,
-            player_id=player_id,
-            pff_player_id=pff_grade.player_id,
-            season=pff_grade.season,
-            overall_grade=pff_grade.overall_grade,
-            position_grades=position_grades or None,
-            snaps=pff_grade.snaps,
-        )
-        logger.info(
-            "Stored PFF grade for %s (overall=%.1f, snaps=%d)",
-            name,
-            pff_grade.overall_grade,
-            pff_grade.snaps,
-        )
-        return True
-
-    except Exception:
-        logger.exception("Error fetching PFF grade for %s", name)
+    pff_grade = await client.get_player_by_name(name, team=team)
+    if pff_grade is None:
+        logger.debug("No PFF grade found for %s (%s)", name, team)
         return None
 
+    position_grades = {
+        "passing_grade": pff_grade.passing_grade,
+        "rushing_grade": pff_grade.rushing_grade,
+        "receiving_grade": pff_grade.receiving_grade,
+        "blocking_grade": pff_grade.blocking_grade,
+        "defense_grade": pff_grade.defense_grade,
+        "coverage_grade": pff_grade.coverage_grade,
+        "pass_rush_grade": pff_grade.pass_rush_grade,
+        "run_defense_grade": pff_grade.run_defense_grade,
+    }
+    position_grades = {key: value for key, value in position_grades.items() if value is not None}
+
+    return {
+        "player_id": player["id"],
+        "pff_player_id": pff_grade.player_id,
+        "season": pff_grade.season,
+        "overall_grade": pff_grade.overall_grade,
+        "position_grades": position_grades or None,
+        "snaps": pff_grade.snaps,
+    }
+
 
 async def run_pff_pipeline(batch_size: int = 50) -> dict:
     """Fetch and store PFF grades for players missing recent data.
@@ -89,20 +120,7 @@ async def run_pff_pipeline(batch_size: int = 50) -> dict:
 
     async with get_connection() as conn:
         cur = conn.cursor()
-        await cur.execute(
-            """
-            SELECT p.id, p.name, p.team, p.position
-            FROM scouting.players p
-            WHERE NOT EXISTS (
-                SELECT 1 FROM scouting.pff_grades g
-                WHERE g.player_id = p.id
-                  AND g.fetched_at > NOW() - INTERVAL '30 days'
-            )
-            ORDER BY p.last_updated DESC
-            LIMIT %s
-            """,
-            (batch_size,),
-        )
+        await cur.execute(_PLAYERS_NEEDING_PFF_SQL, (batch_size,))
         columns = [desc[0] for desc in cur.description]
         rows = await cur.fetchall()
         players = [dict(zip(columns, row)) for row in rows]
@@ -113,15 +131,44 @@ async def run_pff_pipeline(batch_size: int = 50) -> dict:
 
     logger.info("Fetching PFF grades for %d players", len(players))
 
+    sem = asyncio.Semaphore(PFF_CONCURRENCY)
+    limiter = _RateLimiter(PFF_REQUESTS_PER_SECOND)
+
     async with PFFClient(api_key=api_key) as client:
-        async with get_connection() as conn:
-            for player in players:
+        # One shared client (keep-alive); lookups need no connection, results
+        # are written once per chunk
+        async def _fetch_one(player: dict) -> dict | None:
+            async with sem, limiter:
+                return await fetch_pff_grade(client, player)
+
+        for start in range(0, len(players), PFF_FLUSH_SIZE):
+            chunk = players[start : start + PFF_FLUSH_SIZE]
+            results = await asyncio.gather(
+                *(_fetch_one(player) for player in chunk),
+                return_exceptions=True,
+            )
+
+            grades = []
+            not_found = []
+            for player, result in zip(chunk, results):
                 stats["players_checked"] += 1
-                result = await fetch_and_store_pff_grade(client, conn, player)
-                if result is True:
-                    stats["grades_stored"] += 1
-                elif result is None:
+                if isinstance(result, Exception):
+                    logger.error("Error fetching PFF grade for %s: %s", player["name"], result)
                     stats["errors"] += 1
+                elif result is None:
+                    not_found.append(player["id"])
+                else:
+                    grades.append(result)
+
+            try:
+                async with get_connection() as conn:
+                    await upsert_pff_grades_bulk(conn, grades)
+                    await record_pff_not_found_bulk(conn, not_found)
+            except Exception:
+                logger.exception("Error storing %d PFF grades", len(grades))
+                stats["errors"] += len(grades)
+            else:
+                stats["grades_stored"] += len(grades)
 
     logger.info(
         "PFF pipeline complete: checked=%d, stored=%d, errors=%d",
@@ -1,54 +1,167 @@
 """Processing pipeline to summarize crawled reports."""
 
+import asyncio
 import logging
 from datetime import datetime
 
-from ..storage.db import get_connection, get_unprocessed_reports, mark_report_processed
-from .summarizer import summarize_report
+from ..storage.db import (
+    complete_summary_batch,
+    get_connection,
+    get_open_summary_batch,
+    get_read_connection,
+    get_unprocessed_reports,
+    insert_summary_batch,
+    mark_report_processed,
+)
+from .summarizer import collect_summary_batch, submit_summary_batch, summarize_report
 
 logger = logging.getLogger(__name__)
 
+# Reports summarized concurrently per round of Claude calls
+SUMMARY_CONCURRENCY = 8
 
-async def process_reports(batch_size: int = 50) -> dict:
+
+async def process_reports(batch_size: int = 50, use_batch_api: bool = False) -> dict:
     """Process unprocessed reports through Claude summarization.
 
     Args:
         batch_size: Number of reports to process in this run.
+        use_batch_api: Summarize through the Message Batches API (half the
+            cost, not realtime) instead of concurrent realtime calls.
 
     Returns:
         Dict with processing stats.
     """
+    if use_batch_api:
+        return await _process_reports_batch(batch_size)
+
+    reports = await _fetch_unprocessed_reports(batch_size)
+
+    processed = 0
+    errors = 0
+    for start in range(0, len(reports), SUMMARY_CONCURRENCY):
+        window = reports[start : start + SUMMARY_CONCURRENCY]
+
+        # Claude calls for the window run concurrently with no connection held
+        results = await asyncio.gather(
+            *(
+                summarize_report(text=report["raw_text"], team_context=report["team_ids"])
+                for report in window
+            ),
+            return_exceptions=True,
+        )
+
+        # Writes stay sequential since they share one connection
+        async with get_connection() as conn:
+            for report, result in zip(window, results):
+                try:
+                    if isinstance(result, BaseException):
+                        raise result
+
+                    await mark_report_processed(
+                        conn,
+                        report_id=report["id"],
+                        summary=result["summary"],
+                        sentiment_score=result["sentiment_score"],
+                    )
+
+                    processed += 1
+                    logger.debug(f"Processed report {report['id']}")
+
+                except Exception as e:
+                    errors += 1
+                    logger.error(f"Error processing report {report['id']}: {e}")
+
+    logger.info(f"Processed {processed} of {len(reports)} unprocessed reports")
+
+    return {
+        "total": len(reports),
+        "processed": processed,
+        "errors": errors,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+async def _fetch_unprocessed_reports(batch_size: int) -> list[dict]:
+    """Read up to batch_size unprocessed reports and release the connection.
+
+    No read transaction stays open while the reports are summarized.
+    """
+    async with get_read_connection() as read_conn:
+        return await get_unprocessed_reports(read_conn, limit=batch_size)
+
+
+async def _process_reports_batch(batch_size: int) -> dict:
+    """process_reports() through one Message Batches submission.
+
+    A batch left open by an earlier run (crashed, or gave up waiting) is
+    collected first instead of submitting its reports again. The batch id is
+    recorded before waiting, so a run that gives up leaves it for the next.
+    """
     async with get_connection() as conn:
-        reports = await get_unprocessed_reports(conn, limit=batch_size)
-        logger.info(f"Found {len(reports)} unprocessed reports")
+        open_batch = await get_open_summary_batch(conn)
+
+    if open_batch is not None:
+        batch_id, report_ids = open_batch["batch_id"], open_batch["report_ids"]
+        logger.info(f"Resuming summary batch {batch_id} with {len(report_ids)} requests")
+    else:
+        reports = await _fetch_unprocessed_reports(batch_size)
+        report_ids = [report["id"] for report in reports]
+        if not reports:
+            return {
+                "total": 0,
+                "processed": 0,
+                "errors": 0,
+                "timestamp": datetime.now().isoformat(),
+            }
 
-        processed = 0
-        errors = 0
+        batch_id = await submit_summary_batch(
+            [report["raw_text"] for report in reports],
+            [report["team_ids"] for report in reports],
+        )
+        async with get_connection() as conn:
+            await insert_summary_batch(conn, batch_id, report_ids)
+
+    try:
+        results = await collect_summary_batch(batch_id, len(report_ids))
+    except TimeoutError as e:
+        logger.warning(f"{e}; leaving it for the next run")
+        return {
+            "total": len(report_ids),
+            "processed": 0,
+            "errors": 0,
+            "timestamp": datetime.now().isoformat(),
+        }
 
-        for report in reports:
+    processed = 0
+    errors = 0
+    async with get_connection() as conn:
+        for report_id, result in zip(report_ids, results, strict=True):
             try:
-                result = await summarize_report(
-                    text=report["raw_text"],
-                    team_context=report["team_ids"],
-                )
+                if result is None:
+                    raise RuntimeError("batch request did not succeed")
 
                 await mark_report_processed(
                     conn,
-                    report_id=report["id"],
+                    report_id=report_id,
                     summary=result["summary"],
                     sentiment_score=result["sentiment_score"],
                 )
 
                 processed += 1
-                logger.debug(f"Processed report {report['id']}")
+                logger.debug(f"Processed report {report_id}")
 
             except Exception as e:
                 errors += 1
-                logger.error(f"Error processing report {report['id']}: {e}")
+                logger.error(f"Error processing report {report_id}: {e}")
 
-        return {
-            "total": len(reports),
-            "processed": processed,
-            "errors": errors,
-            "timestamp": datetime.now().isoformat(),
-        }
+        await complete_summary_batch(conn, batch_id)
+
+    logger.info(f"Processed {processed} of {len(report_ids)} unprocessed reports via batch")
+
+    return {
+        "total": len(report_ids),
+        "processed": processed,
+        "errors": errors,
+        "timestamp": datetime.now().isoformat(),
+    }
@@ -1,25 +1,51 @@
 """Player matching against roster and recruit data."""
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from typing import Literal
 
-from rapidfuzz import fuzz
+import numpy as np
+from psycopg import errors as pg_errors
+from rapidfuzz import fuzz, process
 
-from ..storage.db import find_similar_by_embedding, get_connection, insert_pending_link
-from .embeddings import build_identity_text, generate_embedding
+from ..storage.db import (
+    find_similar_roster_by_embedding,
+    find_similar_roster_by_embeddings,
+    get_connection,
+    get_read_connection,
+    insert_pending_link,
+)
+from .embeddings import build_identity_text, generate_cached_embeddings, generate_embedding
 
 logger = logging.getLogger(__name__)
 
 # Minimum score to consider a match
 MATCH_THRESHOLD = 80
 
+# Trigram-ranked candidates rescored with rapidfuzz per fuzzy lookup
+FUZZY_CANDIDATE_LIMIT = 5
+
+# Score matrices at least this large (names x choices) are spread across all
+# cores; below it, thread start-up costs more than it saves
+FUZZY_PARALLEL_MIN_PAIRS = 50_000
+
+# How long a query that matched nothing is answered from memory, and how
+# many such queries are remembered
+NO_MATCH_CACHE_TTL_SECONDS = 3600
+NO_MATCH_CACHE_SIZE = 50_000
+
 # Vector match thresholds
 VECTOR_MATCH_HIGH_CONFIDENCE = 0.92  # Accept automatically
 VECTOR_MATCH_LOW_CONFIDENCE = 0.80  # Send to review queue
 
 
-@dataclass
+# (name, team, position, year, athlete_id) -> time.monotonic() of the miss
+_no_match_cache: dict[tuple, float] = {}
+
+
+@dataclass(slots=True)
 class PlayerMatch:
     """A matched player from roster or recruit data."""
 
@@ -47,6 +73,98 @@ def fuzzy_match_name(name1: str, name2: str) -> float:
     return fuzz.token_sort_ratio(n1, n2)
 
 
+def _normalize_for_fuzzy(name: str) -> str:
+    return name.lower().strip()
+
+
+def best_fuzzy_match(name: str, choices: list[str]) -> tuple[int, float] | None:
+    """Best fuzzy_match_name() score of name against many choices.
+
+    Scores the whole candidate list in one rapidfuzz call instead of a Python
+    loop. score_cutoff lets rapidfuzz reject most candidates on length alone
+    before computing a full ratio.
+
+    Returns:
+        (index into choices, score) of the first best choice at or above
+        MATCH_THRESHOLD, else None.
+    """
+    result = process.extractOne(
+        name,
+        choices,
+        scorer=fuzz.token_sort_ratio,
+        processor=_normalize_for_fuzzy,
+        score_cutoff=MATCH_THRESHOLD,
+    )
+    if result is None:
+        return None
+    _, score, index = result
+    return index, score
+
+
+def best_fuzzy_matches(names: list[str], choices: list[str]) -> list[tuple[int, float] | None]:
+    """best_fuzzy_match() for many names against the same choices.
+
+    Scores every name against every choice in one rapidfuzz cdist call
+    (a names x choices matrix computed in C, across all cores once it has
+    FUZZY_PARALLEL_MIN_PAIRS entries). Each winner is rescored with
+    fuzzy_match_name so confidences match best_fuzzy_match exactly.
+
+    Returns:
+        Per name, (index into choices, score) of the first best choice at or
+        above MATCH_THRESHOLD, else None.
+    """
+    if not names or not choices:
+        return [None] * len(names)
+
+    scores = process.cdist(
+        names,
+        choices,
+        scorer=fuzz.token_sort_ratio,
+        processor=_normalize_for_fuzzy,
+        score_cutoff=MATCH_THRESHOLD,
+        workers=-1 if len(names) * len(choices) >= FUZZY_PARALLEL_MIN_PAIRS else 1,
+    )
+    best = np.argmax(scores, axis=1)
+
+    results = []
+    for name, index, row in zip(names, best, scores):
+        if row[index] < MATCH_THRESHOLD:
+            results.append(None)
+        else:
+            results.append((int(index), fuzzy_match_name(name, choices[index])))
+    return results
+
+
+async def _fetch_name_candidates(
+    conn,
+    query: str,
+    params: list,
+    name_expr: str,
+    name: str,
+) -> list[tuple]:
+    """Rows of query whose name_expr is trigram-similar to name, most similar first.
+
+    The pg_trgm % operator uses the trigram indexes from migration 014, so
+    only FUZZY_CANDIDATE_LIMIT rows come back. Falls back to every row of
+    query when pg_trgm is not installed.
+    """
+    cur = conn.cursor()
+    try:
+        await cur.execute(
+            f"""{query}
+            AND {name_expr} %% LOWER(%s)
+            ORDER BY similarity({name_expr}, LOWER(%s)) DESC
+            LIMIT %s
+            """,
+            [*params, name, name, FUZZY_CANDIDATE_LIMIT],
+        )
+    except pg_errors.UndefinedFunction:
+        # pg_trgm (migration 014) not applied yet; score every row in Python
+        await conn.rollback()
+        await cur.execute(query, params)
+    return await cur.fetchall()
+
+
 async def find_deterministic_match(
     name: str,
     team: str,
@@ -56,7 +174,7 @@ async def find_deterministic_match(
 
     Returns 100% confidence match or None.
     """
-    async with get_connection() as conn:
+    async with get_read_connection() as conn:
         cur = conn.cursor()
 
         # Exact match on name (first + last) + team + year
@@ -90,6 +208,60 @@ async def find_deterministic_match(
         return None
 
 
+async def find_deterministic_matches(
+    mentions: list[tuple[str, str]],
+    year: int = 2025,
+) -> dict[tuple[str, str], PlayerMatch]:
+    """Tier 1 for many mentions at once: exact name + team + year match.
+
+    Resolves all (name, team) pairs with a single roster query instead of
+    one find_deterministic_match() call per mention.
+
+    Args:
+        mentions: (name, team) pairs to look up
+        year: Roster year
+
+    Returns:
+        Map of (name.lower(), team.lower()) -> 100% confidence PlayerMatch,
+        for the pairs that matched.
+    """
+    keys = {(name.lower(), team.lower()) for name, team in mentions}
+    if not keys:
+        return {}
+    names, teams = zip(*keys)
+
+    async with get_read_connection() as conn:
+        cur = conn.cursor()
+        await cur.execute(
+            """
+            SELECT DISTINCT ON (LOWER(first_name || ' ' || last_name), LOWER(team))
+                   id, first_name, last_name, team, position, year
+            FROM core.roster
+            WHERE (LOWER(first_name || ' ' || last_name), LOWER(team)) IN (
+                SELECT n, t FROM unnest(%s::text[], %s::text[]) AS m(n, t)
+            )
+            AND year = %s
+            """,
+            (list(names), list(teams), year),
+        )
+        rows = await cur.fetchall()
+
+    matches = {}
+    for player_id, first, last, player_team, player_pos, player_year in rows:
+        matches[(f"{first} {last}".lower(), player_team.lower())] = PlayerMatch(
+            source="roster",
+            source_id=str(player_id),
+            first_name=first,
+            last_name=last,
+            team=player_team,
+            position=player_pos,
+            year=player_year,
+            confidence=100.0,
+            match_method="deterministic",
+        )
+    return matches
+
+
 async def find_deterministic_match_by_athlete_id(
     athlete_id: str,
 ) -> PlayerMatch | None:
@@ -97,7 +269,7 @@ async def find_deterministic_match_by_athlete_id(
 
     Returns 100% confidence match or None.
     """
-    async with get_connection() as conn:
+    async with get_read_connection() as conn:
         cur = conn.cursor()
 
         await cur.execute(
@@ -129,6 +301,158 @@ async def find_deterministic_match_by_athlete_id(
         return None
 
 
+async def find_deterministic_match_unified(
+    name: str,
+    team: str | None = None,
+    year: int = 2025,
+    athlete_id: str | None = None,
+) -> PlayerMatch | None:
+    """Tier 1 in one query: athlete_id link, else exact name + team + year.
+
+    Same result as find_deterministic_match_by_athlete_id() followed by
+    find_deterministic_match(), in a single round trip. A branch whose key
+    is None matches nothing.
+
+    Returns 100% confidence match or None.
+    """
+    async with get_read_connection() as conn:
+        cur = conn.cursor()
+
+        await cur.execute(
+            """
+            SELECT id, first_name, last_name, team, position, year
+            FROM (
+                (SELECT 0 AS priority, r.id, r.first_name, r.last_name,
+                        r.team, r.position, r.year
+                 FROM core.roster r
+                 JOIN recruiting.recruits rec ON rec.athlete_id = r.id
+                 WHERE rec.athlete_id = %(athlete_id)s
+                 LIMIT 1)
+                UNION ALL
+                (SELECT 1 AS priority, id, first_name, last_name, team, position, year
+                 FROM core.roster
+                 WHERE LOWER(first_name || ' ' || last_name) = LOWER(%(name)s)
+                 AND LOWER(team) = LOWER(%(team)s)
+                 AND year = %(year)s
+                 LIMIT 1)
+            ) m
+            ORDER BY priority
+            LIMIT 1
+            """,
+            {"athlete_id": athlete_id, "name": name, "team": team, "year": year},
+        )
+        row = await cur.fetchone()
+
+    if row:
+        player_id, first, last, player_team, player_pos, player_year = row
+        return PlayerMatch(
+            source="roster",
+            source_id=str(player_id),
+            first_name=first,
+            last_name=last,
+            team=player_team,
+            position=player_pos,
+            year=player_year,
+            confidence=100.0,
+            match_method="deterministic",
+        )
+
+    return None
+
+
+async def has_similar_roster_name(name: str, team: str, year: int = 2025) -> bool:
+    """Whether any roster player on team is trigram-similar to name.
+
+    A cheap indexed probe (migration 014) used to skip the vector tier for
+    names that resemble no one on the team. Returns True when pg_trgm is not
+    installed, so nothing is skipped.
+    """
+    async with get_read_connection() as conn:
+        cur = conn.cursor()
+        try:
+            await cur.execute(
+                """
+                SELECT EXISTS (
+                    SELECT 1 FROM core.roster
+                    WHERE year = %s
+                    AND LOWER(team) = LOWER(%s)
+                    AND LOWER(first_name || ' ' || last_name) %% LOWER(%s)
+                )
+                """,
+                (year, team, name),
+            )
+        except pg_errors.UndefinedFunction:
+            # Don't hand an aborted transaction back to the pool
+            await conn.rollback()
+            return True
+        row = await cur.fetchone()
+    return bool(row[0])
+
+
+async def has_similar_roster_names(
+    queries: list[tuple[str, str]],
+    year: int = 2025,
+) -> list[bool]:
+    """has_similar_roster_name() for many (name, team) pairs in one query.
+
+    Returns:
+        One bool per query, in the same order as queries. All True when
+        pg_trgm is not installed.
+    """
+    if not queries:
+        return []
+
+    async with get_read_connection() as conn:
+        cur = conn.cursor()
+        try:
+            await cur.execute(
+                """
+                SELECT EXISTS (
+                    SELECT 1 FROM core.roster
+                    WHERE year = %s
+                    AND LOWER(team) = LOWER(q.team)
+                    AND LOWER(first_name || ' ' || last_name) %% LOWER(q.name)
+                )
+                FROM unnest(%s::text[], %s::text[]) WITH ORDINALITY AS q(name, team, idx)
+                ORDER BY q.idx
+                """,
+                (year, [name for name, _ in queries], [team for _, team in queries]),
+            )
+        except pg_errors.UndefinedFunction:
+            await conn.rollback()
+            return [True] * len(queries)
+        rows = await cur.fetchall()
+    return [bool(row[0]) for row in rows]
+
+
+def _accept_vector_candidate(similar: list[dict], team: str | None) -> PlayerMatch | None:
+    """Pick the first high-confidence, same-team candidate with a roster row."""
+    team = team.lower() if team else None
+    for candidate in similar:
+        # Only accept high-confidence matches with a roster row
+        if candidate["similarity"] < VECTOR_MATCH_HIGH_CONFIDENCE or candidate["id"] is None:
+            continue
+
+        # Require team match for acceptance, against the joined roster row
+        # rather than the free-text identity_text
+        if team and candidate["team"] and team != candidate["team"].lower():
+            continue
+
+        return PlayerMatch(
+            source="roster",
+            source_id=str(candidate["id"]),
+            first_name=candidate["first_name"],
+            last_name=candidate["last_name"],
+            team=candidate["team"],
+            position=candidate["position"],
+            year=candidate["year"],
+            confidence=candidate["similarity"] * 100,
+            match_method="vector",
+        )
+
+    return None
+
+
 async def find_vector_match(
     name: str,
     team: str | None = None,
@@ -138,7 +462,9 @@ async def find_vector_match(
     """Tier 2: Vector similarity match using embeddings.
 
     Generates embedding for query, searches pgvector for similar players.
-    Only accepts matches with similarity >= 0.92 AND team match.
+    Only accepts matches with similarity >= 0.92 AND team match. Errors from
+    the embedding request propagate, so callers can tell a failed lookup
+    from a miss.
 
     Args:
         name: Player name to match
@@ -159,65 +485,55 @@ async def find_vector_match(
     identity_text = build_identity_text(query_player)
 
     # Generate embedding for query
-    try:
-        result = generate_embedding(identity_text)
-    except Exception:
-        # If embedding fails, fall through to fuzzy
-        return None
+    result = await generate_embedding(identity_text)
 
-    async with get_connection() as conn:
-        # Search for similar players
-        similar = await find_similar_by_embedding(
+    async with get_read_connection() as conn:
+        # Search for similar players, roster rows included
+        similar = await find_similar_roster_by_embedding(
             conn,
             embedding=result.embedding,
             limit=5,
         )
 
-        if not similar:
-            return None
-
-        # Find best match with team filter
-        for candidate in similar:
-            similarity = candidate["similarity"]
-
-            # Parse identity_text to get team: "Name | Position | Team | Year"
-            parts = candidate["identity_text"].split(" | ")
-            candidate_team = parts[2] if len(parts) >= 3 else None
-
-            # Require team match for acceptance
-            if team and candidate_team and team.lower() != candidate_team.lower():
-                continue
-
-            # Only accept high-confidence matches
-            if similarity >= VECTOR_MATCH_HIGH_CONFIDENCE:
-                # Fetch full player data from roster
-                roster_id = candidate["roster_id"]
-                cur = conn.cursor()
-                await cur.execute(
-                    """
-                    SELECT id, first_name, last_name, team, position, year
-                    FROM core.roster
-                    WHERE id = %s
-                    """,
-                    (roster_id,),
-                )
-                row = await cur.fetchone()
-
-                if row:
-                    player_id, first, last, player_team, player_pos, player_year = row
-                    return PlayerMatch(
-                        source="roster",
-                        source_id=str(player_id),
-                        first_name=first,
-                        last_name=last,
-                        team=player_team,
-                        position=player_pos,
-                        year=player_year,
-                        confidence=similarity * 100,
-                        match_method="vector",
-                    )
+    return _accept_vector_candidate(similar, team)
 
-        return None
+
+async def find_vector_matches(
+    queries: list[tuple[str, str | None, str | None]],
+    year: int = 2025,
+) -> list[PlayerMatch | None]:
+    """find_vector_match() for many (name, team, position) queries at once.
+
+    Query texts missing from the embedding cache are embedded in one API
+    request, and all of them are searched in one pgvector query. Errors from
+    the embedding request propagate.
+
+    Returns:
+        PlayerMatch or None per query, in the same order as queries.
+    """
+    if not queries:
+        return []
+
+    identity_texts = [
+        build_identity_text(
+            {"name": name, "team": team or "Unknown", "year": year, "position": position}
+        )
+        for name, team, position in queries
+    ]
+
+    results = await generate_cached_embeddings(identity_texts)
+
+    async with get_read_connection() as conn:
+        similar = await find_similar_roster_by_embeddings(
+            conn,
+            embeddings=[result.embedding for result in results],
+            limit=5,
+        )
+
+    return [
+        _accept_vector_candidate(candidates, team)
+        for (_, team, _), candidates in zip(queries, similar)
+    ]
 
 
 async def find_roster_match(
@@ -237,9 +553,7 @@ async def find_roster_match(
     Returns:
         PlayerMatch if found above threshold, else None.
     """
-    async with get_connection() as conn:
-        cur = conn.cursor()
-
+    async with get_read_connection() as conn:
         # Build query with optional filters
         query = """
             SELECT id, first_name, last_name, team, position, year
@@ -256,32 +570,155 @@ async def find_roster_match(
             query += " AND UPPER(position) = UPPER(%s)"
             params.append(position)
 
-        await cur.execute(query, params)
-        candidates = await cur.fetchall()
+        candidates = await _fetch_name_candidates(
+            conn, query, params, "LOWER(first_name || ' ' || last_name)", name
+        )
 
-        best_match = None
-        best_score = 0
+    # Score off the event loop: without pg_trgm a year's roster can be tens of
+    # thousands of rows
+    best = await asyncio.to_thread(
+        best_fuzzy_match, name, [f"{row[1]} {row[2]}" for row in candidates]
+    )
+    return _roster_player_match(candidates, best)
 
-        for row in candidates:
-            player_id, first, last, player_team, player_pos, player_year = row
-            full_name = f"{first} {last}"
-
-            score = fuzzy_match_name(name, full_name)
-
-            if score > best_score and score >= MATCH_THRESHOLD:
-                best_score = score
-                best_match = PlayerMatch(
-                    source="roster",
-                    source_id=str(player_id),
-                    first_name=first,
-                    last_name=last,
-                    team=player_team,
-                    position=player_pos,
-                    year=player_year,
-                    confidence=score,
-                )
 
-        return best_match
+async def find_roster_matches(
+    queries: list[tuple[str, str, str | None]],
+    year: int = 2024,
+) -> list[PlayerMatch | None]:
+    """find_roster_match() for many (name, team, position) queries at once.
+
+    Uses the same candidate policy as find_roster_match(): each query scores
+    only its FUZZY_CANDIDATE_LIMIT most trigram-similar roster rows that pass
+    the pg_trgm % threshold, fetched for every query in one LATERAL query.
+    Without pg_trgm, the rosters of every queried team are fetched in one
+    query and each (team, position) group of names is scored with a single
+    best_fuzzy_matches() call, as find_roster_match() scores every row.
+
+    Args:
+        queries: (name, team, position) triples; position may be None. Team
+            is required, use find_roster_match() for team-less lookups.
+        year: Roster year to search
+
+    Returns:
+        PlayerMatch or None per query, in the same order as queries.
+    """
+    if not queries:
+        return []
+
+    async with get_read_connection() as conn:
+        cur = conn.cursor()
+        try:
+            await cur.execute(
+                """
+                SELECT q.idx, r.id, r.first_name, r.last_name, r.team, r.position, r.year
+                FROM unnest(%s::text[], %s::text[], %s::text[])
+                    WITH ORDINALITY AS q(name, team, position, idx)
+                CROSS JOIN LATERAL (
+                    SELECT id, first_name, last_name, team, position, year,
+                        similarity(LOWER(first_name || ' ' || last_name), LOWER(q.name)) AS sim
+                    FROM core.roster
+                    WHERE year = %s
+                    AND LOWER(team) = LOWER(q.team)
+                    AND (q.position IS NULL OR UPPER(position) = UPPER(q.position))
+                    AND LOWER(first_name || ' ' || last_name) %% LOWER(q.name)
+                    ORDER BY sim DESC
+                    LIMIT %s
+                ) r
+                ORDER BY q.idx, r.sim DESC
+                """,
+                (
+                    [name for name, _, _ in queries],
+                    [team for _, team, _ in queries],
+                    [position or None for _, _, position in queries],
+                    year,
+                    FUZZY_CANDIDATE_LIMIT,
+                ),
+            )
+        except pg_errors.UndefinedFunction:
+            # pg_trgm (migration 014) not applied yet; score whole rosters
+            await conn.rollback()
+            return await _find_roster_matches_unfiltered(conn, queries, year)
+        rows = await cur.fetchall()
+
+    candidates: list[list[tuple]] = [[] for _ in queries]
+    for idx, *row in rows:
+        candidates[idx - 1].append(tuple(row))
+
+    def _score_queries() -> list[PlayerMatch | None]:
+        return [
+            _roster_player_match(rows, best_fuzzy_match(name, [f"{r[1]} {r[2]}" for r in rows]))
+            for (name, _, _), rows in zip(queries, candidates)
+        ]
+
+    return await asyncio.to_thread(_score_queries)
+
+
+async def _find_roster_matches_unfiltered(
+    conn,
+    queries: list[tuple[str, str, str | None]],
+    year: int,
+) -> list[PlayerMatch | None]:
+    """find_roster_matches() without pg_trgm: score each team's whole roster."""
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        SELECT id, first_name, last_name, team, position, year
+        FROM core.roster
+        WHERE year = %s
+        AND LOWER(team) = ANY(%s)
+        """,
+        (year, list({team.lower() for _, team, _ in queries})),
+    )
+    rows = await cur.fetchall()
+
+    rosters: dict[str, list[tuple]] = {}
+    for row in rows:
+        rosters.setdefault(row[3].lower(), []).append(row)
+
+    groups: dict[tuple[str, str | None], list[int]] = {}
+    for i, (_, team, position) in enumerate(queries):
+        groups.setdefault((team.lower(), position.upper() if position else None), []).append(i)
+
+    def _score_groups() -> list[PlayerMatch | None]:
+        matches: list[PlayerMatch | None] = [None] * len(queries)
+        for (team, position), indices in groups.items():
+            candidates = [
+                row
+                for row in rosters.get(team, [])
+                if position is None or (row[4] or "").upper() == position
+            ]
+            best = best_fuzzy_matches(
+                [queries[i][0] for i in indices],
+                [f"{row[1]} {row[2]}" for row in candidates],
+            )
+            for i, result in zip(indices, best):
+                matches[i] = _roster_player_match(candidates, result)
+        return matches
+
+    return await asyncio.to_thread(_score_groups)
+
+
+def _roster_player_match(
+    candidates: list[tuple],
+    best: tuple[int, float] | None,
+) -> PlayerMatch | None:
+    """PlayerMatch for the best-scoring core.roster candidate row, if any."""
+    if best is None:
+        return None
+
+    index, score = best
+    player_id, first, last, player_team, player_pos, player_year = candidates[index]
+    return PlayerMatch(
+        source="roster",
+        source_id=str(player_id),
+        first_name=first,
+        last_name=last,
+        team=player_team,
+        position=player_pos,
+        year=player_year,
+        confidence=score,
+    )
 
 
 async def find_recruit_match(
@@ -301,9 +738,7 @@ async def find_recruit_match(
     Returns:
         PlayerMatch if found above threshold, else None.
     """
-    async with get_connection() as conn:
-        cur = conn.cursor()
-
+    async with get_read_connection() as conn:
         query = """
             SELECT id, name, committed_to, position, recruiting_year
             FROM recruiting.recruits
@@ -323,36 +758,30 @@ async def find_recruit_match(
             query += " AND recruiting_year = %s"
             params.append(year)
 
-        await cur.execute(query, params)
-        candidates = await cur.fetchall()
-
-        best_match = None
-        best_score = 0
-
-        for row in candidates:
-            recruit_id, recruit_name, committed_to, recruit_pos, recruit_year = row
-
-            score = fuzzy_match_name(name, recruit_name)
-
-            if score > best_score and score >= MATCH_THRESHOLD:
-                best_score = score
-                # Split name for consistency
-                parts = recruit_name.split(maxsplit=1)
-                first = parts[0] if parts else ""
-                last = parts[1] if len(parts) > 1 else ""
-
-                best_match = PlayerMatch(
-                    source="recruit",
-                    source_id=str(recruit_id),
-                    first_name=first,
-                    last_name=last,
-                    team=committed_to or "",
-                    position=recruit_pos,
-                    year=recruit_year,
-                    confidence=score,
-                )
+        candidates = await _fetch_name_candidates(conn, query, params, "LOWER(name)", name)
+
+    best = await asyncio.to_thread(best_fuzzy_match, name, [row[1] for row in candidates])
+    if best is None:
+        return None
+
+    index, score = best
+    recruit_id, recruit_name, committed_to, recruit_pos, recruit_year = candidates[index]
 
-        return best_match
+    # Split name for consistency
+    parts = recruit_name.split(maxsplit=1)
+    first = parts[0] if parts else ""
+    last = parts[1] if len(parts) > 1 else ""
+
+    return PlayerMatch(
+        source="recruit",
+        source_id=str(recruit_id),
+        first_name=first,
+        last_name=last,
+        team=committed_to or "",
+        position=recruit_pos,
+        year=recruit_year,
+        confidence=score,
+    )
 
 
 async def find_best_match(
@@ -373,18 +802,18 @@ async def find_best_match(
     3. Fuzzy matching
     """
     # Tier 1: Deterministic
-    if athlete_id:
-        match = await find_deterministic_match_by_athlete_id(athlete_id)
-        if match:
-            return match
-
-    if team:
-        match = await find_deterministic_match(name, team, year)
+    if athlete_id or team:
+        match = await find_deterministic_match_unified(name, team, year, athlete_id)
         if match:
             return match
 
     # Tier 2: Vector
-    match = await find_vector_match(name, team=team, position=position, year=year)
+    try:
+        match = await find_vector_match(name, team=team, position=position, year=year)
+    except Exception as e:
+        # If embedding fails, fall through to fuzzy
+        logger.warning(f"Vector match failed for {name}: {e}")
+        match = None
     if match:
         return match
 
@@ -422,6 +851,9 @@ async def match_player_with_review(
     3. Fuzzy: rapidfuzz token_sort_ratio >= 80
 
     Matches with 0.80-0.92 confidence go to pending_links for review.
+    Queries that match nothing in every tier are remembered for
+    NO_MATCH_CACHE_TTL_SECONDS and answered without querying again; a query
+    whose vector tier failed is not.
 
     Args:
         name: Player name to match
@@ -434,25 +866,144 @@ async def match_player_with_review(
     Returns:
         Tuple of (PlayerMatch or None, pending_link_id or None)
     """
-    # Tier 1: Deterministic
-    if athlete_id:
-        match = await find_deterministic_match_by_athlete_id(athlete_id)
-        if match:
-            return (match, None)
+    # Recent full misses skip all three tiers
+    cache_key = _no_match_cache_key(name, team, position, year, athlete_id)
+    if _recently_missed(cache_key):
+        return (None, None)
 
-    if team:
-        match = await find_deterministic_match(name, team, year)
+    # Tier 1: Deterministic
+    if athlete_id or team:
+        match = await find_deterministic_match_unified(name, team, year, athlete_id)
         if match:
             return (match, None)
 
-    # Tier 2: Vector similarity
-    vector_match = await find_vector_match(name, team=team, position=position, year=year)
-    if vector_match:
-        return (vector_match, None)
+    # Tier 2: Vector similarity, skipped when no one on the team has a
+    # similar name (saves the embedding request for near-certain misses)
+    vector_failed = False
+    if not team or await has_similar_roster_name(name, team, year):
+        try:
+            vector_match = await find_vector_match(name, team=team, position=position, year=year)
+        except Exception as e:
+            # If embedding fails, fall through to fuzzy
+            logger.warning(f"Vector match failed for {name}: {e}")
+            vector_match = None
+            vector_failed = True
+        if vector_match:
+            return (vector_match, None)
 
     # Tier 3: Fuzzy matching (existing logic)
     fuzzy_match = await find_roster_match(name, team=team, position=position, year=year)
+    result = await _review_fuzzy_match(name, team, position, year, source_context, fuzzy_match)
+    if result is None:
+        # No match found; only cached when every tier actually ran
+        if not vector_failed:
+            _remember_miss(cache_key)
+        return (None, None)
+    return result
+
 
+async def match_players_with_review(
+    queries: list[tuple[str, str | None, str | None]],
+    year: int = 2025,
+    source_context: dict | None = None,
+) -> list[tuple[PlayerMatch | None, int | None]]:
+    """match_player_with_review() tiers 2 and 3 for many queries at once.
+
+    For mentions that already missed tier 1 (see find_deterministic_matches()).
+    Team mentions are first probed for trigram-similar roster names in one
+    query (has_similar_roster_names()); the rest are embedded in one request
+    and searched in one pgvector query, then the vector misses with a team
+    are fuzzy-scored against their team rosters in one query
+    (find_roster_matches()). Team-less roster lookups, the recruit fallback
+    and pending links still go one query at a time, for the mentions that
+    reach them.
+
+    Args:
+        queries: (name, team, position) triples; team and position may be None
+        year: Roster year
+        source_context: Additional context for review queue
+
+    Returns:
+        (PlayerMatch or None, pending_link_id or None) per query, in the same
+        order as queries.
+    """
+    results: list[tuple[PlayerMatch | None, int | None]] = [(None, None)] * len(queries)
+    cache_keys = [
+        _no_match_cache_key(name, team, position, year) for name, team, position in queries
+    ]
+    todo = [i for i, key in enumerate(cache_keys) if not _recently_missed(key)]
+    if not todo:
+        return results
+
+    # Tier 2: Vector similarity, skipped for team mentions that resemble no
+    # one on the team (one batched trigram probe for all of them)
+    with_team = [i for i in todo if queries[i][1]]
+    similar = dict(
+        zip(
+            with_team,
+            await has_similar_roster_names(
+                [(queries[i][0], str(queries[i][1])) for i in with_team], year=year
+            ),
+        )
+    )
+    vector_todo = [i for i in todo if similar.get(i, True)]
+
+    vector_failed = False
+    try:
+        vector_matches = await find_vector_matches([queries[i] for i in vector_todo], year=year)
+    except Exception as e:
+        # If embedding fails, fall through to fuzzy
+        logger.warning(f"Vector match failed for {len(vector_todo)} mentions: {e}")
+        vector_matches = [None] * len(vector_todo)
+        vector_failed = True
+    for i, match in zip(vector_todo, vector_matches):
+        if match:
+            results[i] = (match, None)
+    todo = [i for i in todo if results[i][0] is None]
+
+    # Tier 3: Fuzzy matching, each team's roster fetched and scored once
+    with_team = [i for i in todo if queries[i][1]]
+    roster_matches = dict(
+        zip(
+            with_team,
+            await find_roster_matches(
+                [(queries[i][0], str(queries[i][1]), queries[i][2]) for i in with_team],
+                year=year,
+            ),
+        )
+    )
+
+    for i in todo:
+        name, team, position = queries[i]
+        if i in roster_matches:
+            fuzzy_match = roster_matches[i]
+        else:
+            fuzzy_match = await find_roster_match(name, position=position, year=year)
+
+        result = await _review_fuzzy_match(name, team, position, year, source_context, fuzzy_match)
+        if result is None:
+            # Only cached when every tier actually ran
+            if not vector_failed:
+                _remember_miss(cache_keys[i])
+        else:
+            results[i] = result
+
+    return results
+
+
+async def _review_fuzzy_match(
+    name: str,
+    team: str | None,
+    position: str | None,
+    year: int,
+    source_context: dict | None,
+    fuzzy_match: PlayerMatch | None,
+) -> tuple[PlayerMatch | None, int | None] | None:
+    """Tier 3 outcome for a roster fuzzy match, with the recruit fallback.
+
+    Returns:
+        (match, None), (None, pending_link_id), or None when nothing matched.
+    """
     # Check if we need to create a pending link
     if fuzzy_match:
         confidence_normalized = fuzzy_match.confidence / 100.0
@@ -482,5 +1033,38 @@ async def match_player_with_review(
         recruit_match.match_method = "fuzzy"
         return (recruit_match, None)
 
-    # No match found
-    return (None, None)
+    return None
+
+
+def _no_match_cache_key(
+    name: str,
+    team: str | None,
+    position: str | None,
+    year: int,
+    athlete_id: str | None = None,
+) -> tuple:
+    return (
+        name.lower().strip(),
+        str(team or "").lower(),
+        (position or "").upper(),
+        year,
+        athlete_id,
+    )
+
+
+def _recently_missed(cache_key: tuple) -> bool:
+    """Whether cache_key matched nothing within NO_MATCH_CACHE_TTL_SECONDS."""
+    missed_at = _no_match_cache.get(cache_key)
+    if missed_at is None:
+        return False
+    if time.monotonic() - missed_at < NO_MATCH_CACHE_TTL_SECONDS:
+        return True
+    del _no_match_cache[cache_key]
+    return False
+
+
+def _remember_miss(cache_key: tuple) -> None:
+    if len(_no_match_cache) >= NO_MATCH_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _no_match_cache[next(iter(_no_match_cache))]
+    _no_match_cache[cache_key] = time.monotonic()
@@ -1,5 +1,6 @@
 """Claude-powered summarization for scouting content."""
 
+import asyncio
 import json
 import logging
 from typing import TypedDict
@@ -9,6 +10,23 @@ from ..config import CLAUDE_MODEL
 
 logger = logging.getLogger(__name__)
 
+SENTIMENT_TOOL = {
+    "name": "record_sentiment",
+    "description": "Record the sentiment score of the text.",
+    "input_schema": {
+        "type": "object",
+        "properties": {"sentiment": {"type": "number", "minimum": -1, "maximum": 1}},
+        "required": ["sentiment"],
+    },
+}
+
+# Message Batches polling backoff, doubling from initial up to max
+BATCH_POLL_INITIAL_SECONDS = 5.0
+BATCH_POLL_MAX_SECONDS = 60.0
+
+# Longest a run waits on one batch before leaving it for a later run
+BATCH_MAX_WAIT_SECONDS = 3600.0
+
 
 class SummaryResult(TypedDict):
     """Result of summarization."""
@@ -23,6 +41,9 @@ class SummaryResult(TypedDict):
 async def extract_sentiment(text: str) -> float:
     """Extract sentiment score from text using Claude.
 
+    The score comes back through a forced tool call, so the reply is always
+    schema-shaped JSON rather than free text to parse.
+
     Returns a score from -1 (very negative) to 1 (very positive).
     """
     client = get_anthropic_client()
@@ -30,50 +51,38 @@ async def extract_sentiment(text: str) -> float:
     response = await client.messages.create(
         model=CLAUDE_MODEL,
         max_tokens=50,
+        tools=[SENTIMENT_TOOL],
+        tool_choice={"type": "tool", "name": SENTIMENT_TOOL["name"]},
         messages=[
             {
                 "role": "user",
                 "content": f"""Analyze the sentiment of this college football text.
-Return ONLY a number between -1.0 (very negative) and 1.0 (very positive).
-
-Text: {text[:1000]}
+Record a score between -1.0 (very negative) and 1.0 (very positive).
 
-Sentiment score:""",
+Text: {text[:1000]}""",
             }
         ],
     )
 
     try:
-        score = float(response.content[0].text.strip())
+        tool_use = next(block for block in response.content if block.type == "tool_use")
+        score = float(tool_use.input["sentiment"])
         return max(-1.0, min(1.0, score))  # Clamp to valid range
-    except (ValueError, IndexError):
+    except (StopIteration, KeyError, TypeError, ValueError):
         logger.warning(f"Failed to parse sentiment: {response.content}")
         return 0.0
 
 
-async def summarize_report(text: str, team_context: list[str] | None = None) -> SummaryResult:
-    """Summarize a scouting report using Claude.
-
-    Args:
-        text: The raw report text.
-        team_context: Optional list of teams mentioned for context.
-
-    Returns:
-        SummaryResult with summary, sentiment, and extracted entities.
-    """
-    client = get_anthropic_client()
-
+def _summary_messages(text: str, team_context: list[str] | None) -> list[dict]:
+    """Build the summarize_report prompt for one report."""
     context = ""
     if team_context:
         context = f"Teams mentioned: {', '.join(team_context)}\n\n"
 
-    response = await client.messages.create(
-        model=CLAUDE_MODEL,
-        max_tokens=500,
-        messages=[
-            {
-                "role": "user",
-                "content": f"""Analyze this college football content and extract key information.
+    return [
+        {
+            "role": "user",
+            "content": f"""Analyze this college football content and extract key information.
 
 {context}Text:
 {text[:2000]}
@@ -86,10 +95,12 @@ Respond with JSON only:
     "team_mentions": ["list", "of", "team", "names"],
     "key_topics": ["recruiting", "transfer_portal", "injury", "performance", etc.]
 }}""",
-            }
-        ],
-    )
+        }
+    ]
+
 
+def _parse_summary(response) -> SummaryResult:
+    """Parse a summarize_report response, empty on malformed JSON."""
     try:
         # Extract JSON from response
         response_text = response.content[0].text.strip()
@@ -116,3 +127,109 @@ Respond with JSON only:
             team_mentions=[],
             key_topics=[],
         )
+
+
+async def summarize_report(text: str, team_context: list[str] | None = None) -> SummaryResult:
+    """Summarize a scouting report using Claude.
+
+    Args:
+        text: The raw report text.
+        team_context: Optional list of teams mentioned for context.
+
+    Returns:
+        SummaryResult with summary, sentiment, and extracted entities.
+    """
+    client = get_anthropic_client()
+
+    response = await client.messages.create(
+        model=CLAUDE_MODEL,
+        max_tokens=500,
+        messages=_summary_messages(text, team_context),
+    )
+
+    return _parse_summary(response)
+
+
+async def submit_summary_batch(
+    texts: list[str],
+    team_contexts: list[list[str] | None] | None = None,
+) -> str:
+    """Submit summaries for many reports through the Message Batches API.
+
+    Batches are billed at half the realtime rate but can take minutes to
+    hours to finish, so this suits scheduled bulk runs rather than requests
+    waiting on a response. Collect the results with collect_summary_batch().
+
+    Args:
+        texts: Raw report texts; text i is submitted with custom_id i.
+        team_contexts: Optional team context per text, aligned with texts.
+
+    Returns:
+        The batch id.
+    """
+    if team_contexts is None:
+        team_contexts = [None] * len(texts)
+
+    client = get_anthropic_client()
+
+    batch = await client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": str(i),
+                "params": {
+                    "model": CLAUDE_MODEL,
+                    "max_tokens": 500,
+                    "messages": _summary_messages(text, team_context),
+                },
+            }
+            for i, (text, team_context) in enumerate(zip(texts, team_contexts, strict=True))
+        ]
+    )
+    logger.info(f"Submitted summary batch {batch.id} with {len(texts)} requests")
+    return batch.id
+
+
+async def collect_summary_batch(
+    batch_id: str,
+    count: int,
+    max_wait_seconds: float = BATCH_MAX_WAIT_SECONDS,
+) -> list[SummaryResult | None]:
+    """Wait for a summary batch to end and return its results.
+
+    Polls with exponential backoff.
+
+    Args:
+        batch_id: Id returned by submit_summary_batch().
+        count: Number of requests in the batch.
+        max_wait_seconds: Give up once the batch has run this long.
+
+    Returns:
+        SummaryResult per custom_id 0..count-1; None where the request
+        errored, expired or was canceled.
+
+    Raises:
+        TimeoutError: The batch is still processing after max_wait_seconds.
+            It keeps running and can be collected again later.
+    """
+    client = get_anthropic_client()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait_seconds
+
+    batch = await client.messages.batches.retrieve(batch_id)
+    delay = BATCH_POLL_INITIAL_SECONDS
+    while batch.processing_status != "ended":
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutError(f"Summary batch {batch_id} still {batch.processing_status}")
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+        batch = await client.messages.batches.retrieve(batch_id)
+
+    # Results stream back in arbitrary order; custom_id is the input index
+    results: list[SummaryResult | None] = [None] * count
+    async for entry in await client.messages.batches.results(batch_id):
+        if entry.result.type == "succeeded":
+            results[int(entry.custom_id)] = _parse_summary(entry.result.message)
+        else:
+            logger.warning(f"Summary batch request {entry.custom_id} {entry.result.type}")
+    return results
@@ -4,10 +4,14 @@ import logging
 import re
 from datetime import date
 
+from psycopg import errors as pg_errors
+
 from ..storage.db import (
-    get_active_portal_players,
     get_connection,
+    get_portal_summary,
+    get_read_connection,
     insert_portal_snapshot,
+    refresh_transfer_dest_prior,
 )
 
 logger = logging.getLogger(__name__)
@@ -44,6 +48,14 @@ EVENT_PATTERNS = {
     ],
 }
 
+# Each list compiled once into a single case-insensitive alternation, so a
+# document is scanned once per group instead of once per pattern
+_PORTAL_KEYWORDS_RE = re.compile("|".join(f"(?:{kw})" for kw in PORTAL_KEYWORDS), re.IGNORECASE)
+_EVENT_PATTERNS_RE = {
+    etype: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for etype, patterns in EVENT_PATTERNS.items()
+}
+
 
 # TODO: wire into entity_linking pipeline
 def extract_portal_mentions(text: str) -> dict:
@@ -55,29 +67,22 @@ def extract_portal_mentions(text: str) -> dict:
     Returns:
         Dict with is_portal_related, event_type, confidence
     """
-    text_lower = text.lower()
-
     # Check if portal-related
-    is_related = any(re.search(kw, text_lower) for kw in PORTAL_KEYWORDS)
-
-    if not is_related:
+    if not _PORTAL_KEYWORDS_RE.search(text):
         return {
             "is_portal_related": False,
             "event_type": None,
             "confidence": 0.0,
         }
 
-    # Determine event type
+    # Determine event type; earlier types win, as listed in EVENT_PATTERNS
     event_type = None
     confidence = 0.5
 
-    for etype, patterns in EVENT_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text_lower):
-                event_type = etype
-                confidence = 0.8
-                break
-        if event_type:
+    for etype, pattern in _EVENT_PATTERNS_RE.items():
+        if pattern.search(text):
+            event_type = etype
+            confidence = 0.8
             break
 
     return {
@@ -108,25 +113,42 @@ async def predict_destination(
     """
     # Historical destination patterns by position and grade tier
     # This is a simplified heuristic - could be enhanced with ML
-    async with get_connection() as conn:
+    async with get_read_connection() as conn:
         cur = conn.cursor()
 
-        # Get historical commitments for similar players
-        await cur.execute(
-            """
-            SELECT te.to_team, COUNT(*) as count
-            FROM scouting.transfer_events te
-            JOIN scouting.players p ON te.player_id = p.id
-            WHERE te.event_type = 'committed'
-            AND te.to_team IS NOT NULL
-            AND UPPER(p.position) = UPPER(%s)
-            AND te.from_team != %s
-            GROUP BY te.to_team
-            ORDER BY count DESC
-            LIMIT 10
-            """,
-            (position, from_team),
-        )
+        # Get historical commitments for similar players from the
+        # pre-aggregated prior (migration 017)
+        try:
+            await cur.execute(
+                """
+                SELECT to_team, SUM(transfer_count)::bigint as count
+                FROM scouting.transfer_dest_prior
+                WHERE position = UPPER(%s)
+                AND from_team != %s
+                GROUP BY to_team
+                ORDER BY count DESC
+                LIMIT 10
+                """,
+                (position, from_team),
+            )
+        except pg_errors.UndefinedTable:
+            # transfer_dest_prior not created yet; aggregate the raw events
+            await conn.rollback()
+            await cur.execute(
+                """
+                SELECT te.to_team, COUNT(*) as count
+                FROM scouting.transfer_events te
+                JOIN scouting.players p ON te.player_id = p.id
+                WHERE te.event_type = 'committed'
+                AND te.to_team IS NOT NULL
+                AND UPPER(p.position) = UPPER(%s)
+                AND te.from_team != %s
+                GROUP BY te.to_team
+                ORDER BY count DESC
+                LIMIT 10
+                """,
+                (position, from_team),
+            )
 
         historical = await cur.fetchall()
 
@@ -178,42 +200,44 @@ async def predict_destination(
 async def generate_portal_snapshot() -> dict:
     """Generate a daily snapshot of portal activity.
 
+    Also refreshes the transfer_dest_prior view that predict_destination()
+    reads, so destination predictions track the latest committed transfers.
+
     Returns:
         Summary dict of portal state
     """
     async with get_connection() as conn:
-        # Get all active portal players
-        active = await get_active_portal_players(conn, limit=1000)
-
-        # Count by position
-        by_position = {}
-        for player in active:
-            pos = player.get("position") or "Unknown"
-            by_position[pos] = by_position.get(pos, 0) + 1
+        # Position counts and top-graded players are aggregated in SQL
+        summary = await get_portal_summary(conn, notable_limit=10)
+        by_position = summary["by_position"]
+        total_in_portal = sum(by_position.values())
 
         # Count by conference (if we have that data - simplified for now)
         by_conference = {}  # Would need conference mapping
 
         # Notable entries (top graded players)
         notable = [
-            f"{p['name']} ({p['position']}, {p['composite_grade']})"
-            for p in sorted(active, key=lambda x: x.get("composite_grade") or 0, reverse=True)[:10]
+            f"{p['name']} ({p['position']}, {p['composite_grade']})" for p in summary["notable"]
         ]
 
         # Insert snapshot
         snapshot_id = await insert_portal_snapshot(
             conn,
             snapshot_date=date.today(),
-            total_in_portal=len(active),
+            total_in_portal=total_in_portal,
             by_position=by_position,
             by_conference=by_conference,
             notable_entries=notable,
         )
 
+        # Keep predict_destination's prior in step with the day's events
+        if not await refresh_transfer_dest_prior(conn):
+            logger.warning("transfer_dest_prior missing; apply migration 017")
+
         return {
             "snapshot_id": snapshot_id,
             "date": date.today().isoformat(),
-            "total_in_portal": len(active),
+            "total_in_portal": total_in_portal,
             "by_position": by_position,
             "notable_entries": notable,
         }
@@ -228,58 +252,58 @@ async def analyze_team_portal_impact(team: str) -> dict:
     Returns:
         Impact analysis dict
     """
-    async with get_connection() as conn:
+    async with get_read_connection() as conn:
         cur = conn.cursor()
 
-        # Get outgoing players (grade lost)
+        # Counts and grade sums per (direction, position), aggregated in SQL.
+        # Missing or zero grades count as transfers but not toward averages.
         await cur.execute(
             """
-            SELECT p.position, p.composite_grade
-            FROM scouting.transfer_events te
-            JOIN scouting.players p ON te.player_id = p.id
-            WHERE te.from_team = %s AND te.event_type = 'entered'
-            AND te.event_date >= CURRENT_DATE - INTERVAL '1 year'
+            WITH outgoing AS (
+                SELECT 'lost' AS direction, p.position, p.composite_grade
+                FROM scouting.transfer_events te
+                JOIN scouting.players p ON te.player_id = p.id
+                WHERE te.from_team = %(team)s AND te.event_type = 'entered'
+                AND te.event_date >= CURRENT_DATE - INTERVAL '1 year'
+            ),
+            incoming AS (
+                SELECT 'gained' AS direction, p.position, p.composite_grade
+                FROM scouting.transfer_events te
+                JOIN scouting.players p ON te.player_id = p.id
+                WHERE te.to_team = %(team)s AND te.event_type = 'committed'
+                AND te.event_date >= CURRENT_DATE - INTERVAL '1 year'
+            )
+            SELECT direction, position,
+                   COUNT(*),
+                   COALESCE(SUM(composite_grade), 0),
+                   COUNT(NULLIF(composite_grade, 0))
+            FROM (SELECT * FROM outgoing UNION ALL SELECT * FROM incoming) t
+            GROUP BY direction, position
             """,
-            (team,),
+            {"team": team},
         )
-        outgoing = await cur.fetchall()
-        outgoing_grades = [g for _, g in outgoing if g]
-        avg_outgoing = sum(outgoing_grades) / len(outgoing_grades) if outgoing_grades else 0
+        rows = await cur.fetchall()
 
-        # Get incoming players (grade gained)
-        await cur.execute(
-            """
-            SELECT p.position, p.composite_grade
-            FROM scouting.transfer_events te
-            JOIN scouting.players p ON te.player_id = p.id
-            WHERE te.to_team = %s AND te.event_type = 'committed'
-            AND te.event_date >= CURRENT_DATE - INTERVAL '1 year'
-            """,
-            (team,),
-        )
-        incoming = await cur.fetchall()
-        incoming_grades = [g for _, g in incoming if g]
-        avg_incoming = sum(incoming_grades) / len(incoming_grades) if incoming_grades else 0
-
-        # Position group impact
-        position_impact = {}
-        for pos, grade in outgoing:
-            if pos not in position_impact:
-                position_impact[pos] = {"lost": 0, "gained": 0}
-            position_impact[pos]["lost"] += 1
-
-        for pos, grade in incoming:
-            if pos not in position_impact:
-                position_impact[pos] = {"lost": 0, "gained": 0}
-            position_impact[pos]["gained"] += 1
+    counts = {"lost": 0, "gained": 0}
+    grade_sums = {"lost": 0, "gained": 0}
+    graded = {"lost": 0, "gained": 0}
+    position_impact = {}
+    for direction, pos, count, grade_sum, graded_count in rows:
+        counts[direction] += count
+        grade_sums[direction] += grade_sum
+        graded[direction] += graded_count
+        position_impact.setdefault(pos, {"lost": 0, "gained": 0})[direction] = count
 
-        return {
-            "team": team,
-            "outgoing_count": len(outgoing),
-            "incoming_count": len(incoming),
-            "net_transfers": len(incoming) - len(outgoing),
-            "avg_grade_lost": round(avg_outgoing, 1),
-            "avg_grade_gained": round(avg_incoming, 1),
-            "grade_delta": round(avg_incoming - avg_outgoing, 1),
-            "position_impact": position_impact,
-        }
+    avg_outgoing = grade_sums["lost"] / graded["lost"] if graded["lost"] else 0
+    avg_incoming = grade_sums["gained"] / graded["gained"] if graded["gained"] else 0
+
+    return {
+        "team": team,
+        "outgoing_count": counts["lost"],
+        "incoming_count": counts["gained"],
+        "net_transfers": counts["gained"] - counts["lost"],
+        "avg_grade_lost": round(avg_outgoing, 1),
+        "avg_grade_gained": round(avg_incoming, 1),
+        "grade_delta": round(avg_incoming - avg_outgoing, 1),
+        "position_impact": position_impact,
+    }
@@ -4,9 +4,7 @@ import logging
 from datetime import date, timedelta
 from enum import Enum
 
-import numpy as np
-
-from ..storage.db import get_connection, get_player_timeline
+from ..storage.db import get_connection, get_player_timeline, get_read_connection
 
 logger = logging.getLogger(__name__)
 
@@ -66,14 +64,47 @@ def calculate_trend(
     if len(grades) < 3:
         return TrendDirection.UNKNOWN
 
-    # Use linear regression to find slope
-    x = np.arange(len(grades))
-    y = np.array(grades)
+    return classify_slope(calculate_slope(grades), threshold)
+
+
+def calculate_slope(grades: list[float]) -> float:
+    """Least-squares slope of grades against their index (0, 1, 2, ...).
+
+    Sums over x have closed forms, so only sum(y) and sum(x*y) are computed.
+    Timelines are short (at most 30 points), where plain Python sums beat
+    the per-call overhead of building numpy arrays.
 
-    # Calculate slope using least squares
+    Args:
+        grades: List of grades in chronological order (oldest first)
+
+    Returns:
+        Slope in grade points per snapshot (0.0 for fewer than 2 points)
+    """
     n = len(grades)
-    slope = (n * np.sum(x * y) - np.sum(x) * np.sum(y)) / (n * np.sum(x**2) - np.sum(x) ** 2)
+    if n < 2:
+        return 0.0
+
+    sum_x = n * (n - 1) / 2
+    sum_x2 = n * (n - 1) * (2 * n - 1) / 6
+    sum_y = sum(grades)
+    sum_xy = sum(x * y for x, y in enumerate(grades))
+
+    return (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x**2)
+
+
+def classify_slope(
+    slope: float,
+    threshold: float = 0.5,
+) -> TrendDirection:
+    """Classify a least-squares slope (grade points per snapshot) as a direction.
 
+    Args:
+        slope: Regression slope over snapshot index
+        threshold: Minimum slope to consider rising/falling
+
+    Returns:
+        TrendDirection enum value
+    """
     if slope > threshold:
         return TrendDirection.RISING
     elif slope < -threshold:
@@ -128,71 +159,130 @@ async def analyze_player_trend(
         recent.sort(key=lambda x: x["snapshot_date"])
         grades = [float(t["grade_at_time"]) for t in recent]
 
-        direction = calculate_trend(grades)
-
-        # Calculate slope for reporting
-        x = np.arange(len(grades))
-        y = np.array(grades)
-        n = len(grades)
-        slope = (n * np.sum(x * y) - np.sum(x) * np.sum(y)) / (n * np.sum(x**2) - np.sum(x) ** 2)
+        # One slope for both the direction and the report
+        slope = calculate_slope(grades)
+        direction = classify_slope(slope)
 
         grade_change = grades[-1] - grades[0]
 
         return PlayerTrend(
             player_id=player_id,
             direction=direction,
-            slope=float(slope),
+            slope=slope,
             grade_change=grade_change,
             data_points=len(recent),
             period_days=days,
         )
 
 
-async def get_rising_stocks(
-    limit: int = 20,
-    min_data_points: int = 3,
-    days: int = 90,
+async def _get_trending_players(
+    direction: TrendDirection,
+    min_data_points: int,
+    days: int,
+    limit: int,
+    threshold: float = 0.5,
 ) -> list[dict]:
-    """Get players with rising trends.
+    """Players with enough recent grades whose trend is direction, steepest first.
 
-    Returns list of players sorted by slope (steepest rise first).
+    Gives the same per-player result as analyze_player_trend() (each player's
+    30 newest snapshots, slope over snapshot index), but slopes, filtering
+    and ranking all happen in one query, so only the returned players leave
+    the database.
     """
-    async with get_connection() as conn:
-        cur = conn.cursor()
+    cutoff = date.today() - timedelta(days=days)
+    # Flip the sign for falling stocks so both directions rank "steepest first"
+    sign = 1 if direction == TrendDirection.RISING else -1
 
-        # Get players with recent timeline entries
+    async with get_read_connection() as conn:
+        cur = conn.cursor()
         await cur.execute(
             """
-            SELECT DISTINCT p.id, p.name, p.team, p.position
-            FROM scouting.players p
-            JOIN scouting.player_timeline t ON p.id = t.player_id
-            WHERE t.snapshot_date >= CURRENT_DATE - INTERVAL '%s days'
-            AND t.grade_at_time IS NOT NULL
-            GROUP BY p.id
-            HAVING COUNT(*) >= %s
+            WITH candidates AS (
+                SELECT player_id
+                FROM scouting.player_timeline
+                WHERE snapshot_date >= %(cutoff)s
+                AND grade_at_time IS NOT NULL
+                GROUP BY player_id
+                HAVING COUNT(*) >= %(min_data_points)s
+            ),
+            recent AS (
+                SELECT c.player_id, t.snapshot_date, t.grade_at_time,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY c.player_id ORDER BY t.snapshot_date
+                       ) AS idx
+                FROM candidates c
+                CROSS JOIN LATERAL (
+                    SELECT snapshot_date, grade_at_time
+                    FROM scouting.player_timeline
+                    WHERE player_id = c.player_id
+                    ORDER BY snapshot_date DESC
+                    LIMIT 30
+                ) t
+                WHERE t.snapshot_date >= %(cutoff)s
+                AND t.grade_at_time IS NOT NULL
+            ),
+            trends AS (
+                SELECT player_id,
+                       regr_slope(grade_at_time::float8, idx::float8) AS slope,
+                       (ARRAY_AGG(grade_at_time ORDER BY snapshot_date DESC))[1]
+                           - (ARRAY_AGG(grade_at_time ORDER BY snapshot_date))[1]
+                           AS grade_change,
+                       COUNT(*) AS data_points
+                FROM recent
+                GROUP BY player_id
+                -- analyze_player_trend needs 3 points in the window
+                HAVING COUNT(*) >= 3
+            )
+            SELECT p.id, p.name, p.team, p.position,
+                   tr.slope, tr.grade_change, tr.data_points
+            FROM trends tr
+            JOIN scouting.players p ON p.id = tr.player_id
+            WHERE tr.slope * %(sign)s > %(threshold)s
+            ORDER BY tr.slope * %(sign)s DESC
+            LIMIT %(limit)s
             """,
-            (days, min_data_points),
+            {
+                "cutoff": cutoff,
+                "min_data_points": min_data_points,
+                "sign": sign,
+                "threshold": threshold,
+                "limit": limit,
+            },
+        )
+        rows = await cur.fetchall()
+
+    trends = []
+    for player_id, name, team, position, slope, grade_change, data_points in rows:
+        trend = PlayerTrend(
+            player_id=player_id,
+            direction=direction,
+            slope=float(slope),
+            grade_change=float(grade_change),
+            data_points=data_points,
+            period_days=days,
         )
+        trends.append(
+            {
+                "player_id": player_id,
+                "name": name,
+                "team": team,
+                "position": position,
+                **trend.to_dict(),
+            }
+        )
+    return trends
 
-        players = await cur.fetchall()
-        trends = []
 
-        for player_id, name, team, position in players:
-            trend = await analyze_player_trend(player_id, days)
-            if trend.direction == TrendDirection.RISING:
-                trends.append(
-                    {
-                        "player_id": player_id,
-                        "name": name,
-                        "team": team,
-                        "position": position,
-                        **trend.to_dict(),
-                    }
-                )
+async def get_rising_stocks(
+    limit: int = 20,
+    min_data_points: int = 3,
+    days: int = 90,
+) -> list[dict]:
+    """Get players with rising trends.
 
-        # Sort by slope descending
-        trends.sort(key=lambda x: x["slope"], reverse=True)
-        return trends[:limit]
+    Returns list of players sorted by slope (steepest rise first).
+    """
+    return await _get_trending_players(TrendDirection.RISING, min_data_points, days, limit)
 
 
 async def get_falling_stocks(
@@ -204,38 +294,4 @@ async def get_falling_stocks(
 
     Returns list of players sorted by slope (steepest fall first).
     """
-    async with get_connection() as conn:
-        cur = conn.cursor()
-
-        await cur.execute(
-            """
-            SELECT DISTINCT p.id, p.name, p.team, p.position
-            FROM scouting.players p
-            JOIN scouting.player_timeline t ON p.id = t.player_id
-            WHERE t.snapshot_date >= CURRENT_DATE - INTERVAL '%s days'
-            AND t.grade_at_time IS NOT NULL
-            GROUP BY p.id
-            HAVING COUNT(*) >= %s
-            """,
-            (days, min_data_points),
-        )
-
-        players = await cur.fetchall()
-        trends = []
-
-        for player_id, name, team, position in players:
-            trend = await analyze_player_trend(player_id, days)
-            if trend.direction == TrendDirection.FALLING:
-                trends.append(
-                    {
-                        "player_id": player_id,
-                        "name": name,
-                        "team": team,
-                        "position": position,
-                        **trend.to_dict(),
-                    }
-                )
-
-        # Sort by slope ascending (most negative first)
-        trends.sort(key=lambda x: x["slope"])
-        return trends[:limit]
+    return await _get_trending_players(TrendDirection.FALLING, min_data_points, days, limit)
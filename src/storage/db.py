@@ -5,54 +5,89 @@ import logging
 import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from datetime import date
+from datetime import date, datetime
 
 import psycopg
+from psycopg import errors as pg_errors
 from psycopg_pool import AsyncConnectionPool
 
 logger = logging.getLogger(__name__)
 
 _pool: AsyncConnectionPool | None = None
+_read_pool: AsyncConnectionPool | None = None
 
 MIN_POOL_CONNECTIONS = 2
 MAX_POOL_CONNECTIONS = 10
 
+# Separate pool for read-only pipeline queries, so long scans never queue
+# behind (or ahead of) writes waiting for a connection
+MIN_READ_POOL_CONNECTIONS = 2
+MAX_READ_POOL_CONNECTIONS = 10
+
+
+async def _configure_read_only(conn: psycopg.AsyncConnection) -> None:
+    """Mark read pool connections read-only so stray writes fail loudly."""
+    await conn.set_read_only(True)
+
 
 async def init_pool(
     min_conn: int = MIN_POOL_CONNECTIONS,
     max_conn: int = MAX_POOL_CONNECTIONS,
+    min_read_conn: int = MIN_READ_POOL_CONNECTIONS,
+    max_read_conn: int = MAX_READ_POOL_CONNECTIONS,
 ) -> None:
-    """Initialize the async connection pool. Safe to call multiple times."""
-    global _pool
+    """Initialize the async connection pools. Safe to call multiple times.
+
+    The read pool connects to DATABASE_READ_URL (e.g. a replica) when set,
+    otherwise to DATABASE_URL.
+    """
+    global _pool, _read_pool
     if _pool is not None:
         return
     database_url = os.environ.get("DATABASE_URL")
     if not database_url:
         raise ValueError("DATABASE_URL environment variable not set")
-    _pool = AsyncConnectionPool(
+    pool = AsyncConnectionPool(
         conninfo=database_url,
         min_size=min_conn,
         max_size=max_conn,
         open=False,
     )
-    await _pool.open()
-    logger.info("Async connection pool initialized (min=%d, max=%d)", min_conn, max_conn)
+    read_pool = AsyncConnectionPool(
+        conninfo=os.environ.get("DATABASE_READ_URL") or database_url,
+        min_size=min_read_conn,
+        max_size=max_read_conn,
+        configure=_configure_read_only,
+        open=False,
+    )
+    await pool.open()
+    await read_pool.open()
+    _pool, _read_pool = pool, read_pool
+    logger.info(
+        "Async connection pools initialized (min=%d, max=%d; read min=%d, max=%d)",
+        min_conn,
+        max_conn,
+        min_read_conn,
+        max_read_conn,
+    )
 
 
 async def close_pool() -> None:
-    """Close all connections in the pool."""
-    global _pool
+    """Close all connections in both pools."""
+    global _pool, _read_pool
     if _pool is not None:
         await _pool.close()
-        _pool = None
-        logger.info("Async connection pool closed")
+        await _read_pool.close()
+        _pool = _read_pool = None
+        logger.info("Async connection pools closed")
 
 
 @asynccontextmanager
 async def get_connection() -> AsyncIterator[psycopg.AsyncConnection]:
     """Async context manager that yields a connection from the pool.
 
-    Lazily initializes the pool on first call.
+    Lazily initializes the pool on first call. Use this for anything that
+    writes; see get_read_connection() for read-only work.
     """
     global _pool
     if _pool is None:
@@ -61,6 +96,19 @@ async def get_connection() -> AsyncIterator[psycopg.AsyncConnection]:
         yield conn
 
 
+@asynccontextmanager
+async def get_read_connection() -> AsyncIterator[psycopg.AsyncConnection]:
+    """Async context manager that yields a read-only connection.
+
+    Served from a pool separate from get_connection(), so read-heavy
+    pipeline stages don't hold connections that writers are waiting for.
+    """
+    if _read_pool is None:
+        await init_pool()
+    async with _read_pool.connection() as conn:
+        yield conn
+
+
 # ---------------------------------------------------------------------------
 # Data functions
 # ---------------------------------------------------------------------------
@@ -108,14 +156,14 @@ async def insert_report(
 
 
 async def get_unprocessed_reports(conn: psycopg.AsyncConnection, limit: int = 100) -> list[dict]:
-    """Get reports that haven't been processed yet."""
+    """Get reports that haven't been processed yet, oldest first."""
     cur = conn.cursor()
     await cur.execute(
         """
         SELECT id, source_url, source_name, content_type, raw_text, player_ids, team_ids
         FROM scouting.reports
         WHERE processed_at IS NULL
-        ORDER BY crawled_at ASC
+        ORDER BY crawled_at, id
         LIMIT %s
         """,
         (limit,),
@@ -150,6 +198,107 @@ async def mark_report_processed(
     await conn.commit()
 
 
+async def insert_summary_batch(
+    conn: psycopg.AsyncConnection,
+    batch_id: str,
+    report_ids: list[int],
+) -> None:
+    """Record a submitted summary batch; report_ids[i] has custom_id i."""
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        INSERT INTO scouting.summary_batches (batch_id, report_ids)
+        VALUES (%s, %s)
+        """,
+        (batch_id, report_ids),
+    )
+    await conn.commit()
+
+
+async def get_open_summary_batch(conn: psycopg.AsyncConnection) -> dict | None:
+    """Oldest submitted summary batch whose results were not yet stored."""
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        SELECT batch_id, report_ids, submitted_at
+        FROM scouting.summary_batches
+        WHERE completed_at IS NULL
+        ORDER BY submitted_at
+        LIMIT 1
+        """
+    )
+    row = await cur.fetchone()
+    if row is None:
+        return None
+    columns = [desc[0] for desc in cur.description]
+    return dict(zip(columns, row))
+
+
+async def complete_summary_batch(conn: psycopg.AsyncConnection, batch_id: str) -> None:
+    """Mark a summary batch's results as stored."""
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        UPDATE scouting.summary_batches
+        SET completed_at = NOW()
+        WHERE batch_id = %s
+        """,
+        (batch_id,),
+    )
+    await conn.commit()
+
+
+_UPSERT_SCOUTING_PLAYER_SQL = """
+    INSERT INTO scouting.players
+        (name, team, position, class_year, current_status,
+         roster_player_id, recruit_id, composite_grade, traits,
+         draft_projection, comps, last_updated)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+    ON CONFLICT (name, team, class_year) DO UPDATE SET
+        position = COALESCE(EXCLUDED.position, scouting.players.position),
+        current_status = EXCLUDED.current_status,
+        roster_player_id = COALESCE(
+            EXCLUDED.roster_player_id, scouting.players.roster_player_id),
+        recruit_id = COALESCE(EXCLUDED.recruit_id, scouting.players.recruit_id),
+        composite_grade = COALESCE(EXCLUDED.composite_grade, scouting.players.composite_grade),
+        traits = COALESCE(EXCLUDED.traits, scouting.players.traits),
+        draft_projection = COALESCE(
+            EXCLUDED.draft_projection, scouting.players.draft_projection),
+        comps = COALESCE(EXCLUDED.comps, scouting.players.comps),
+        last_updated = NOW()
+    RETURNING id
+"""
+
+
+def _scouting_player_params(
+    name: str,
+    team: str,
+    position: str | None = None,
+    class_year: int | None = None,
+    current_status: str = "active",
+    roster_player_id: int | None = None,
+    recruit_id: int | None = None,
+    composite_grade: int | None = None,
+    traits: dict | None = None,
+    draft_projection: str | None = None,
+    comps: list[str] | None = None,
+) -> tuple:
+    """Build the parameter tuple for _UPSERT_SCOUTING_PLAYER_SQL."""
+    return (
+        name,
+        team,
+        position,
+        class_year,
+        current_status,
+        roster_player_id,
+        recruit_id,
+        composite_grade,
+        json.dumps(traits) if traits else None,
+        draft_projection,
+        comps or [],
+    )
+
+
 async def upsert_scouting_player(
     conn: psycopg.AsyncConnection,
     name: str,
@@ -170,38 +319,19 @@ async def upsert_scouting_player(
     """
     cur = conn.cursor()
     await cur.execute(
-        """
-        INSERT INTO scouting.players
-            (name, team, position, class_year, current_status,
-             roster_player_id, recruit_id, composite_grade, traits,
-             draft_projection, comps, last_updated)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
-        ON CONFLICT (name, team, class_year) DO UPDATE SET
-            position = COALESCE(EXCLUDED.position, scouting.players.position),
-            current_status = EXCLUDED.current_status,
-            roster_player_id = COALESCE(
-                EXCLUDED.roster_player_id, scouting.players.roster_player_id),
-            recruit_id = COALESCE(EXCLUDED.recruit_id, scouting.players.recruit_id),
-            composite_grade = COALESCE(EXCLUDED.composite_grade, scouting.players.composite_grade),
-            traits = COALESCE(EXCLUDED.traits, scouting.players.traits),
-            draft_projection = COALESCE(
-                EXCLUDED.draft_projection, scouting.players.draft_projection),
-            comps = COALESCE(EXCLUDED.comps, scouting.players.comps),
-            last_updated = NOW()
-        RETURNING id
-        """,
-        (
+        _UPSERT_SCOUTING_PLAYER_SQL,
+        _scouting_player_params(
             name,
             team,
-            position,
-            class_year,
-            current_status,
-            roster_player_id,
-            recruit_id,
-            composite_grade,
-            json.dumps(traits) if traits else None,
-            draft_projection,
-            comps or [],
+            position=position,
+            class_year=class_year,
+            current_status=current_status,
+            roster_player_id=roster_player_id,
+            recruit_id=recruit_id,
+            composite_grade=composite_grade,
+            traits=traits,
+            draft_projection=draft_projection,
+            comps=comps,
         ),
     )
     row = await cur.fetchone()
@@ -210,6 +340,46 @@ async def upsert_scouting_player(
     return player_id
 
 
+async def upsert_scouting_players_bulk(
+    conn: psycopg.AsyncConnection,
+    players: list[dict],
+) -> list[int]:
+    """Upsert many scouting player profiles in one pipelined batch.
+
+    Each dict takes the keyword arguments of upsert_scouting_player (name and
+    team required). Statements are sent with executemany so the whole batch
+    costs one round trip, and a single commit. Rows are upserted in
+    (name, team, class_year) order, so concurrent batches naming the same
+    players take their row locks in the same order and cannot deadlock.
+
+    Returns:
+        Player IDs in the same order as players.
+    """
+    if not players:
+        return []
+
+    params = [_scouting_player_params(**player) for player in players]
+    order = sorted(
+        range(len(params)),
+        key=lambda i: (params[i][0], params[i][1], params[i][3] is None, params[i][3] or 0),
+    )
+
+    cur = conn.cursor()
+    await cur.executemany(
+        _UPSERT_SCOUTING_PLAYER_SQL,
+        [params[i] for i in order],
+        returning=True,
+    )
+
+    player_ids = [0] * len(params)
+    for i in order:
+        row = await cur.fetchone()
+        player_ids[i] = row[0]
+        cur.nextset()
+    await conn.commit()
+    return player_ids
+
+
 async def get_scouting_player(conn: psycopg.AsyncConnection, player_id: int) -> dict | None:
     """Get a scouting player by ID."""
     cur = conn.cursor()
@@ -253,6 +423,34 @@ async def link_report_to_player(
     await conn.commit()
 
 
+async def link_report_to_players(
+    conn: psycopg.AsyncConnection,
+    report_id: int,
+    player_ids: list[int],
+) -> None:
+    """Link a report to several scouting players with a single UPDATE.
+
+    Appends the IDs not already in player_ids, in order, so the report row
+    is rewritten once instead of once per player.
+    """
+    if not player_ids:
+        return
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        UPDATE scouting.reports
+        SET player_ids = COALESCE(player_ids, '{}') || ARRAY(
+            SELECT new_id
+            FROM unnest(%s::bigint[]) AS new_id
+            WHERE new_id <> ALL(COALESCE(player_ids, '{}'))
+        )
+        WHERE id = %s
+        """,
+        (list(dict.fromkeys(player_ids)), report_id),
+    )
+    await conn.commit()
+
+
 async def insert_timeline_snapshot(
     conn: psycopg.AsyncConnection,
     player_id: int,
@@ -314,6 +512,67 @@ async def get_player_timeline(
     return [dict(zip(columns, row)) for row in rows]
 
 
+async def get_grading_fingerprints(
+    conn: psycopg.AsyncConnection,
+    player_id: int,
+) -> tuple[str | None, str | None]:
+    """Fingerprint a player's linked reports and fetch the one last graded.
+
+    Returns:
+        (current, graded) fingerprints; current is None when the player has
+        no reports, graded is None when the player was never graded.
+    """
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        SELECT
+            (SELECT md5(string_agg(
+                        id::text || ':' || COALESCE(processed_at::text, ''), ',' ORDER BY id))
+             FROM scouting.reports
+             WHERE player_ids @> ARRAY[%s::bigint]),
+            (SELECT reports_fingerprint
+             FROM scouting.player_grading_state
+             WHERE player_id = %s)
+        """,
+        (player_id, player_id),
+    )
+    current, graded = await cur.fetchone()
+    return current, graded
+
+
+_UPSERT_PFF_GRADE_SQL = """
+    INSERT INTO scouting.pff_grades
+        (player_id, pff_player_id, season, week, overall_grade, position_grades, snaps)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (player_id, season, week) DO UPDATE SET
+        overall_grade = EXCLUDED.overall_grade,
+        position_grades = EXCLUDED.position_grades,
+        snaps = EXCLUDED.snaps,
+        fetched_at = NOW()
+"""
+
+
+def _pff_grade_params(
+    player_id: int,
+    pff_player_id: str,
+    season: int,
+    overall_grade: float,
+    position_grades: dict | None = None,
+    snaps: int = 0,
+    week: int | None = None,
+) -> tuple:
+    """Build the parameter tuple for _UPSERT_PFF_GRADE_SQL."""
+    return (
+        player_id,
+        pff_player_id,
+        season,
+        week,
+        overall_grade,
+        json.dumps(position_grades) if position_grades else None,
+        snaps,
+    )
+
+
 async def upsert_pff_grade(
     conn: psycopg.AsyncConnection,
     player_id: int,
@@ -327,25 +586,15 @@ async def upsert_pff_grade(
     """Upsert a PFF grade for a player."""
     cur = conn.cursor()
     await cur.execute(
-        """
-        INSERT INTO scouting.pff_grades
-            (player_id, pff_player_id, season, week, overall_grade, position_grades, snaps)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (player_id, season, week) DO UPDATE SET
-            overall_grade = EXCLUDED.overall_grade,
-            position_grades = EXCLUDED.position_grades,
-            snaps = EXCLUDED.snaps,
-            fetched_at = NOW()
-        RETURNING id
-        """,
-        (
+        _UPSERT_PFF_GRADE_SQL + " RETURNING id",
+        _pff_grade_params(
             player_id,
             pff_player_id,
             season,
-            week,
             overall_grade,
-            json.dumps(position_grades) if position_grades else None,
-            snaps,
+            position_grades=position_grades,
+            snaps=snaps,
+            week=week,
         ),
     )
     row = await cur.fetchone()
@@ -354,6 +603,45 @@ async def upsert_pff_grade(
     return grade_id
 
 
+async def upsert_pff_grades_bulk(
+    conn: psycopg.AsyncConnection,
+    grades: list[dict],
+) -> None:
+    """Upsert many PFF grades in one pipelined batch and a single commit.
+
+    Each dict takes the keyword arguments of upsert_pff_grade.
+    """
+    if not grades:
+        return
+
+    cur = conn.cursor()
+    await cur.executemany(
+        _UPSERT_PFF_GRADE_SQL,
+        [_pff_grade_params(**grade) for grade in grades],
+    )
+    await conn.commit()
+
+
+async def record_pff_not_found_bulk(
+    conn: psycopg.AsyncConnection,
+    player_ids: list[int],
+) -> None:
+    """Record PFF misses for many players in one statement."""
+    if not player_ids:
+        return
+
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        INSERT INTO scouting.pff_not_found (player_id)
+        SELECT DISTINCT unnest(%s::int[])
+        ON CONFLICT (player_id) DO UPDATE SET checked_at = NOW()
+        """,
+        (player_ids,),
+    )
+    await conn.commit()
+
+
 async def get_player_pff_grades(
     conn: psycopg.AsyncConnection,
     player_id: int,
@@ -382,6 +670,35 @@ async def get_player_pff_grades(
     return [dict(zip(columns, row)) for row in rows]
 
 
+async def get_latest_pff_grades(
+    conn: psycopg.AsyncConnection,
+    player_ids: list[int],
+) -> dict[int, dict]:
+    """Get the most recent PFF grade row for each player.
+
+    Deduplicates in Postgres with DISTINCT ON, so only one row per player
+    is returned regardless of grade history length.
+
+    Returns:
+        Map of player_id -> grade dict (players without grades are omitted)
+    """
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        SELECT DISTINCT ON (player_id)
+               id, player_id, pff_player_id, season, week,
+               overall_grade, position_grades, snaps, fetched_at
+        FROM scouting.pff_grades
+        WHERE player_id = ANY(%s)
+        ORDER BY player_id, season DESC, week DESC NULLS FIRST
+        """,
+        (player_ids,),
+    )
+    columns = [desc[0] for desc in cur.description]
+    rows = await cur.fetchall()
+    return {row[1]: dict(zip(columns, row)) for row in rows}
+
+
 async def create_watch_list(
     conn: psycopg.AsyncConnection,
     user_id: str,
@@ -682,8 +999,6 @@ async def insert_transfer_event(
     notes: str | None = None,
 ) -> int:
     """Insert a transfer portal event."""
-    from datetime import date as date_type
-
     cur = conn.cursor()
     await cur.execute(
         """
@@ -701,7 +1016,7 @@ async def insert_transfer_event(
             event_type,
             from_team,
             to_team,
-            event_date or date_type.today(),
+            event_date or date.today(),
             source_url,
             notes,
         ),
@@ -733,6 +1048,23 @@ async def get_player_transfer_history(
     return [dict(zip(columns, row)) for row in rows]
 
 
+# Players who have 'entered' the portal with no later commit or withdrawal
+_ACTIVE_PORTAL_PLAYERS_SQL = """
+    SELECT DISTINCT ON (p.id)
+        p.id, p.name, p.team, p.position, p.class_year, p.composite_grade,
+        te.event_date as portal_entry_date, te.from_team
+    FROM scouting.players p
+    JOIN scouting.transfer_events te ON p.id = te.player_id
+    WHERE te.event_type = 'entered'
+    AND NOT EXISTS (
+        SELECT 1 FROM scouting.transfer_events te2
+        WHERE te2.player_id = p.id
+        AND te2.event_type IN ('committed', 'withdrawn')
+        AND te2.event_date > te.event_date
+    )
+"""
+
+
 async def get_active_portal_players(
     conn: psycopg.AsyncConnection,
     position: str | None = None,
@@ -744,20 +1076,7 @@ async def get_active_portal_players(
     """
     cur = conn.cursor()
 
-    query = """
-        SELECT DISTINCT ON (p.id)
-            p.id, p.name, p.team, p.position, p.class_year, p.composite_grade,
-            te.event_date as portal_entry_date, te.from_team
-        FROM scouting.players p
-        JOIN scouting.transfer_events te ON p.id = te.player_id
-        WHERE te.event_type = 'entered'
-        AND NOT EXISTS (
-            SELECT 1 FROM scouting.transfer_events te2
-            WHERE te2.player_id = p.id
-            AND te2.event_type IN ('committed', 'withdrawn')
-            AND te2.event_date > te.event_date
-        )
-    """
+    query = _ACTIVE_PORTAL_PLAYERS_SQL
     params = []
 
     if position:
@@ -773,42 +1092,86 @@ async def get_active_portal_players(
     return [dict(zip(columns, row)) for row in rows]
 
 
-async def get_team_transfer_activity(
+async def get_portal_summary(
     conn: psycopg.AsyncConnection,
-    team: str,
+    notable_limit: int = 10,
 ) -> dict:
-    """Get transfer activity for a team (incoming and outgoing)."""
-    cur = conn.cursor()
+    """Summarize the active portal without fetching every player.
 
-    # Outgoing (players who left)
+    Returns:
+        Dict with by_position ({position: count}, missing positions as
+        "Unknown") and notable (top-graded players as dicts with name,
+        position and composite_grade, ungraded players last).
+    """
+    cur = conn.cursor()
     await cur.execute(
+        f"""
+        SELECT COALESCE(NULLIF(position, ''), 'Unknown'), COUNT(*)
+        FROM ({_ACTIVE_PORTAL_PLAYERS_SQL}) active
+        GROUP BY 1
         """
-        SELECT p.id, p.name, p.position, te.event_date, te.to_team
-        FROM scouting.transfer_events te
-        JOIN scouting.players p ON te.player_id = p.id
-        WHERE te.from_team = %s AND te.event_type = 'entered'
-        ORDER BY te.event_date DESC
-        """,
-        (team,),
     )
-    columns = [desc[0] for desc in cur.description]
-    rows = await cur.fetchall()
-    outgoing = [dict(zip(columns, row)) for row in rows]
+    by_position = {position: count for position, count in await cur.fetchall()}
 
-    # Incoming (players who committed)
     await cur.execute(
-        """
-        SELECT p.id, p.name, p.position, te.event_date, te.from_team
-        FROM scouting.transfer_events te
-        JOIN scouting.players p ON te.player_id = p.id
-        WHERE te.to_team = %s AND te.event_type = 'committed'
-        ORDER BY te.event_date DESC
+        f"""
+        SELECT name, position, composite_grade
+        FROM ({_ACTIVE_PORTAL_PLAYERS_SQL}) active
+        ORDER BY COALESCE(composite_grade, 0) DESC, id
+        LIMIT %s
         """,
-        (team,),
+        (notable_limit,),
     )
     columns = [desc[0] for desc in cur.description]
-    rows = await cur.fetchall()
-    incoming = [dict(zip(columns, row)) for row in rows]
+    notable = [dict(zip(columns, row)) for row in await cur.fetchall()]
+
+    return {"by_position": by_position, "notable": notable}
+
+
+async def get_team_transfer_activity(
+    conn: psycopg.AsyncConnection,
+    team: str,
+) -> dict:
+    """Get transfer activity for a team (incoming and outgoing).
+
+    Both queries are sent in pipeline mode, so they cost one round trip.
+    """
+    outgoing_cur = conn.cursor()
+    incoming_cur = conn.cursor()
+
+    async with conn.pipeline():
+        # Outgoing (players who left)
+        await outgoing_cur.execute(
+            """
+            SELECT p.id, p.name, p.position, te.event_date, te.to_team
+            FROM scouting.transfer_events te
+            JOIN scouting.players p ON te.player_id = p.id
+            WHERE te.from_team = %s AND te.event_type = 'entered'
+            ORDER BY te.event_date DESC
+            """,
+            (team,),
+        )
+
+        # Incoming (players who committed)
+        await incoming_cur.execute(
+            """
+            SELECT p.id, p.name, p.position, te.event_date, te.from_team
+            FROM scouting.transfer_events te
+            JOIN scouting.players p ON te.player_id = p.id
+            WHERE te.to_team = %s AND te.event_type = 'committed'
+            ORDER BY te.event_date DESC
+            """,
+            (team,),
+        )
+
+        # The first fetch syncs the pipeline; both results arrive together
+        rows = await outgoing_cur.fetchall()
+        columns = [desc[0] for desc in outgoing_cur.description]
+        outgoing = [dict(zip(columns, row)) for row in rows]
+
+        rows = await incoming_cur.fetchall()
+        columns = [desc[0] for desc in incoming_cur.description]
+        incoming = [dict(zip(columns, row)) for row in rows]
 
     return {
         "team": team,
@@ -854,9 +1217,36 @@ async def insert_portal_snapshot(
     return snapshot_id
 
 
+async def refresh_transfer_dest_prior(conn: psycopg.AsyncConnection) -> bool:
+    """Refresh the transfer_dest_prior materialized view (migration 017).
+
+    Returns:
+        False if the view's refresh function doesn't exist yet, else True.
+    """
+    cur = conn.cursor()
+    try:
+        await cur.execute("SELECT scouting.refresh_transfer_dest_prior()")
+    except pg_errors.UndefinedFunction:
+        await conn.rollback()
+        return False
+    await conn.commit()
+    return True
+
+
 # Embedding functions
 
 
+_UPSERT_PLAYER_EMBEDDING_SQL = """
+    INSERT INTO scouting.player_embeddings (roster_id, identity_text, embedding)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (roster_id) DO UPDATE SET
+        identity_text = EXCLUDED.identity_text,
+        embedding = EXCLUDED.embedding,
+        created_at = NOW()
+    RETURNING id
+"""
+
+
 async def upsert_player_embedding(
     conn: psycopg.AsyncConnection,
     roster_id: str,
@@ -875,24 +1265,44 @@ async def upsert_player_embedding(
         The embedding record ID
     """
     cur = conn.cursor()
-    await cur.execute(
-        """
-        INSERT INTO scouting.player_embeddings (roster_id, identity_text, embedding)
-        VALUES (%s, %s, %s)
-        ON CONFLICT (roster_id) DO UPDATE SET
-            identity_text = EXCLUDED.identity_text,
-            embedding = EXCLUDED.embedding,
-            created_at = NOW()
-        RETURNING id
-        """,
-        (roster_id, identity_text, embedding),
-    )
+    await cur.execute(_UPSERT_PLAYER_EMBEDDING_SQL, (roster_id, identity_text, embedding))
     row = await cur.fetchone()
     embedding_id = row[0]
     await conn.commit()
     return embedding_id
 
 
+async def upsert_player_embeddings_bulk(
+    conn: psycopg.AsyncConnection,
+    embeddings: list[dict],
+) -> list[int]:
+    """Upsert many player embeddings in one pipelined batch and a single commit.
+
+    Each dict takes the keyword arguments of upsert_player_embedding.
+
+    Returns:
+        Embedding record IDs in the same order as embeddings.
+    """
+    if not embeddings:
+        return []
+
+    cur = conn.cursor()
+    await cur.executemany(
+        _UPSERT_PLAYER_EMBEDDING_SQL,
+        [(e["roster_id"], e["identity_text"], e["embedding"]) for e in embeddings],
+        returning=True,
+    )
+
+    embedding_ids = []
+    while True:
+        row = await cur.fetchone()
+        embedding_ids.append(row[0])
+        if not cur.nextset():
+            break
+    await conn.commit()
+    return embedding_ids
+
+
 async def get_player_embedding(
     conn: psycopg.AsyncConnection,
     roster_id: str,
@@ -931,7 +1341,9 @@ async def find_similar_by_embedding(
 ) -> list[dict]:
     """Find similar players by embedding vector.
 
-    Uses cosine distance for similarity (lower = more similar).
+    Uses cosine distance for similarity (lower = more similar). Neighbours are
+    found through the half-precision HNSW index (migration 016); reported
+    similarity is computed from the full-precision vectors.
 
     Args:
         conn: Database connection
@@ -958,7 +1370,7 @@ async def find_similar_by_embedding(
         query += " AND roster_id != %s"
         params.append(exclude_roster_id)
 
-    query += " ORDER BY embedding <=> %s::vector LIMIT %s"
+    query += " ORDER BY embedding::halfvec(1536) <=> %s::halfvec(1536) LIMIT %s"
     params.extend([embedding, limit])
 
     await cur.execute(query, params)
@@ -967,6 +1379,185 @@ async def find_similar_by_embedding(
     return [dict(zip(columns, row)) for row in rows]
 
 
+async def find_similar_roster_by_embedding(
+    conn: psycopg.AsyncConnection,
+    embedding: list[float],
+    limit: int = 5,
+) -> list[dict]:
+    """Find similar players by embedding vector, with their roster row.
+
+    Like find_similar_by_embedding, but each result also carries the
+    core.roster columns, so callers need no follow-up lookup per candidate.
+    Candidates whose roster_id has no roster row have roster columns of None.
+
+    Returns:
+        List of dicts with roster_id, identity_text, similarity, and the
+        roster id, first_name, last_name, team, position, year
+    """
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        SELECT e.roster_id, e.identity_text, e.similarity,
+               r.id, r.first_name, r.last_name, r.team, r.position, r.year
+        FROM (
+            SELECT roster_id, identity_text,
+                   1 - (embedding <=> %(embedding)s::vector) AS similarity
+            FROM scouting.player_embeddings
+            ORDER BY embedding::halfvec(1536) <=> %(embedding)s::halfvec(1536)
+            LIMIT %(limit)s
+        ) e
+        LEFT JOIN LATERAL (
+            SELECT id, first_name, last_name, team, position, year
+            FROM core.roster
+            WHERE id = CASE WHEN e.roster_id ~ '^[0-9]+$' THEN e.roster_id::bigint END
+            LIMIT 1
+        ) r ON true
+        ORDER BY e.similarity DESC
+        """,
+        {"embedding": embedding, "limit": limit},
+    )
+    columns = [desc[0] for desc in cur.description]
+    rows = await cur.fetchall()
+    return [dict(zip(columns, row)) for row in rows]
+
+
+async def find_similar_roster_by_embeddings(
+    conn: psycopg.AsyncConnection,
+    embeddings: list[list[float]],
+    limit: int = 5,
+) -> list[list[dict]]:
+    """find_similar_roster_by_embedding for many query vectors in one query.
+
+    Each vector gets its own top-k nearest-neighbour search (a LATERAL join
+    per query row), all in a single round trip.
+
+    Returns:
+        One result list per embedding, in input order, each shaped like
+        find_similar_roster_by_embedding's
+    """
+    if not embeddings:
+        return []
+
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        SELECT q.idx, e.roster_id, e.identity_text, e.similarity,
+               r.id, r.first_name, r.last_name, r.team, r.position, r.year
+        FROM unnest(%(embeddings)s::text[]) WITH ORDINALITY AS q(query_vec, idx)
+        CROSS JOIN LATERAL (
+            SELECT roster_id, identity_text,
+                   1 - (embedding <=> q.query_vec::vector) AS similarity
+            FROM scouting.player_embeddings
+            ORDER BY embedding::halfvec(1536) <=> q.query_vec::halfvec(1536)
+            LIMIT %(limit)s
+        ) e
+        LEFT JOIN LATERAL (
+            SELECT id, first_name, last_name, team, position, year
+            FROM core.roster
+            WHERE id = CASE WHEN e.roster_id ~ '^[0-9]+$' THEN e.roster_id::bigint END
+            LIMIT 1
+        ) r ON true
+        ORDER BY q.idx, e.similarity DESC
+        """,
+        {
+            # pgvector text literals; a float8[][] can't be unnested row-wise
+            "embeddings": ["[" + ",".join(map(str, e)) + "]" for e in embeddings],
+            "limit": limit,
+        },
+    )
+    columns = [desc[0] for desc in cur.description][1:]
+    results: list[list[dict]] = [[] for _ in embeddings]
+    for idx, *row in await cur.fetchall():
+        results[idx - 1].append(dict(zip(columns, row)))
+    return results
+
+
+async def find_similar_by_traits(
+    conn: psycopg.AsyncConnection,
+    player_id: int,
+    limit: int = 5,
+) -> list[dict]:
+    """Find players with the most similar trait vectors.
+
+    Ranks by cosine distance on scouting.players.traits_vec using the HNSW
+    index, so only the top matches leave the database.
+
+    Args:
+        conn: Database connection
+        player_id: Scouting player to compare against (excluded from results)
+        limit: Max results to return
+
+    Returns:
+        List of dicts with player_id, name, team, position, similarity
+    """
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        WITH q AS (
+            SELECT traits_vec FROM scouting.players WHERE id = %s
+        )
+        SELECT
+            p.id AS player_id,
+            p.name,
+            p.team,
+            p.position,
+            1 - (p.traits_vec <=> (SELECT traits_vec FROM q)) AS similarity
+        FROM scouting.players p
+        WHERE p.id != %s
+        AND p.traits_vec IS NOT NULL
+        AND (SELECT traits_vec FROM q) IS NOT NULL
+        ORDER BY p.traits_vec <=> (SELECT traits_vec FROM q)
+        LIMIT %s
+        """,
+        (player_id, player_id, limit),
+    )
+    columns = [desc[0] for desc in cur.description]
+    rows = await cur.fetchall()
+    return [dict(zip(columns, row)) for row in rows]
+
+
+async def get_cached_mentions(
+    conn: psycopg.AsyncConnection,
+    content_hashes: list[bytes],
+) -> dict[bytes, list[dict]]:
+    """Fetch cached extraction results for a batch of report text hashes.
+
+    Returns:
+        Map of content_sha256 -> mentions, for the hashes that are cached.
+    """
+    if not content_hashes:
+        return {}
+    cur = conn.cursor()
+    await cur.execute(
+        """
+        SELECT content_sha256, mentions
+        FROM scouting.mentions_cache
+        WHERE content_sha256 = ANY(%s)
+        """,
+        (content_hashes,),
+    )
+    return {bytes(content_hash): mentions for content_hash, mentions in await cur.fetchall()}
+
+
+async def cache_mentions(
+    conn: psycopg.AsyncConnection,
+    entries: list[tuple[bytes, list[dict]]],
+) -> None:
+    """Store extraction results keyed by report text hash."""
+    if not entries:
+        return
+    cur = conn.cursor()
+    await cur.executemany(
+        """
+        INSERT INTO scouting.mentions_cache (content_sha256, mentions)
+        VALUES (%s, %s)
+        ON CONFLICT (content_sha256) DO NOTHING
+        """,
+        [(content_hash, json.dumps(mentions)) for content_hash, mentions in entries],
+    )
+    await conn.commit()
+
+
 async def insert_pending_link(
     conn: psycopg.AsyncConnection,
     source_name: str,
@@ -1014,10 +1605,27 @@ async def insert_pending_link(
     return link_id
 
 
+# Links with a given status, newest first, in keyset order on the
+# (status, created_at, id) index from migration 018
+_PENDING_LINKS_TEMPLATE = """
+    SELECT id, source_name, source_team, source_context,
+           candidate_roster_id, match_score, match_method,
+           status, created_at
+    FROM scouting.pending_links
+    WHERE status = %s
+    {keyset}
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+"""
+_PENDING_LINKS_SQL = _PENDING_LINKS_TEMPLATE.format(keyset="")
+_PENDING_LINKS_AFTER_SQL = _PENDING_LINKS_TEMPLATE.format(keyset="AND (created_at, id) < (%s, %s)")
+
+
 async def get_pending_links(
     conn: psycopg.AsyncConnection,
     status: str = "pending",
     limit: int = 100,
+    after: tuple[datetime, int] | None = None,
 ) -> list[dict]:
     """Get pending links for review.
 
@@ -1025,23 +1633,19 @@ async def get_pending_links(
         conn: Database connection
         status: Filter by status ('pending', 'approved', 'rejected')
         limit: Max results
+        after: Keyset cursor, the (created_at, id) of the last link from the
+            previous page
 
     Returns:
         List of pending link dicts
     """
+    if after is None:
+        sql, params = _PENDING_LINKS_SQL, (status, limit)
+    else:
+        sql, params = _PENDING_LINKS_AFTER_SQL, (status, *after, limit)
+
     cur = conn.cursor()
-    await cur.execute(
-        """
-        SELECT id, source_name, source_team, source_context,
-               candidate_roster_id, match_score, match_method,
-               status, created_at
-        FROM scouting.pending_links
-        WHERE status = %s
-        ORDER BY created_at DESC
-        LIMIT %s
-        """,
-        (status, limit),
-    )
+    await cur.execute(sql, params)
     columns = [desc[0] for desc in cur.description]
     rows = await cur.fetchall()
     return [dict(zip(columns, row)) for row in rows]
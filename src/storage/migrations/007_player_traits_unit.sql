@@ -0,0 +1,27 @@
+-- Persist each player's trait vector pre-normalized to unit length
+-- Cosine similarity against a unit query vector is then a plain dot product.
+-- Key order must match TRAIT_CATEGORIES in src/processing/comparison.py
+
+CREATE OR REPLACE FUNCTION scouting.trait_unit_vector(traits JSONB)
+RETURNS DOUBLE PRECISION[]
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT array_agg(v / norm ORDER BY i)
+  FROM (
+    SELECT k.i, v.v, sqrt(sum(v.v * v.v) OVER ()) AS norm
+    FROM unnest(ARRAY[
+      'arm_strength', 'accuracy', 'mobility', 'decision_making', 'leadership',
+      'athleticism', 'technique', 'football_iq', 'consistency', 'upside'
+    ]) WITH ORDINALITY AS k(key, i),
+    LATERAL (SELECT COALESCE((traits->>k.key)::float8, 0) AS v) v
+  ) s
+  WHERE norm > 0;
+$$;
+
+COMMENT ON FUNCTION scouting.trait_unit_vector(JSONB) IS
+  'Trait vector scaled to unit length, or NULL when every trait is 0/missing.';
+
+ALTER TABLE scouting.players
+    ADD COLUMN IF NOT EXISTS traits_unit DOUBLE PRECISION[]
+    GENERATED ALWAYS AS (scouting.trait_unit_vector(traits)) STORED;
@@ -0,0 +1,11 @@
+-- pgvector copy of the unit trait vector for indexed top-K similarity
+-- Reuses scouting.trait_unit_vector() from migration 007
+
+ALTER TABLE scouting.players
+    ADD COLUMN IF NOT EXISTS traits_vec vector(10)
+    GENERATED ALWAYS AS (scouting.trait_unit_vector(traits)::vector(10)) STORED;
+
+-- HNSW index for fast cosine similarity search
+CREATE INDEX IF NOT EXISTS idx_players_traits_vec_hnsw
+    ON scouting.players
+    USING hnsw (traits_vec vector_cosine_ops);
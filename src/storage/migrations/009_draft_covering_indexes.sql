@@ -0,0 +1,12 @@
+-- Covering indexes for the batched draft board inputs
+-- Let latest-grade (DISTINCT ON) and trend lookups run as index-only scans
+
+-- Latest PFF grade per player, in DISTINCT ON order
+CREATE INDEX IF NOT EXISTS idx_pff_grades_player_latest
+    ON scouting.pff_grades (player_id, season DESC, week DESC NULLS FIRST)
+    INCLUDE (overall_grade);
+
+-- Chronological timeline grades per player
+CREATE INDEX IF NOT EXISTS idx_timeline_player_date_grade
+    ON scouting.player_timeline (player_id, snapshot_date)
+    INCLUDE (grade_at_time);
@@ -0,0 +1,8 @@
+-- Grading state: fingerprint of the reports each player was last graded on
+-- Lets the grading pipeline skip players whose reports haven't changed
+
+CREATE TABLE IF NOT EXISTS scouting.player_grading_state (
+    player_id INT PRIMARY KEY REFERENCES scouting.players(id) ON DELETE CASCADE,
+    reports_fingerprint TEXT NOT NULL,
+    graded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,5 @@
+-- Keyset index for the grading queue
+-- get_players_needing_update pages through players by (last_updated, id)
+
+CREATE INDEX IF NOT EXISTS idx_players_last_updated_id
+    ON scouting.players (last_updated, id);
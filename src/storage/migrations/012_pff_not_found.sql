@@ -0,0 +1,8 @@
+-- Negative cache for PFF lookups
+-- Players PFF had no grade for; the PFF pipeline skips them until the entry
+-- is older than 30 days
+
+CREATE TABLE IF NOT EXISTS scouting.pff_not_found (
+    player_id INT PRIMARY KEY REFERENCES scouting.players(id) ON DELETE CASCADE,
+    checked_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,8 @@
+-- Claude mention extraction cache
+-- Keyed by sha256 of the report text so unchanged texts are never re-extracted
+
+CREATE TABLE IF NOT EXISTS scouting.mentions_cache (
+    content_sha256 BYTEA PRIMARY KEY,
+    mentions JSONB NOT NULL,
+    extracted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,11 @@
+-- Trigram indexes for fuzzy player name matching
+-- find_roster_match / find_recruit_match pre-filter and rank candidates by
+-- pg_trgm similarity instead of scanning every row for a team or year
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_roster_full_name_trgm
+    ON core.roster USING gin (LOWER(first_name || ' ' || last_name) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_recruits_name_trgm
+    ON recruiting.recruits USING gin (LOWER(name) gin_trgm_ops);
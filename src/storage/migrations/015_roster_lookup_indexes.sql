@@ -0,0 +1,15 @@
+-- Indexes for roster and recruit lookups in player matching
+-- Turn the per-mention roster scans into index lookups
+
+-- Exact name + team + year (find_deterministic_match / find_deterministic_matches)
+CREATE INDEX IF NOT EXISTS idx_roster_year_team_name
+    ON core.roster (year, LOWER(team), LOWER(first_name || ' ' || last_name));
+
+-- Team/position-filtered candidates (find_roster_match / find_roster_matches)
+CREATE INDEX IF NOT EXISTS idx_roster_year_team_position
+    ON core.roster (year, LOWER(team), UPPER(position))
+    INCLUDE (id, first_name, last_name, team, position);
+
+-- athlete_id links (find_deterministic_match_by_athlete_id)
+CREATE INDEX IF NOT EXISTS idx_recruits_athlete_id
+    ON recruiting.recruits (athlete_id);
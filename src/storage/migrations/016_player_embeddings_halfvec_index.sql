@@ -0,0 +1,9 @@
+-- Half-precision HNSW index for player embedding search (pgvector >= 0.7)
+-- Stored vectors stay full precision; the index holds FP16 copies, halving
+-- the bytes read per node visited. Queries order by the same expression.
+
+CREATE INDEX IF NOT EXISTS idx_player_embeddings_hnsw_half
+    ON scouting.player_embeddings
+    USING hnsw ((embedding::halfvec(1536)) halfvec_cosine_ops);
+
+DROP INDEX IF EXISTS scouting.idx_player_embeddings_hnsw;
@@ -0,0 +1,38 @@
+-- Transfer destination prior: committed transfers counted per
+-- (position, from_team, to_team) for predict_destination()
+-- Refreshed by generate_portal_snapshot() after each daily snapshot, or
+-- manually via scouting.refresh_transfer_dest_prior()
+-- Rows without a position or origin team are left out; they never match
+-- predict_destination's filters
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS scouting.transfer_dest_prior AS
+SELECT
+  UPPER(p.position) AS position,
+  te.from_team,
+  te.to_team,
+  COUNT(*) AS transfer_count
+FROM scouting.transfer_events te
+JOIN scouting.players p ON te.player_id = p.id
+WHERE te.event_type = 'committed'
+  AND te.to_team IS NOT NULL
+  AND te.from_team IS NOT NULL
+  AND p.position IS NOT NULL
+GROUP BY UPPER(p.position), te.from_team, te.to_team;
+
+-- Unique key (required for REFRESH ... CONCURRENTLY); leads with position
+-- for the predict_destination lookup
+CREATE UNIQUE INDEX IF NOT EXISTS idx_transfer_dest_prior_key
+  ON scouting.transfer_dest_prior (position, from_team, to_team);
+
+CREATE OR REPLACE FUNCTION scouting.refresh_transfer_dest_prior()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+  REFRESH MATERIALIZED VIEW CONCURRENTLY scouting.transfer_dest_prior;
+END;
+$$;
+
+COMMENT ON FUNCTION scouting.refresh_transfer_dest_prior() IS
+  'Refreshes transfer_dest_prior materialized view. Uses CONCURRENTLY to avoid locking reads.';
@@ -0,0 +1,11 @@
+-- Keyset indexes for the report and pending-link queues
+-- get_unprocessed_reports reads unprocessed reports in (crawled_at, id)
+-- order; get_pending_links pages by (created_at, id)
+-- newest first within a status
+
+CREATE INDEX IF NOT EXISTS idx_reports_unprocessed_crawled
+    ON scouting.reports (crawled_at, id)
+    WHERE processed_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_pending_links_status_created
+    ON scouting.pending_links (status, created_at DESC, id DESC);
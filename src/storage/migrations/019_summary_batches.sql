@@ -0,0 +1,15 @@
+-- Message Batches submissions awaiting results
+-- Recorded when a summary batch is submitted so a later run can collect a
+-- batch whose process died or gave up waiting, instead of paying for the same
+-- reports again; report_ids[i] is the report with custom_id i
+
+CREATE TABLE IF NOT EXISTS scouting.summary_batches (
+    batch_id TEXT PRIMARY KEY,
+    report_ids INT[] NOT NULL,
+    submitted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    completed_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_summary_batches_open
+    ON scouting.summary_batches (submitted_at)
+    WHERE completed_at IS NULL;
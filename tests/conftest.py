@@ -37,6 +37,21 @@ def _make_anthropic_response(text: str) -> MagicMock:
 
 # Default mock responses keyed by prompt substring for routing
 _ANTHROPIC_RESPONSES: dict[str, str] = {
+    # entity_extraction: extract_player_mentions_claude_batch (must precede the
+    # single-text prompt, which is a prefix of this one)
+    "Extract all college football player names mentioned in each document": json.dumps(
+        {
+            "0": [
+                {
+                    "name": "Arch Manning",
+                    "position": "QB",
+                    "team": "Texas",
+                    "context": "starter",
+                }
+            ],
+            "1": [],
+        }
+    ),
     # entity_extraction: extract_player_mentions_claude
     "Extract all college football player names": json.dumps(
         [
@@ -48,8 +63,6 @@ _ANTHROPIC_RESPONSES: dict[str, str] = {
             }
         ]
     ),
-    # summarizer: extract_sentiment
-    "Analyze the sentiment": "0.65",
     # summarizer: summarize_report
     "Analyze this college football content": json.dumps(
         {
@@ -72,8 +85,31 @@ _ANTHROPIC_RESPONSES: dict[str, str] = {
 }
 
 
+def _make_anthropic_tool_response(name: str, tool_input: dict) -> MagicMock:
+    """Build a mock anthropic.types.Message with a single ToolUseBlock."""
+    block = MagicMock()
+    block.type = "tool_use"
+    block.name = name
+    block.input = tool_input
+    response = MagicMock()
+    response.content = [block]
+    return response
+
+
+# Forced tool-call responses keyed by tool name
+_ANTHROPIC_TOOL_RESPONSES: dict[str, dict] = {
+    # summarizer: extract_sentiment
+    "record_sentiment": {"sentiment": 0.65},
+}
+
+
 def _route_anthropic_response(**kwargs) -> MagicMock:
-    """Return a mock response based on the prompt content."""
+    """Return a mock response based on the forced tool or prompt content."""
+    tool_choice = kwargs.get("tool_choice") or {}
+    if tool_choice.get("name") in _ANTHROPIC_TOOL_RESPONSES:
+        name = tool_choice["name"]
+        return _make_anthropic_tool_response(name, _ANTHROPIC_TOOL_RESPONSES[name])
+
     messages = kwargs.get("messages", [])
     prompt = messages[0]["content"] if messages else ""
     for key, text in _ANTHROPIC_RESPONSES.items():
@@ -92,6 +128,8 @@ def mock_anthropic():
     """
     mock_client = MagicMock()
     mock_client.messages.create = AsyncMock(side_effect=_route_anthropic_response)
+    # Per-call option overrides (e.g. a longer timeout) use the same mock
+    mock_client.with_options.return_value = mock_client
 
     targets = [
         "src.processing.entity_extraction.get_anthropic_client",
@@ -125,10 +163,14 @@ def _make_openai_embedding_response(dims: int = 1536) -> MagicMock:
 def mock_openai():
     """Auto-mock all OpenAI API calls so tests never hit the real API.
 
-    Patches the lazy _get_client in embeddings.py.
+    Patches the lazy _get_client in embeddings.py and starts each test with an
+    empty embedding cache.
     """
     mock_client = MagicMock()
     mock_client.embeddings.create = AsyncMock(return_value=_make_openai_embedding_response())
 
-    with patch("src.processing.embeddings._get_client", return_value=mock_client):
+    with (
+        patch("src.processing.embeddings._get_client", return_value=mock_client),
+        patch.dict("src.processing.embeddings._embedding_cache", clear=True),
+    ):
         yield mock_client
@@ -1,9 +1,26 @@
 """Tests for player comparison engine."""
 
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+from psycopg import errors as pg_errors
+
 from src.processing.comparison import (
+    _top_k,
     build_radar_data,
+    find_similar_players,
 )
 
+SAMPLE_PLAYER = {
+    "id": 1,
+    "name": "Arch Manning",
+    "team": "Texas",
+    "position": "QB",
+    "roster_player_id": None,
+    "traits": {"arm_strength": 8, "accuracy": 7},
+}
+
 
 def test_build_radar_data():
     """Test building radar chart data."""
@@ -31,3 +48,101 @@ def test_build_radar_data_normalizes():
     traits = {"speed": 95}  # If somehow > 10
     result = build_radar_data(traits, max_value=100)
     assert result[0]["value"] == 9.5  # Normalized to 10-scale
+
+
+def test_top_k_orders_best_first():
+    """Test top-K selection returns the highest scores in descending order."""
+    scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3])
+    assert _top_k(scores, 3).tolist() == [1, 3, 2]
+
+
+def test_top_k_limit_exceeds_size():
+    """Test top-K with a limit larger than the candidate set, or none at all."""
+    assert _top_k(np.array([0.2, 0.8]), 5).tolist() == [1, 0]
+    assert _top_k(np.array([]), 5).tolist() == []
+    assert _top_k(np.array([0.2, 0.8]), 0).tolist() == []
+
+
+def _make_mock_conn(rows=None):
+    """Build a mock async connection whose cursor streams the given rows."""
+    mock_cursor = MagicMock()
+    mock_cursor.execute = AsyncMock()
+    mock_cursor.fetchmany = AsyncMock(side_effect=[rows or [], []])
+    mock_cursor.close = AsyncMock()
+
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_conn.rollback = AsyncMock()
+    return mock_conn
+
+
+async def test_find_similar_players_uses_trait_vectors():
+    """Without an embedding, ranking is delegated to the pgvector trait index."""
+    mock_conn = _make_mock_conn()
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    similar = [
+        {
+            "player_id": 2,
+            "name": "Carson Beck",
+            "team": "Miami",
+            "position": "QB",
+            "similarity": 0.98765,
+        }
+    ]
+    with (
+        patch("src.processing.comparison.get_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.comparison.get_scouting_player",
+            new_callable=AsyncMock,
+            return_value=SAMPLE_PLAYER,
+        ),
+        patch(
+            "src.processing.comparison.find_similar_by_traits",
+            new_callable=AsyncMock,
+            return_value=similar,
+        ) as mock_find,
+    ):
+        result = await find_similar_players(1, limit=3)
+
+    mock_find.assert_awaited_once_with(mock_conn, 1, limit=3)
+    assert result == [{**similar[0], "similarity": 0.988}]
+    mock_conn.rollback.assert_not_awaited()
+
+
+async def test_find_similar_players_falls_back_without_trait_vectors():
+    """If traits_vec is missing, candidates are ranked in Python from traits_unit."""
+    rows = [
+        (1, "Arch Manning", "Texas", "QB", [0.75, 0.66] + [0.0] * 8),
+        (2, "Carson Beck", "Miami", "QB", [0.6, 0.8] + [0.0] * 8),
+        (3, "Quinn Ewers", "Texas", "QB", [1.0] + [0.0] * 9),
+    ]
+    mock_conn = _make_mock_conn(rows)
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with (
+        patch("src.processing.comparison.get_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.comparison.get_scouting_player",
+            new_callable=AsyncMock,
+            return_value=SAMPLE_PLAYER,
+        ),
+        patch(
+            "src.processing.comparison.find_similar_by_traits",
+            new_callable=AsyncMock,
+            side_effect=pg_errors.UndefinedColumn("column traits_vec does not exist"),
+        ),
+        patch("src.processing.comparison._trait_matrix", None),
+    ):
+        result = await find_similar_players(1, limit=5)
+
+    mock_conn.rollback.assert_awaited_once()
+    # The queried player is excluded from its own results
+    assert [r["player_id"] for r in result] == [2, 3]
+    assert result[0]["similarity"] > result[1]["similarity"]
@@ -1,6 +1,12 @@
 # tests/test_db.py
 """Tests for database connection."""
 
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from psycopg import errors as pg_errors
+
+from src.storage import db
 from src.storage.db import get_connection, insert_report
 
 
@@ -32,3 +38,167 @@ async def test_insert_report_creates_record():
         cur = conn.cursor()
         await cur.execute("DELETE FROM scouting.reports WHERE id = %s", (report_id,))
         await conn.commit()
+
+
+async def test_init_pool_uses_read_url_for_read_pool(monkeypatch):
+    """The read pool connects to DATABASE_READ_URL when set, read-only."""
+    monkeypatch.setenv("DATABASE_URL", "postgres://primary/db")
+    monkeypatch.setenv("DATABASE_READ_URL", "postgres://replica/db")
+    monkeypatch.setattr(db, "_pool", None)
+    monkeypatch.setattr(db, "_read_pool", None)
+
+    with patch("src.storage.db.AsyncConnectionPool") as mock_pool_cls:
+        mock_pool_cls.return_value = MagicMock(open=AsyncMock())
+        await db.init_pool()
+
+    write_call, read_call = mock_pool_cls.call_args_list
+    assert write_call.kwargs["conninfo"] == "postgres://primary/db"
+    assert read_call.kwargs["conninfo"] == "postgres://replica/db"
+    assert read_call.kwargs["configure"] is db._configure_read_only
+
+
+async def test_get_unprocessed_reports_one_query_oldest_first():
+    """One plain fetch of up to limit rows, oldest first, one dict per row."""
+    rows = [(1, "https://a.com", "reddit", "forum", "text", [], ["Texas"])]
+    mock_cursor = MagicMock()
+    mock_cursor.execute = AsyncMock()
+    mock_cursor.fetchall = AsyncMock(return_value=rows)
+    mock_cursor.description = [
+        ("id",),
+        ("source_url",),
+        ("source_name",),
+        ("content_type",),
+        ("raw_text",),
+        ("player_ids",),
+        ("team_ids",),
+    ]
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    reports = await db.get_unprocessed_reports(mock_conn, limit=5)
+
+    mock_conn.cursor.assert_called_once_with()
+    sql, params = mock_cursor.execute.call_args.args
+    assert "ORDER BY crawled_at, id" in sql
+    assert params == (5,)
+    assert reports == [
+        {
+            "id": 1,
+            "source_url": "https://a.com",
+            "source_name": "reddit",
+            "content_type": "forum",
+            "raw_text": "text",
+            "player_ids": [],
+            "team_ids": ["Texas"],
+        }
+    ]
+
+
+async def test_link_report_to_players_single_update():
+    """All player IDs are linked by one UPDATE, deduplicated in order."""
+    mock_cursor = AsyncMock()
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_conn.commit = AsyncMock()
+
+    await db.link_report_to_players(mock_conn, report_id=5, player_ids=[3, 1, 3])
+
+    mock_cursor.execute.assert_awaited_once()
+    sql, params = mock_cursor.execute.call_args.args
+    assert "UPDATE scouting.reports" in sql
+    assert params == ([3, 1], 5)
+    mock_conn.commit.assert_awaited_once()
+
+
+async def test_upsert_scouting_players_bulk_locks_in_key_order():
+    """Rows are upserted in (name, team, class_year) order; ids come back in input order."""
+    mock_cursor = MagicMock()
+    mock_cursor.executemany = AsyncMock()
+    mock_cursor.fetchone = AsyncMock(side_effect=[(1,), (2,), (3,)])
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_conn.commit = AsyncMock()
+
+    players = [
+        {"name": "Quinn Ewers", "team": "Texas", "class_year": 2025},
+        {"name": "Arch Manning", "team": "Texas", "class_year": 2025},
+        {"name": "Arch Manning", "team": "Georgia"},
+    ]
+    player_ids = await db.upsert_scouting_players_bulk(mock_conn, players)
+
+    sent = mock_cursor.executemany.call_args.args[1]
+    assert [(p[0], p[1]) for p in sent] == [
+        ("Arch Manning", "Georgia"),
+        ("Arch Manning", "Texas"),
+        ("Quinn Ewers", "Texas"),
+    ]
+    assert player_ids == [3, 2, 1]
+    mock_conn.commit.assert_awaited_once()
+
+
+async def test_get_team_transfer_activity_pipelines_both_queries():
+    """Outgoing and incoming queries are both sent inside one pipeline."""
+    events = []
+
+    def make_cursor(name, rows, description):
+        cur = MagicMock()
+        cur.execute = AsyncMock(side_effect=lambda *a: events.append(f"execute {name}"))
+        cur.fetchall = AsyncMock(side_effect=lambda: events.append(f"fetch {name}") or rows)
+        cur.description = description
+        return cur
+
+    columns = [("id",), ("name",), ("position",), ("event_date",)]
+    outgoing_cur = make_cursor(
+        "outgoing", [(1, "A", "QB", "2026-01-05", "Miami")], columns + [("to_team",)]
+    )
+    incoming_cur = make_cursor("incoming", [], columns + [("from_team",)])
+
+    pipeline = MagicMock()
+    pipeline.__aenter__ = AsyncMock(side_effect=lambda *a: events.append("pipeline"))
+    pipeline.__aexit__ = AsyncMock(return_value=None)
+    mock_conn = MagicMock()
+    mock_conn.cursor.side_effect = [outgoing_cur, incoming_cur]
+    mock_conn.pipeline.return_value = pipeline
+
+    activity = await db.get_team_transfer_activity(mock_conn, "Texas")
+
+    assert events == [
+        "pipeline",
+        "execute outgoing",
+        "execute incoming",
+        "fetch outgoing",
+        "fetch incoming",
+    ]
+    assert activity["outgoing"][0]["to_team"] == "Miami"
+    assert activity["incoming"] == []
+    assert activity["net"] == -1
+
+
+async def test_get_pending_links_keyset_page():
+    """Passing after continues below the last (created_at, id) seen."""
+    mock_cursor = AsyncMock()
+    mock_cursor.description = [("id",), ("created_at",)]
+    mock_cursor.fetchall.return_value = []
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    last = datetime(2026, 1, 5, 12, 0)
+    await db.get_pending_links(mock_conn, status="pending", limit=50, after=(last, 42))
+
+    sql, params = mock_cursor.execute.call_args.args
+    assert "(created_at, id) < (%s, %s)" in sql
+    assert params == ("pending", last, 42, 50)
+
+
+async def test_refresh_transfer_dest_prior_missing_view():
+    """Without migration 017 the refresh rolls back and reports False."""
+    mock_cursor = AsyncMock()
+    mock_cursor.execute.side_effect = pg_errors.UndefinedFunction("missing")
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_conn.rollback = AsyncMock()
+    mock_conn.commit = AsyncMock()
+
+    assert await db.refresh_transfer_dest_prior(mock_conn) is False
+    mock_conn.rollback.assert_awaited_once()
+    mock_conn.commit.assert_not_awaited()
@@ -1,7 +1,10 @@
 """Tests for draft board functionality."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 from src.processing.draft import (
     DraftProjection,
+    _build_draft_players,
     calculate_draft_score,
 )
 
@@ -30,3 +33,28 @@ def test_draft_projection_enum():
     """Test DraftProjection values."""
     assert DraftProjection.FIRST_ROUND.value == "1st Round"
     assert DraftProjection.UDFA.value == "UDFA"
+
+
+async def test_build_draft_players_scores_and_sorts():
+    """Rows are scored with batch-loaded inputs and sorted by draft score."""
+    rows = [
+        (1, "Carson Beck", "QB", "Miami", 2025, 70, "active"),
+        (2, "Arch Manning", "QB", None, 2026, 90, "active"),
+    ]
+    inputs = {2: (88.0, 1.0, "rising")}
+
+    with patch(
+        "src.processing.draft._batch_load_draft_inputs",
+        new_callable=AsyncMock,
+        return_value=inputs,
+    ) as mock_load:
+        players = await _build_draft_players(MagicMock(), rows)
+
+    mock_load.assert_awaited_once()
+    assert mock_load.call_args[0][1] == [1, 2]
+    assert [p.player_id for p in players] == [2, 1]
+    assert players[0].team == "Unknown"
+    assert players[0].pff_grade == 88.0
+    assert players[0].trend_direction == "rising"
+    assert players[1].pff_grade is None
+    assert players[1].trend_direction == "unknown"
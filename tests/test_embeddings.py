@@ -1,11 +1,17 @@
 """Tests for player embedding generation."""
 
+from array import array
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.processing.embeddings import (
     EmbeddingResult,
+    _embedding_cache,
     build_identity_text,
+    generate_cached_embeddings,
     generate_embedding,
+    generate_embeddings,
 )
 
 
@@ -62,10 +68,63 @@ async def test_generate_embedding_calls_openai(mock_openai):
 
     mock_openai.embeddings.create.assert_called_once_with(
         model="text-embedding-3-small",
-        input="test text",
+        input=["test text"],
     )
 
 
+@pytest.mark.asyncio
+async def test_generate_embedding_caches_repeat_text(mock_openai):
+    """Repeat identity texts are served from the cache without an API call."""
+    first = await generate_embedding("Arch Manning | QB | Texas | 2025")
+    second = await generate_embedding("Arch Manning | QB | Texas | 2025")
+
+    assert mock_openai.embeddings.create.await_count == 1
+    assert second.embedding == first.embedding
+    # Cached as a compact float32 array, not a list of Python floats
+    assert isinstance(_embedding_cache["Arch Manning | QB | Texas | 2025"], array)
+
+    await generate_embedding("Quinn Ewers | QB | Texas | 2025")
+    assert mock_openai.embeddings.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_cached_embeddings_embeds_only_misses(mock_openai):
+    """Cached texts skip the API; new texts are embedded once and cached."""
+
+    def _respond(model, input):
+        return MagicMock(data=[MagicMock(index=i, embedding=[0.5]) for i in range(len(input))])
+
+    mock_openai.embeddings.create.side_effect = _respond
+
+    await generate_embedding("a")
+    results = await generate_cached_embeddings(["b", "a", "b"])
+
+    assert mock_openai.embeddings.create.await_count == 2
+    assert mock_openai.embeddings.create.call_args.kwargs["input"] == ["b"]
+    assert [r.identity_text for r in results] == ["b", "a", "b"]
+    assert [r.embedding for r in results] == [[0.5], [0.5], [0.5]]
+    assert list(_embedding_cache) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_generate_embeddings_batches_and_preserves_order(mock_openai):
+    """Test that texts are chunked per request and results keep input order."""
+
+    def _respond(model, input):
+        # Return items out of order; index says where each belongs
+        data = [MagicMock(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)]
+        return MagicMock(data=list(reversed(data)))
+
+    mock_openai.embeddings.create.side_effect = _respond
+
+    texts = ["a", "bb", "ccc"]
+    results = await generate_embeddings(texts, batch_size=2)
+
+    assert mock_openai.embeddings.create.await_count == 2
+    assert [r.identity_text for r in results] == texts
+    assert [r.embedding for r in results] == [[1.0], [2.0], [3.0]]
+
+
 # Database function tests
 
 
@@ -2,9 +2,11 @@
 
 import pytest
 
+from src.clients.anthropic import LONG_REQUEST_TIMEOUT
 from src.processing.entity_extraction import (
     extract_player_mentions,
     extract_player_mentions_claude,
+    extract_player_mentions_claude_batch,
     normalize_name,
 )
 
@@ -39,6 +41,29 @@ def test_extract_player_mentions_handles_positions():
     assert any("blue" in p.lower() for p in players)
 
 
+def test_extract_player_mentions_position_case():
+    """Position prefixes match any case, but lowercase words end the name."""
+    text = "Texas qb Arch Manning continues to impress in practice."
+    players = extract_player_mentions(text)
+
+    assert "Arch Manning" in players
+    assert not any("continues" in p for p in players)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Michigan Edge Josaiah Stewart", ["Josaiah Stewart"]),
+        ("The Edge John Smith", ["John Smith"]),
+        ("Alabama Ath Ryan Williams", ["Ryan Williams"]),
+        ("Georgia Edge Jalon Walker had a sack.", ["Jalon Walker"]),
+    ],
+)
+def test_extract_player_mentions_position_after_skip_word(text, expected):
+    """A title-case position after a skip word still yields the name after it."""
+    assert extract_player_mentions(text) == expected
+
+
 @pytest.mark.asyncio
 async def test_extract_player_mentions_claude(mock_anthropic):
     """Test Claude-based player extraction returns structured results."""
@@ -64,3 +89,68 @@ async def test_extract_player_mentions_claude_empty_text(mock_anthropic):
 
     results = await extract_player_mentions_claude("")
     assert results == []
+
+
+@pytest.mark.asyncio
+async def test_extract_player_mentions_claude_batch(mock_anthropic):
+    """Test batched Claude extraction returns one mention list per text in one call."""
+    texts = ["Texas QB Arch Manning had a great spring practice.", "No players here."]
+    results = await extract_player_mentions_claude_batch(texts)
+
+    assert len(results) == 2
+    assert results[0][0]["name"] == "Arch Manning"
+    assert results[1] == []
+    mock_anthropic.messages.create.assert_called_once()
+    prompt = mock_anthropic.messages.create.call_args.kwargs["messages"][0]["content"]
+    assert '<doc i="0">' in prompt and '<doc i="1">' in prompt
+    # Thousands of output tokens in one reply need the long timeout
+    mock_anthropic.with_options.assert_called_once_with(timeout=LONG_REQUEST_TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_extract_player_mentions_claude_batch_isolates_bad_doc(mock_anthropic):
+    """Test a malformed document entry only fails that document."""
+    from tests.conftest import _make_anthropic_response
+
+    mock_anthropic.messages.create.side_effect = None
+    mock_anthropic.messages.create.return_value = _make_anthropic_response(
+        '{"0": "n/a", "1": [{"name": "Quinn Ewers", "position": "QB",'
+        ' "team": "Texas", "context": "general"}]}'
+    )
+
+    results = await extract_player_mentions_claude_batch(["a", "b"])
+    assert results[0] is None
+    assert results[1][0]["name"] == "Quinn Ewers"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("reply", "expected"),
+    [
+        ("not json", [None, None]),
+        ('[{"name": "Quinn Ewers"}]', [None, None]),
+        ('{"1": []}', [None, []]),
+    ],
+)
+async def test_extract_player_mentions_claude_batch_marks_failed_docs(
+    mock_anthropic, reply, expected
+):
+    """Unparseable replies and missing doc keys are None, never an empty list."""
+    from tests.conftest import _make_anthropic_response
+
+    mock_anthropic.messages.create.side_effect = None
+    mock_anthropic.messages.create.return_value = _make_anthropic_response(reply)
+
+    assert await extract_player_mentions_claude_batch(["a", "b"]) == expected
+
+
+@pytest.mark.asyncio
+async def test_extract_player_mentions_claude_unparseable_raises(mock_anthropic):
+    """An unparseable reply is a failed extraction, not an empty one."""
+    from tests.conftest import _make_anthropic_response
+
+    mock_anthropic.messages.create.side_effect = None
+    mock_anthropic.messages.create.return_value = _make_anthropic_response("Sorry, no.")
+
+    with pytest.raises(ValueError):
+        await extract_player_mentions_claude("Texas QB Arch Manning")
@@ -1,9 +1,20 @@
 """Tests for entity linking pipeline."""
 
+import asyncio
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, MagicMock, patch
-
-from src.processing.entity_linking import link_report_entities, run_entity_linking
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.processing.embeddings import EmbeddingResult
+from src.processing.entity_extraction import CLAUDE_BATCH_SIZE
+from src.processing.entity_linking import (
+    EXTRACTION_CONCURRENCY,
+    LINKING_CONCURRENCY,
+    _content_hash,
+    link_report_entities,
+    run_entity_linking,
+)
 from src.processing.player_matching import PlayerMatch
 
 # ---------------------------------------------------------------------------
@@ -58,20 +69,71 @@ def _roster_match(**overrides) -> PlayerMatch:
     return PlayerMatch(**defaults)
 
 
+def _bulk_upsert_returning(player_id: int) -> AsyncMock:
+    """Mock upsert_scouting_players_bulk returning player_id for every row."""
+    return AsyncMock(side_effect=lambda conn, players: [player_id] * len(players))
+
+
+def _reviewed(result: tuple) -> AsyncMock:
+    """Mock match_players_with_review returning result for every query."""
+    return AsyncMock(side_effect=lambda queries, **kwargs: [result] * len(queries))
+
+
+def _reviewed_queries(mock_match: AsyncMock) -> list[tuple]:
+    """(name, team, position) queries passed to the (single) batch match call."""
+    mock_match.assert_awaited_once()
+    return mock_match.call_args.args[0]
+
+
+def _upserted(mock_upsert: AsyncMock) -> list[dict]:
+    """Player dicts passed to the (single) bulk upsert call."""
+    mock_upsert.assert_awaited_once()
+    return mock_upsert.call_args.args[1]
+
+
 # ---------------------------------------------------------------------------
 # link_report_entities tests
 # ---------------------------------------------------------------------------
 
 _LINK_PATCHES = {
     "conn": "src.processing.entity_linking.get_connection",
-    "upsert": "src.processing.entity_linking.upsert_scouting_player",
-    "link": "src.processing.entity_linking.link_report_to_player",
+    "deterministic": "src.processing.entity_linking.find_deterministic_matches",
+    "upsert": "src.processing.entity_linking.upsert_scouting_players_bulk",
+    "link": "src.processing.entity_linking.link_report_to_players",
     "regex": "src.processing.entity_linking.extract_player_mentions",
     "claude": "src.processing.entity_linking.extract_player_mentions_claude",
-    "match": "src.processing.entity_linking.match_player_with_review",
+    "match": "src.processing.entity_linking.match_players_with_review",
 }
 
 
+@pytest.fixture(autouse=True)
+def mock_mentions_cache():
+    """Empty mentions cache by default; writes are recorded, not stored."""
+    with (
+        patch(
+            "src.processing.entity_linking._load_cached_mentions",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as mock_load,
+        patch(
+            "src.processing.entity_linking._store_cached_mentions",
+            new_callable=AsyncMock,
+        ) as mock_store,
+    ):
+        yield mock_load, mock_store
+
+
+@pytest.fixture(autouse=True)
+def mock_deterministic_matches():
+    """No exact roster hits by default; every mention goes to match_players_with_review."""
+    with patch(
+        _LINK_PATCHES["deterministic"],
+        new_callable=AsyncMock,
+        return_value={},
+    ) as mock_deterministic:
+        yield mock_deterministic
+
+
 async def test_link_report_entities_regex_extraction():
     """Regex mode extracts names, no match found -> creates unlinked players."""
     report = _make_report()
@@ -79,24 +141,22 @@ async def test_link_report_entities_regex_extraction():
     with (
         patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx) as _,
         patch(_LINK_PATCHES["regex"], return_value=["Arch Manning", "Quinn Ewers"]) as mock_regex,
-        patch(
-            _LINK_PATCHES["match"],
-            new_callable=AsyncMock,
-            return_value=(None, None),
-        ) as mock_match,
-        patch(_LINK_PATCHES["upsert"], new_callable=AsyncMock, return_value=10) as mock_upsert,
+        patch(_LINK_PATCHES["match"], new=_reviewed((None, None))) as mock_match,
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(10)) as mock_upsert,
         patch(_LINK_PATCHES["link"], new_callable=AsyncMock) as mock_link,
     ):
         result = await link_report_entities(report, use_claude=False)
 
     assert result == [10, 10]
     mock_regex.assert_called_once_with(report["raw_text"])
-    assert mock_match.call_count == 2
-    assert mock_upsert.call_count == 2
-    assert mock_link.call_count == 2
+    # Both misses are matched in one batch call
+    assert [q[0] for q in _reviewed_queries(mock_match)] == ["Arch Manning", "Quinn Ewers"]
+    assert len(_upserted(mock_upsert)) == 2
+    # One UPDATE links every player to the report
+    mock_link.assert_awaited_once_with(ANY, report["id"], [10, 10])
 
     # Verify upsert was called with extracted name and default team
-    first_upsert_kwargs = mock_upsert.call_args_list[0].kwargs
+    first_upsert_kwargs = _upserted(mock_upsert)[0]
     assert first_upsert_kwargs["team"] == 42
     assert first_upsert_kwargs["position"] is None
     assert first_upsert_kwargs["current_status"] == "active"
@@ -116,12 +176,8 @@ async def test_link_report_entities_claude_extraction():
             new_callable=AsyncMock,
             return_value=claude_mentions,
         ) as mock_claude,
-        patch(
-            _LINK_PATCHES["match"],
-            new_callable=AsyncMock,
-            return_value=(None, None),
-        ) as mock_match,
-        patch(_LINK_PATCHES["upsert"], new_callable=AsyncMock, return_value=5) as mock_upsert,
+        patch(_LINK_PATCHES["match"], new=_reviewed((None, None))) as mock_match,
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(5)) as mock_upsert,
         patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
     ):
         result = await link_report_entities(report, use_claude=True)
@@ -129,35 +185,33 @@ async def test_link_report_entities_claude_extraction():
     assert result == [5]
     mock_claude.assert_called_once_with(report["raw_text"])
 
-    # match_player_with_review should receive the team from Claude extraction
-    match_kwargs = mock_match.call_args.kwargs
-    assert match_kwargs["team"] == "Texas"
-    assert match_kwargs["position"] == "QB"
+    # match_players_with_review should receive the team from Claude extraction
+    assert _reviewed_queries(mock_match) == [("Arch Manning", "Texas", "QB")]
 
     # upsert gets extracted name and team from Claude
-    upsert_kwargs = mock_upsert.call_args.kwargs
+    (upsert_kwargs,) = _upserted(mock_upsert)
     assert upsert_kwargs["name"] == "Arch Manning"
     assert upsert_kwargs["team"] == "Texas"
     assert upsert_kwargs["position"] == "QB"
 
 
 async def test_link_report_entities_with_match():
-    """When match_player_with_review returns a match, upsert uses match data."""
+    """When match_players_with_review returns a match, upsert uses match data."""
     report = _make_report()
     match = _roster_match()
 
     with (
         patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
         patch(_LINK_PATCHES["regex"], return_value=["Arch Manning"]),
-        patch(_LINK_PATCHES["match"], new_callable=AsyncMock, return_value=(match, None)),
-        patch(_LINK_PATCHES["upsert"], new_callable=AsyncMock, return_value=7) as mock_upsert,
+        patch(_LINK_PATCHES["match"], new=_reviewed((match, None))),
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(7)) as mock_upsert,
         patch(_LINK_PATCHES["link"], new_callable=AsyncMock) as mock_link,
     ):
         result = await link_report_entities(report)
 
     assert result == [7]
 
-    upsert_kwargs = mock_upsert.call_args.kwargs
+    (upsert_kwargs,) = _upserted(mock_upsert)
     assert upsert_kwargs["name"] == "Arch Manning"
     assert upsert_kwargs["team"] == "Texas"
     assert upsert_kwargs["position"] == "QB"
@@ -177,19 +231,126 @@ async def test_link_report_entities_with_recruit_match():
     with (
         patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
         patch(_LINK_PATCHES["regex"], return_value=["Arch Manning"]),
-        patch(_LINK_PATCHES["match"], new_callable=AsyncMock, return_value=(match, None)),
-        patch(_LINK_PATCHES["upsert"], new_callable=AsyncMock, return_value=8) as mock_upsert,
+        patch(_LINK_PATCHES["match"], new=_reviewed((match, None))),
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(8)) as mock_upsert,
         patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
     ):
         result = await link_report_entities(report)
 
     assert result == [8]
-    upsert_kwargs = mock_upsert.call_args.kwargs
+    (upsert_kwargs,) = _upserted(mock_upsert)
     assert upsert_kwargs["current_status"] == "recruit"
     assert upsert_kwargs["recruit_id"] == 200
     assert upsert_kwargs["roster_player_id"] is None
 
 
+async def test_link_report_entities_prefetched_deterministic_match(mock_deterministic_matches):
+    """Exact roster hits from the prefetch skip match_players_with_review."""
+    report = _make_report(team_ids=["Texas"])
+    mock_deterministic_matches.return_value = {("arch manning", "texas"): _roster_match()}
+
+    with (
+        patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
+        patch(_LINK_PATCHES["regex"], return_value=["Arch Manning", "Quinn Ewers"]),
+        patch(_LINK_PATCHES["match"], new=_reviewed((None, None))) as mock_match,
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(9)) as mock_upsert,
+        patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
+    ):
+        result = await link_report_entities(report)
+
+    assert result == [9, 9]
+    mock_deterministic_matches.assert_awaited_once_with(
+        [("Arch Manning", "Texas"), ("Quinn Ewers", "Texas")], year=2025
+    )
+    # Only the mention without an exact hit falls through to the other tiers
+    assert _reviewed_queries(mock_match) == [("Quinn Ewers", "Texas", None)]
+    assert _upserted(mock_upsert)[0]["roster_player_id"] == 100
+
+
+async def test_link_report_entities_claude_uses_mentions_cache(mock_mentions_cache):
+    """A cached extraction for the same text skips the Claude call."""
+    mock_load, mock_store = mock_mentions_cache
+    report = _make_report()
+    cached_mentions = [
+        {"name": "Arch Manning", "position": "QB", "team": "Texas", "context": "starter"},
+    ]
+    mock_load.return_value = {_content_hash(report["raw_text"]): cached_mentions}
+
+    with (
+        patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
+        patch(_LINK_PATCHES["claude"], new_callable=AsyncMock) as mock_claude,
+        patch(_LINK_PATCHES["match"], new=_reviewed((None, None))),
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(10)),
+        patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
+    ):
+        result = await link_report_entities(report, use_claude=True)
+
+    assert result == [10]
+    mock_claude.assert_not_called()
+    mock_store.assert_not_called()
+
+
+async def test_link_report_entities_claude_caches_new_extraction(mock_mentions_cache):
+    """A cache miss calls Claude and stores the result under the text hash."""
+    _, mock_store = mock_mentions_cache
+    report = _make_report()
+    claude_mentions = [
+        {"name": "Arch Manning", "position": "QB", "team": "Texas", "context": "starter"},
+    ]
+
+    with (
+        patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
+        patch(_LINK_PATCHES["claude"], new_callable=AsyncMock, return_value=claude_mentions),
+        patch(_LINK_PATCHES["match"], new=_reviewed((None, None))),
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(10)),
+        patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
+    ):
+        await link_report_entities(report, use_claude=True)
+
+    mock_store.assert_awaited_once_with([(_content_hash(report["raw_text"]), claude_mentions)])
+
+
+async def test_link_report_entities_claude_failure_is_not_cached(mock_mentions_cache):
+    """A failed extraction propagates and leaves nothing in the mentions cache."""
+    _, mock_store = mock_mentions_cache
+    report = _make_report()
+
+    with (
+        patch(
+            _LINK_PATCHES["claude"],
+            new_callable=AsyncMock,
+            side_effect=ValueError("Failed to parse Claude response"),
+        ),
+        patch(_LINK_PATCHES["upsert"], new_callable=AsyncMock) as mock_upsert,
+        pytest.raises(ValueError),
+    ):
+        await link_report_entities(report, use_claude=True)
+
+    mock_store.assert_not_called()
+    mock_upsert.assert_not_called()
+
+
+async def test_link_report_entities_dedupes_repeated_mentions():
+    """The same player mentioned twice is matched and upserted once."""
+    report = _make_report()
+    claude_mentions = [
+        {"name": "Arch Manning", "position": "QB", "team": "Texas", "context": "starter"},
+        {"name": "arch manning", "position": "QB", "team": "Texas", "context": "general"},
+        {"name": "Quinn Ewers", "position": "QB", "team": "Texas", "context": "general"},
+    ]
+
+    with (
+        patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
+        patch(_LINK_PATCHES["match"], new=_reviewed((None, None))) as mock_match,
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(10)) as mock_upsert,
+        patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
+    ):
+        await link_report_entities(report, mentions=claude_mentions)
+
+    assert [q[0] for q in _reviewed_queries(mock_match)] == ["Arch Manning", "Quinn Ewers"]
+    assert [p["name"] for p in _upserted(mock_upsert)] == ["Arch Manning", "Quinn Ewers"]
+
+
 async def test_link_report_entities_pending_link():
     """When match returns pending_link_id, that player is skipped."""
     report = _make_report()
@@ -200,20 +361,20 @@ async def test_link_report_entities_pending_link():
         patch(
             _LINK_PATCHES["match"],
             new_callable=AsyncMock,
-            side_effect=[
+            return_value=[
                 (None, 99),  # first player -> pending
                 (None, None),  # second player -> no match
             ],
         ),
-        patch(_LINK_PATCHES["upsert"], new_callable=AsyncMock, return_value=11) as mock_upsert,
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(11)) as mock_upsert,
         patch(_LINK_PATCHES["link"], new_callable=AsyncMock) as mock_link,
     ):
         result = await link_report_entities(report)
 
     # Only second player should be linked
     assert result == [11]
-    assert mock_upsert.call_count == 1
-    assert mock_link.call_count == 1
+    assert len(_upserted(mock_upsert)) == 1
+    mock_link.assert_awaited_once_with(ANY, report["id"], [11])
 
 
 async def test_link_report_entities_empty_report():
@@ -245,12 +406,8 @@ async def test_link_report_entities_default_team():
     with (
         patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
         patch(_LINK_PATCHES["claude"], new_callable=AsyncMock, return_value=claude_mentions),
-        patch(
-            _LINK_PATCHES["match"],
-            new_callable=AsyncMock,
-            return_value=(None, None),
-        ) as mock_match,
-        patch(_LINK_PATCHES["upsert"], new_callable=AsyncMock, return_value=20) as mock_upsert,
+        patch(_LINK_PATCHES["match"], new=_reviewed((None, None))) as mock_match,
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(20)) as mock_upsert,
         patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
     ):
         result = await link_report_entities(report, use_claude=True)
@@ -258,11 +415,10 @@ async def test_link_report_entities_default_team():
     assert result == [20]
 
     # match should fall back to default_team since mention has no team
-    match_kwargs = mock_match.call_args.kwargs
-    assert match_kwargs["team"] == 77
+    assert _reviewed_queries(mock_match) == [("Some Player", 77, "WR")]
 
     # upsert should also use default_team
-    upsert_kwargs = mock_upsert.call_args.kwargs
+    (upsert_kwargs,) = _upserted(mock_upsert)
     assert upsert_kwargs["team"] == 77
 
 
@@ -273,17 +429,109 @@ async def test_link_report_entities_no_team_ids():
     with (
         patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
         patch(_LINK_PATCHES["regex"], return_value=["Arch Manning"]),
-        patch(_LINK_PATCHES["match"], new_callable=AsyncMock, return_value=(None, None)),
-        patch(_LINK_PATCHES["upsert"], new_callable=AsyncMock, return_value=30) as mock_upsert,
+        patch(_LINK_PATCHES["match"], new=_reviewed((None, None))),
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(30)) as mock_upsert,
         patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
     ):
         result = await link_report_entities(report)
 
     assert result == [30]
-    upsert_kwargs = mock_upsert.call_args.kwargs
+    (upsert_kwargs,) = _upserted(mock_upsert)
     assert upsert_kwargs["team"] == "Unknown"
 
 
+async def test_link_report_entities_fuzzy_matches_misses_against_team_roster():
+    """Misspelled mentions are scored against one trigram candidate fetch for the team."""
+    report = _make_report(team_ids=["Texas"])
+    # (mention index, roster row) pairs from find_roster_matches()' LATERAL query
+    roster = [
+        (1, 100, "Arch", "Manning", "Texas", "QB", 2025),
+        (2, 101, "Quinn", "Ewers", "Texas", "QB", 2025),
+    ]
+
+    @asynccontextmanager
+    async def roster_conn_ctx():
+        mock_conn = MagicMock()
+        mock_cursor = AsyncMock()
+        mock_cursor.fetchall = AsyncMock(return_value=roster)
+        mock_conn.cursor.return_value = mock_cursor
+        yield mock_conn
+
+    with (
+        patch.dict("src.processing.player_matching._no_match_cache", clear=True),
+        patch(
+            "src.processing.player_matching.get_read_connection", side_effect=roster_conn_ctx
+        ) as mock_read,
+        patch(
+            "src.processing.player_matching.has_similar_roster_names",
+            new_callable=AsyncMock,
+            side_effect=lambda queries, year: [True] * len(queries),
+        ),
+        patch(
+            "src.processing.player_matching.find_vector_matches",
+            new_callable=AsyncMock,
+            side_effect=lambda queries, year: [None] * len(queries),
+        ),
+        patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
+        patch(_LINK_PATCHES["regex"], return_value=["Arch Maning", "Quinn Ewer"]),
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(12)) as mock_upsert,
+        patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
+    ):
+        result = await link_report_entities(report)
+
+    assert result == [12, 12]
+    assert mock_read.call_count == 1
+    assert [p["roster_player_id"] for p in _upserted(mock_upsert)] == [100, 101]
+
+
+async def test_link_report_entities_embeds_misses_in_one_request():
+    """All unresolved mentions share one embeddings call and one vector search."""
+    report = _make_report(team_ids=["Texas"])
+    candidate = {
+        "id": 100,
+        "first_name": "Arch",
+        "last_name": "Manning",
+        "team": "Texas",
+        "position": "QB",
+        "year": 2025,
+        "similarity": 0.95,
+    }
+
+    @asynccontextmanager
+    async def read_conn_ctx():
+        yield MagicMock()
+
+    with (
+        patch.dict("src.processing.player_matching._no_match_cache", clear=True),
+        patch("src.processing.player_matching.get_read_connection", side_effect=read_conn_ctx),
+        patch(
+            "src.processing.player_matching.has_similar_roster_names",
+            new_callable=AsyncMock,
+            side_effect=lambda queries, year: [True] * len(queries),
+        ),
+        patch(
+            "src.processing.embeddings.generate_embeddings",
+            new_callable=AsyncMock,
+            side_effect=lambda texts: [EmbeddingResult(text, [0.1]) for text in texts],
+        ) as mock_embed,
+        patch(
+            "src.processing.player_matching.find_similar_roster_by_embeddings",
+            new_callable=AsyncMock,
+            return_value=[[candidate], [candidate]],
+        ) as mock_search,
+        patch(_LINK_PATCHES["conn"], side_effect=_mock_conn_ctx),
+        patch(_LINK_PATCHES["regex"], return_value=["Arch Manning", "A. Manning"]),
+        patch(_LINK_PATCHES["upsert"], new=_bulk_upsert_returning(13)) as mock_upsert,
+        patch(_LINK_PATCHES["link"], new_callable=AsyncMock),
+    ):
+        await link_report_entities(report)
+
+    mock_embed.assert_awaited_once()
+    assert len(mock_embed.call_args.args[0]) == 2
+    mock_search.assert_awaited_once()
+    assert [p["roster_player_id"] for p in _upserted(mock_upsert)] == [100, 100]
+
+
 # ---------------------------------------------------------------------------
 # run_entity_linking tests
 # ---------------------------------------------------------------------------
@@ -314,7 +562,7 @@ async def test_run_entity_linking_processes_batch():
 
     with (
         patch(
-            "src.processing.entity_linking.get_connection",
+            "src.processing.entity_linking.get_read_connection",
             side_effect=mock_conn_with_rows,
         ),
         patch(
@@ -358,7 +606,7 @@ async def test_run_entity_linking_handles_errors():
 
     with (
         patch(
-            "src.processing.entity_linking.get_connection",
+            "src.processing.entity_linking.get_read_connection",
             side_effect=mock_conn_with_rows,
         ),
         patch(
@@ -375,11 +623,164 @@ async def test_run_entity_linking_handles_errors():
     assert stats["errors"] == 1
 
 
+async def test_run_entity_linking_batches_claude_extraction():
+    """With Claude, mentions for a chunk of reports come from one batched call."""
+    rows = [
+        (i, f"https://{i}.com", "src", "article", f"text{i}", [42])
+        for i in range(CLAUDE_BATCH_SIZE + 1)
+    ]
+    mentions = [{"name": "Arch Manning", "position": "QB", "team": "Texas", "context": "starter"}]
+
+    @asynccontextmanager
+    async def mock_conn_with_rows():
+        mock_conn = MagicMock()
+        mock_cursor = AsyncMock()
+        mock_cursor.description = [
+            ("id",),
+            ("source_url",),
+            ("source_name",),
+            ("content_type",),
+            ("raw_text",),
+            ("team_ids",),
+        ]
+        mock_cursor.fetchall = AsyncMock(return_value=rows)
+        mock_conn.cursor.return_value = mock_cursor
+        yield mock_conn
+
+    with (
+        patch(
+            "src.processing.entity_linking.get_read_connection",
+            side_effect=mock_conn_with_rows,
+        ),
+        patch(
+            "src.processing.entity_linking.extract_player_mentions_claude_batch",
+            new_callable=AsyncMock,
+            side_effect=lambda texts: [mentions for _ in texts],
+        ) as mock_batch,
+        patch(
+            "src.processing.entity_linking.link_report_entities",
+            new_callable=AsyncMock,
+            return_value=[10],
+        ) as mock_link,
+    ):
+        stats = await run_entity_linking(batch_size=50, use_claude=True)
+
+    assert stats["reports_linked"] == CLAUDE_BATCH_SIZE + 1
+    assert stats["errors"] == 0
+    assert mock_batch.await_count == 2
+    assert len(mock_batch.call_args_list[0].args[0]) == CLAUDE_BATCH_SIZE
+    assert mock_link.call_args.kwargs["mentions"] == mentions
+
+
+async def test_run_entity_linking_extracts_only_uncached_reports(mock_mentions_cache):
+    """Cached reports skip the batched Claude call; only misses are extracted."""
+    mock_load, mock_store = mock_mentions_cache
+    rows = [
+        (1, "https://a.com", "src", "article", "cached text", [42]),
+        (2, "https://b.com", "src", "article", "new text", [42]),
+    ]
+    cached_mentions = [
+        {"name": "Arch Manning", "position": "QB", "team": None, "context": "general"}
+    ]
+    new_mentions = [{"name": "Quinn Ewers", "position": "QB", "team": None, "context": "general"}]
+    mock_load.return_value = {_content_hash("cached text"): cached_mentions}
+
+    @asynccontextmanager
+    async def mock_conn_with_rows():
+        mock_conn = MagicMock()
+        mock_cursor = AsyncMock()
+        mock_cursor.description = [
+            ("id",),
+            ("source_url",),
+            ("source_name",),
+            ("content_type",),
+            ("raw_text",),
+            ("team_ids",),
+        ]
+        mock_cursor.fetchall = AsyncMock(return_value=rows)
+        mock_conn.cursor.return_value = mock_cursor
+        yield mock_conn
+
+    with (
+        patch(
+            "src.processing.entity_linking.get_read_connection",
+            side_effect=mock_conn_with_rows,
+        ),
+        patch(
+            "src.processing.entity_linking.extract_player_mentions_claude_batch",
+            new_callable=AsyncMock,
+            return_value=[new_mentions],
+        ) as mock_batch,
+        patch(
+            "src.processing.entity_linking.link_report_entities",
+            new_callable=AsyncMock,
+            return_value=[10],
+        ) as mock_link,
+    ):
+        stats = await run_entity_linking(use_claude=True)
+
+    assert stats["reports_linked"] == 2
+    mock_load.assert_awaited_once()
+    mock_batch.assert_awaited_once_with(["new text"])
+    mock_store.assert_awaited_once_with([(_content_hash("new text"), new_mentions)])
+    linked_mentions = {c.args[0]["id"]: c.kwargs["mentions"] for c in mock_link.call_args_list}
+    assert linked_mentions == {1: cached_mentions, 2: new_mentions}
+
+
+async def test_run_entity_linking_does_not_cache_failed_extractions(mock_mentions_cache):
+    """A report whose mentions failed to parse is not cached or linked this run."""
+    _, mock_store = mock_mentions_cache
+    rows = [
+        (1, "https://a.com", "src", "article", "good text", [42]),
+        (2, "https://b.com", "src", "article", "bad text", [42]),
+    ]
+    mentions = [{"name": "Quinn Ewers", "position": "QB", "team": None, "context": "general"}]
+
+    @asynccontextmanager
+    async def mock_conn_with_rows():
+        mock_conn = MagicMock()
+        mock_cursor = AsyncMock()
+        mock_cursor.description = [
+            ("id",),
+            ("source_url",),
+            ("source_name",),
+            ("content_type",),
+            ("raw_text",),
+            ("team_ids",),
+        ]
+        mock_cursor.fetchall = AsyncMock(return_value=rows)
+        mock_conn.cursor.return_value = mock_cursor
+        yield mock_conn
+
+    with (
+        patch(
+            "src.processing.entity_linking.get_read_connection",
+            side_effect=mock_conn_with_rows,
+        ),
+        patch(
+            "src.processing.entity_linking.extract_player_mentions_claude_batch",
+            new_callable=AsyncMock,
+            return_value=[mentions, None],
+        ),
+        patch(
+            "src.processing.entity_linking.link_report_entities",
+            new_callable=AsyncMock,
+            return_value=[10],
+        ) as mock_link,
+    ):
+        stats = await run_entity_linking(use_claude=True)
+
+    assert stats["reports_linked"] == 1
+    assert stats["errors"] == 1
+    mock_store.assert_awaited_once_with([(_content_hash("good text"), mentions)])
+    assert [c.args[0]["id"] for c in mock_link.call_args_list] == [1]
+
+
 async def test_run_entity_linking_no_reports():
     """No unprocessed reports returns zeroed stats."""
     with (
         patch(
-            "src.processing.entity_linking.get_connection",
+            "src.processing.entity_linking.get_read_connection",
             side_effect=_mock_conn_ctx,
         ),
     ):
@@ -391,3 +792,102 @@ async def test_run_entity_linking_no_reports():
         "players_linked": 0,
         "errors": 0,
     }
+
+
+async def test_run_entity_linking_bounds_concurrency():
+    """Reports are linked concurrently, never more than LINKING_CONCURRENCY at once."""
+    rows = [(i, f"https://{i}.com", "src", "article", f"text{i}", [42]) for i in range(20)]
+    in_flight = 0
+    peak = 0
+
+    async def slow_link(report, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [report["id"]]
+
+    @asynccontextmanager
+    async def mock_conn_with_rows():
+        mock_conn = MagicMock()
+        mock_cursor = AsyncMock()
+        mock_cursor.description = [
+            ("id",),
+            ("source_url",),
+            ("source_name",),
+            ("content_type",),
+            ("raw_text",),
+            ("team_ids",),
+        ]
+        mock_cursor.fetchall = AsyncMock(return_value=rows)
+        mock_conn.cursor.return_value = mock_cursor
+        yield mock_conn
+
+    with (
+        patch(
+            "src.processing.entity_linking.get_read_connection",
+            side_effect=mock_conn_with_rows,
+        ),
+        patch("src.processing.entity_linking.link_report_entities", side_effect=slow_link),
+    ):
+        stats = await run_entity_linking(batch_size=20)
+
+    assert stats["reports_linked"] == 20
+    assert stats["players_linked"] == 20
+    assert 1 < peak <= LINKING_CONCURRENCY
+
+
+async def test_run_entity_linking_bounds_batch_extraction_concurrency():
+    """Batched Claude requests never exceed EXTRACTION_CONCURRENCY in flight."""
+    rows = [
+        (i, f"https://{i}.com", "src", "article", f"text{i}", [42])
+        for i in range(CLAUDE_BATCH_SIZE * 6)
+    ]
+    in_flight = 0
+    peak = 0
+
+    async def slow_extract(texts):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[] for _ in texts]
+
+    @asynccontextmanager
+    async def mock_conn_with_rows():
+        mock_conn = MagicMock()
+        mock_cursor = AsyncMock()
+        mock_cursor.description = [
+            ("id",),
+            ("source_url",),
+            ("source_name",),
+            ("content_type",),
+            ("raw_text",),
+            ("team_ids",),
+        ]
+        mock_cursor.fetchall = AsyncMock(return_value=rows)
+        mock_conn.cursor.return_value = mock_cursor
+        yield mock_conn
+
+    with (
+        patch(
+            "src.processing.entity_linking.get_read_connection",
+            side_effect=mock_conn_with_rows,
+        ),
+        patch(
+            "src.processing.entity_linking.extract_player_mentions_claude_batch",
+            side_effect=slow_extract,
+        ) as mock_batch,
+        patch(
+            "src.processing.entity_linking.link_report_entities",
+            new_callable=AsyncMock,
+            return_value=[],
+        ),
+    ):
+        stats = await run_entity_linking(batch_size=len(rows), use_claude=True)
+
+    assert stats["errors"] == 0
+    assert mock_batch.call_count == 6
+    assert 1 < peak <= EXTRACTION_CONCURRENCY
@@ -1,7 +1,8 @@
 """Tests for src/processing/grading.py."""
 
+import json
 from contextlib import asynccontextmanager
-from datetime import date
+from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.processing.grading import (
@@ -61,7 +62,7 @@ async def test_get_players_needing_update_returns_players():
     async def conn_ctx():
         yield mock_conn
 
-    with patch("src.processing.grading.get_connection", side_effect=conn_ctx):
+    with patch("src.processing.grading.get_read_connection", side_effect=conn_ctx):
         result = await get_players_needing_update()
 
     assert len(result) == 2
@@ -80,7 +81,7 @@ async def test_get_players_needing_update_empty():
     async def conn_ctx():
         yield mock_conn
 
-    with patch("src.processing.grading.get_connection", side_effect=conn_ctx):
+    with patch("src.processing.grading.get_read_connection", side_effect=conn_ctx):
         result = await get_players_needing_update()
 
     assert result == []
@@ -97,7 +98,7 @@ async def test_get_players_needing_update_respects_limit():
     async def conn_ctx():
         yield mock_conn
 
-    with patch("src.processing.grading.get_connection", side_effect=conn_ctx):
+    with patch("src.processing.grading.get_read_connection", side_effect=conn_ctx):
         await get_players_needing_update(limit=10)
 
     mock_cursor.execute.assert_called_once()
@@ -105,94 +106,183 @@ async def test_get_players_needing_update_respects_limit():
     assert sql_args[1] == (10,)
 
 
+async def test_get_players_needing_update_keyset_cursor():
+    """Passes the (last_updated, id) cursor before the limit and filters on it."""
+    mock_conn, mock_cursor = _make_mock_conn(
+        cursor_description=COLUMN_DESCRIPTORS,
+        fetchall_return=[],
+    )
+    cursor = (datetime(2025, 1, 1, tzinfo=UTC), 7)
+    started_at = datetime(2025, 1, 2, tzinfo=UTC)
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with patch("src.processing.grading.get_read_connection", side_effect=conn_ctx):
+        await get_players_needing_update(limit=10, after=cursor, started_at=started_at)
+
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "(p.last_updated, p.id) > (%s, %s)" in sql
+    # Players regraded since the run started don't come back at the end
+    assert "p.last_updated < %s" in sql
+    assert params == (*cursor, started_at, 10)
+
+
 # ---------------------------------------------------------------------------
 # update_player_grade
 # ---------------------------------------------------------------------------
 
 
-async def test_update_player_grade_updates_db():
-    """Executes UPDATE SQL and commits the transaction."""
-    mock_conn, mock_cursor = _make_mock_conn()
+def _patch_grading(mock_conn, fingerprints=("new-fingerprint", "old-fingerprint")):
+    """Patch connections, fingerprints, and aggregation for update_player_grade."""
 
     @asynccontextmanager
     async def conn_ctx():
         yield mock_conn
 
-    with (
+    return (
         patch("src.processing.grading.get_connection", side_effect=conn_ctx),
+        patch("src.processing.grading.get_read_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.grading.get_grading_fingerprints",
+            new_callable=AsyncMock,
+            return_value=fingerprints,
+        ),
         patch(
             "src.processing.grading.aggregate_player_profile",
             new_callable=AsyncMock,
             return_value=MOCK_AGGREGATION,
         ),
-        patch("src.processing.grading.insert_timeline_snapshot", new_callable=AsyncMock),
-    ):
+    )
+
+
+async def test_update_player_grade_updates_db():
+    """Executes one UPDATE + timeline statement and commits once."""
+    mock_conn, mock_cursor = _make_mock_conn()
+
+    p_conn, p_read, p_fp, p_agg = _patch_grading(mock_conn)
+    with p_conn, p_read, p_fp, p_agg:
         await update_player_grade(player_id=1)
 
-    # Verify UPDATE was executed with correct params
+    # Verify a single statement was executed with correct params
     mock_cursor.execute.assert_called_once()
     sql, params = mock_cursor.execute.call_args[0]
     assert "UPDATE scouting.players" in sql
-    assert params == (78, {"arm_strength": 8, "accuracy": 7, "mobility": 6}, 1)
+    assert params["player_id"] == 1
+    assert params["grade"] == 78
+    assert json.loads(params["traits"]) == {"arm_strength": 8, "accuracy": 7, "mobility": 6}
 
     # Verify commit was called
     mock_conn.commit.assert_called_once()
 
 
 async def test_update_player_grade_creates_timeline():
-    """Calls insert_timeline_snapshot with correct arguments."""
+    """Snapshots the timeline in the same statement as the UPDATE."""
+    mock_conn, mock_cursor = _make_mock_conn()
+
+    p_conn, p_read, p_fp, p_agg = _patch_grading(mock_conn)
+    with p_conn, p_read, p_fp, p_agg:
+        await update_player_grade(player_id=1)
+
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "INSERT INTO scouting.player_timeline" in sql
+    assert params["snapshot_date"] == date.today()
+    assert params["sentiment"] == 0.72
+    assert params["sources_count"] == 5
+
+
+async def test_update_player_grade_returns_aggregation():
+    """Returns the aggregation result dict from aggregate_player_profile."""
     mock_conn, _ = _make_mock_conn()
 
+    p_conn, p_read, p_fp, p_agg = _patch_grading(mock_conn)
+    with p_conn, p_read, p_fp, p_agg:
+        result = await update_player_grade(player_id=1)
+
+    assert result == MOCK_AGGREGATION
+    assert result["composite_grade"] == 78
+    assert result["report_count"] == 5
+
+
+async def test_update_player_grade_records_fingerprint():
+    """Stores the reports fingerprint the player was graded on."""
+    mock_conn, mock_cursor = _make_mock_conn()
+
+    p_conn, p_read, p_fp, p_agg = _patch_grading(mock_conn, fingerprints=("new-fingerprint", None))
+    with p_conn, p_read, p_fp, p_agg:
+        await update_player_grade(player_id=1)
+
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "INSERT INTO scouting.player_grading_state" in sql
+    assert params["fingerprint"] == "new-fingerprint"
+
+
+async def test_update_player_grade_same_day_regrade_upserts_snapshot():
+    """A second grade on the same day replaces the snapshot instead of failing.
+
+    player_timeline is UNIQUE (player_id, snapshot_date); a plain INSERT would
+    roll back the grade and fingerprint, so every later run would regrade.
+    """
+    mock_conn, mock_cursor = _make_mock_conn()
+    today = date(2026, 3, 1)
+
+    p_conn, p_read, p_fp, p_agg = _patch_grading(mock_conn)
+    with p_conn, p_read, p_fp, p_agg:
+        await update_player_grade(player_id=1, today=today)
+        await update_player_grade(player_id=1, force=True, today=today)
+
+    assert mock_cursor.execute.call_count == 2
+    for call in mock_cursor.execute.call_args_list:
+        sql, params = call.args
+        assert "ON CONFLICT (player_id, snapshot_date) DO UPDATE" in sql
+        assert "grade_at_time = EXCLUDED.grade_at_time" in sql
+        assert params["snapshot_date"] == today
+    assert mock_conn.commit.call_count == 2
+
+
+async def test_update_player_grade_skips_unchanged_reports():
+    """Skips aggregation when reports match the last graded fingerprint."""
+    mock_conn, mock_cursor = _make_mock_conn()
+
     @asynccontextmanager
     async def conn_ctx():
         yield mock_conn
 
-    mock_timeline = AsyncMock()
+    mock_aggregate = AsyncMock(return_value=MOCK_AGGREGATION)
 
     with (
         patch("src.processing.grading.get_connection", side_effect=conn_ctx),
+        patch("src.processing.grading.get_read_connection", side_effect=conn_ctx),
         patch(
-            "src.processing.grading.aggregate_player_profile",
+            "src.processing.grading.get_grading_fingerprints",
             new_callable=AsyncMock,
-            return_value=MOCK_AGGREGATION,
+            return_value=("same", "same"),
         ),
-        patch("src.processing.grading.insert_timeline_snapshot", mock_timeline),
+        patch("src.processing.grading.aggregate_player_profile", mock_aggregate),
     ):
-        await update_player_grade(player_id=1)
-
-    mock_timeline.assert_called_once_with(
-        mock_conn,
-        player_id=1,
-        snapshot_date=date.today(),
-        sentiment_score=0.72,
-        grade_at_time=78,
-        traits_at_time={"arm_strength": 8, "accuracy": 7, "mobility": 6},
-        sources_count=5,
-    )
-
-
-async def test_update_player_grade_returns_aggregation():
-    """Returns the aggregation result dict from aggregate_player_profile."""
-    mock_conn, _ = _make_mock_conn()
+        result = await update_player_grade(player_id=1)
 
-    @asynccontextmanager
-    async def conn_ctx():
-        yield mock_conn
+    assert result is None
+    mock_aggregate.assert_not_called()
+    # Only last_updated is touched
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "SET last_updated = NOW()" in sql
+    assert params == (1,)
 
     with (
         patch("src.processing.grading.get_connection", side_effect=conn_ctx),
+        patch("src.processing.grading.get_read_connection", side_effect=conn_ctx),
         patch(
-            "src.processing.grading.aggregate_player_profile",
+            "src.processing.grading.get_grading_fingerprints",
             new_callable=AsyncMock,
-            return_value=MOCK_AGGREGATION,
+            return_value=("same", "same"),
         ),
-        patch("src.processing.grading.insert_timeline_snapshot", new_callable=AsyncMock),
+        patch("src.processing.grading.aggregate_player_profile", mock_aggregate),
     ):
-        result = await update_player_grade(player_id=1)
+        result = await update_player_grade(player_id=1, force=True)
 
     assert result == MOCK_AGGREGATION
-    assert result["composite_grade"] == 78
-    assert result["report_count"] == 5
 
 
 # ---------------------------------------------------------------------------
@@ -220,11 +310,11 @@ async def test_run_grading_pipeline_processes_all():
     ):
         result = await run_grading_pipeline(batch_size=25)
 
-    assert result == {"players_found": 3, "players_updated": 3, "errors": 0}
+    assert result == {"players_found": 3, "players_updated": 3, "players_skipped": 0, "errors": 0}
     assert mock_update.call_count == 3
-    mock_update.assert_any_call(1)
-    mock_update.assert_any_call(2)
-    mock_update.assert_any_call(3)
+    mock_update.assert_any_call(1, today=date.today())
+    mock_update.assert_any_call(2, today=date.today())
+    mock_update.assert_any_call(3, today=date.today())
 
 
 async def test_run_grading_pipeline_handles_errors():
@@ -235,7 +325,7 @@ async def test_run_grading_pipeline_handles_errors():
         {"id": 3, "name": "Player C", "team": "Team C", "class_year": 2026},
     ]
 
-    async def update_side_effect(player_id):
+    async def update_side_effect(player_id, today):
         if player_id == 2:
             raise RuntimeError("DB connection lost")
         return MOCK_AGGREGATION
@@ -259,6 +349,58 @@ async def test_run_grading_pipeline_handles_errors():
     assert result["errors"] == 1
 
 
+async def test_run_grading_pipeline_counts_skipped():
+    """Players with unchanged reports are counted as skipped, not updated."""
+    mock_players = [
+        {"id": 1, "name": "Player A", "team": "Team A", "class_year": 2026},
+        {"id": 2, "name": "Player B", "team": "Team B", "class_year": 2025},
+    ]
+
+    with (
+        patch(
+            "src.processing.grading.get_players_needing_update",
+            new_callable=AsyncMock,
+            return_value=mock_players,
+        ),
+        patch(
+            "src.processing.grading.update_player_grade",
+            new_callable=AsyncMock,
+            side_effect=[MOCK_AGGREGATION, None],
+        ),
+    ):
+        result = await run_grading_pipeline()
+
+    assert result == {"players_found": 2, "players_updated": 1, "players_skipped": 1, "errors": 0}
+
+
+async def test_run_grading_pipeline_pages_with_cursor():
+    """Full pages advance the keyset cursor to the last player of the page."""
+    ts = datetime(2025, 1, 1, tzinfo=UTC)
+    page = [
+        {"id": 1, "name": "Player A", "team": "Team A", "class_year": 2026, "last_updated": ts},
+        {"id": 2, "name": "Player B", "team": "Team B", "class_year": 2025, "last_updated": ts},
+    ]
+    mock_get = AsyncMock(side_effect=[page, []])
+
+    with (
+        patch("src.processing.grading.get_players_needing_update", mock_get),
+        patch(
+            "src.processing.grading.update_player_grade",
+            new_callable=AsyncMock,
+            return_value=MOCK_AGGREGATION,
+        ),
+    ):
+        result = await run_grading_pipeline(batch_size=2, max_batches=3)
+
+    assert result["players_found"] == 2
+    assert result["players_updated"] == 2
+    assert mock_get.call_args_list[0].kwargs["after"] is None
+    assert mock_get.call_args_list[1].kwargs["after"] == (ts, 2)
+    # Every page is bounded by the same run start
+    started = {call.kwargs["started_at"] for call in mock_get.call_args_list}
+    assert len(started) == 1
+
+
 async def test_run_grading_pipeline_no_players():
     """Returns zeroed stats when no players need updating."""
     with patch(
@@ -268,4 +410,4 @@ async def test_run_grading_pipeline_no_players():
     ):
         result = await run_grading_pipeline()
 
-    assert result == {"players_found": 0, "players_updated": 0, "errors": 0}
+    assert result == {"players_found": 0, "players_updated": 0, "players_skipped": 0, "errors": 0}
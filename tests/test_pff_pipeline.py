@@ -1,9 +1,15 @@
 """Tests for PFF grade pipeline."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.clients.pff import PFFPlayerGrade
-from src.processing.pff_pipeline import fetch_and_store_pff_grade, run_pff_pipeline
+from src.processing.pff_pipeline import (
+    PFF_CONCURRENCY,
+    _RateLimiter,
+    fetch_pff_grade,
+    run_pff_pipeline,
+)
 
 
 def _make_pff_grade(**overrides) -> PFFPlayerGrade:
@@ -26,64 +32,34 @@ def _make_pff_grade(**overrides) -> PFFPlayerGrade:
 SAMPLE_PLAYER = {"id": 1, "name": "Arch Manning", "team": "Texas", "position": "QB"}
 
 
-# --- fetch_and_store_pff_grade tests ---
+# --- fetch_pff_grade tests ---
 
 
-async def test_fetch_and_store_pff_grade_found():
-    """When PFF returns a grade, upsert is called and True is returned."""
+async def test_fetch_pff_grade_found():
+    """When PFF returns a grade, its upsert keyword arguments are returned."""
     grade = _make_pff_grade()
     mock_client = MagicMock()
     mock_client.get_player_by_name = AsyncMock(return_value=grade)
 
-    mock_conn = MagicMock()
-
-    with patch(
-        "src.processing.pff_pipeline.upsert_pff_grade",
-        new_callable=AsyncMock,
-        return_value=42,
-    ) as mock_upsert:
-        result = await fetch_and_store_pff_grade(mock_client, mock_conn, SAMPLE_PLAYER)
+    result = await fetch_pff_grade(mock_client, SAMPLE_PLAYER)
 
-    assert result is True
     mock_client.get_player_by_name.assert_awaited_once_with("Arch Manning", team="Texas")
-    mock_upsert.assert_awaited_once()
-
-    call_kwargs = mock_upsert.call_args[1]
-    assert call_kwargs["player_id"] == 1
-    assert call_kwargs["pff_player_id"] == "99999"
-    assert call_kwargs["overall_grade"] == 85.5
-    assert call_kwargs["snaps"] == 450
-    assert call_kwargs["season"] == 2025
+    assert result == {
+        "player_id": 1,
+        "pff_player_id": "99999",
+        "season": 2025,
+        "overall_grade": 85.5,
+        "position_grades": {"passing_grade": 87.2, "rushing_grade": 72.1},
+        "snaps": 450,
+    }
 
 
-async def test_fetch_and_store_pff_grade_not_found():
-    """When PFF returns None, upsert is not called and False is returned."""
+async def test_fetch_pff_grade_not_found():
+    """When PFF returns None, None is returned."""
     mock_client = MagicMock()
     mock_client.get_player_by_name = AsyncMock(return_value=None)
 
-    mock_conn = MagicMock()
-
-    with patch(
-        "src.processing.pff_pipeline.upsert_pff_grade",
-        new_callable=AsyncMock,
-    ) as mock_upsert:
-        result = await fetch_and_store_pff_grade(mock_client, mock_conn, SAMPLE_PLAYER)
-
-    assert result is False
-    mock_upsert.assert_not_awaited()
-
-
-async def test_fetch_and_store_pff_grade_error():
-    """When PFF client raises, error is logged and None is returned."""
-    mock_client = MagicMock()
-    mock_client.get_player_by_name = AsyncMock(side_effect=RuntimeError("API timeout"))
-
-    mock_conn = MagicMock()
-
-    with patch("src.processing.pff_pipeline.upsert_pff_grade", new_callable=AsyncMock):
-        result = await fetch_and_store_pff_grade(mock_client, mock_conn, SAMPLE_PLAYER)
-
-    assert result is None
+    assert await fetch_pff_grade(mock_client, SAMPLE_PLAYER) is None
 
 
 # --- run_pff_pipeline tests ---
@@ -135,14 +111,98 @@ async def test_run_pff_pipeline_processes_batch(monkeypatch):
         patch("src.processing.pff_pipeline.get_connection", return_value=mock_conn_cm),
         patch("src.processing.pff_pipeline.PFFClient", return_value=mock_pff_client),
         patch(
-            "src.processing.pff_pipeline.upsert_pff_grade",
+            "src.processing.pff_pipeline.upsert_pff_grades_bulk",
             new_callable=AsyncMock,
-            return_value=1,
         ) as mock_upsert,
+        patch(
+            "src.processing.pff_pipeline.record_pff_not_found_bulk",
+            new_callable=AsyncMock,
+        ),
     ):
         stats = await run_pff_pipeline(batch_size=10)
 
     assert stats["players_checked"] == 2
     assert stats["grades_stored"] == 2
     assert stats["errors"] == 0
+
+    # Both grades are written in a single batch
+    mock_upsert.assert_awaited_once()
+    stored = mock_upsert.call_args.args[1]
+    assert sorted(g["pff_player_id"] for g in stored) == ["111", "222"]
+
+    # Known misses are excluded by the driver query
+    driver_sql = mock_cursor.execute.call_args_list[0].args[0]
+    assert "scouting.pff_not_found" in driver_sql
+
+
+async def test_run_pff_pipeline_bounds_concurrency(monkeypatch):
+    """Lookups overlap, but never more than PFF_CONCURRENCY at once."""
+    monkeypatch.setenv("PFF_API_KEY", "test-key")
+    monkeypatch.setattr("src.processing.pff_pipeline.PFF_REQUESTS_PER_SECOND", 1000.0)
+    monkeypatch.setattr("src.processing.pff_pipeline.PFF_FLUSH_SIZE", PFF_CONCURRENCY * 2)
+
+    players_from_db = [(i, f"Player {i}", "Texas", "QB") for i in range(PFF_CONCURRENCY * 3)]
+
+    mock_cursor = MagicMock()
+    mock_cursor.execute = AsyncMock()
+    mock_cursor.description = [("id",), ("name",), ("team",), ("position",)]
+    mock_cursor.fetchall = AsyncMock(return_value=players_from_db)
+
+    mock_conn = MagicMock()
+    mock_conn.cursor = MagicMock(return_value=mock_cursor)
+
+    mock_conn_cm = AsyncMock()
+    mock_conn_cm.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_conn_cm.__aexit__ = AsyncMock(return_value=False)
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_fetch(client, player):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if player["id"] == 0:
+            raise RuntimeError("API timeout")
+        return {"player_id": player["id"]}
+
+    mock_pff_client = MagicMock()
+    mock_pff_client.__aenter__ = AsyncMock(return_value=mock_pff_client)
+    mock_pff_client.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("src.processing.pff_pipeline.get_connection", return_value=mock_conn_cm),
+        patch("src.processing.pff_pipeline.PFFClient", return_value=mock_pff_client),
+        patch("src.processing.pff_pipeline.fetch_pff_grade", side_effect=slow_fetch),
+        patch(
+            "src.processing.pff_pipeline.upsert_pff_grades_bulk",
+            new_callable=AsyncMock,
+        ) as mock_upsert,
+        patch(
+            "src.processing.pff_pipeline.record_pff_not_found_bulk",
+            new_callable=AsyncMock,
+        ),
+    ):
+        stats = await run_pff_pipeline(batch_size=50)
+
+    assert stats["players_checked"] == len(players_from_db)
+    assert stats["grades_stored"] == len(players_from_db) - 1
+    assert stats["errors"] == 1
+    assert 1 < peak <= PFF_CONCURRENCY
+    # Results are flushed once per PFF_FLUSH_SIZE players
     assert mock_upsert.await_count == 2
+
+
+async def test_rate_limiter_spaces_request_starts():
+    """Entries after the first wait out the per-request interval."""
+    limiter = _RateLimiter(rate=50.0)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for _ in range(3):
+        async with limiter:
+            pass
+
+    assert loop.time() - start >= 2 / 50.0 * 0.9
@@ -0,0 +1,193 @@
+"""Tests for the report summarization pipeline."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+from src.processing.pipeline import process_reports
+
+
+async def test_process_reports_summarizes_concurrently_and_isolates_errors():
+    """Every report is summarized; a failed summary only counts as one error."""
+    reports = [{"id": i, "raw_text": f"report {i}", "team_ids": ["Texas"]} for i in range(10)]
+
+    async def fetch_reports(conn, limit):
+        return reports[:limit]
+
+    async def summarize(text, team_context):
+        if text == "report 3":
+            raise RuntimeError("rate limited")
+        return {"summary": f"summary of {text}", "sentiment_score": 0.5}
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield MagicMock()
+
+    with (
+        patch("src.processing.pipeline.get_read_connection", side_effect=conn_ctx),
+        patch("src.processing.pipeline.get_connection", side_effect=conn_ctx),
+        patch("src.processing.pipeline.get_unprocessed_reports", side_effect=fetch_reports),
+        patch("src.processing.pipeline.summarize_report", side_effect=summarize),
+        patch("src.processing.pipeline.mark_report_processed", new_callable=AsyncMock) as mock_mark,
+    ):
+        stats = await process_reports(batch_size=10)
+
+    assert stats["total"] == 10
+    assert stats["processed"] == 9
+    assert stats["errors"] == 1
+    marked = [call.kwargs["report_id"] for call in mock_mark.call_args_list]
+    assert marked == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+
+async def test_process_reports_releases_read_connection_before_summarizing():
+    """Reports are read up front; no read connection is held during Claude calls."""
+    reports = [{"id": i, "raw_text": f"report {i}", "team_ids": ["Texas"]} for i in range(3)]
+    read_open = False
+
+    async def fetch_reports(conn, limit):
+        return reports[:limit]
+
+    async def summarize(text, team_context):
+        assert not read_open
+        return {"summary": f"summary of {text}", "sentiment_score": 0.5}
+
+    @asynccontextmanager
+    async def read_conn_ctx():
+        nonlocal read_open
+        read_open = True
+        try:
+            yield MagicMock()
+        finally:
+            read_open = False
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield MagicMock()
+
+    with (
+        patch("src.processing.pipeline.get_read_connection", side_effect=read_conn_ctx),
+        patch("src.processing.pipeline.get_connection", side_effect=conn_ctx),
+        patch("src.processing.pipeline.get_unprocessed_reports", side_effect=fetch_reports),
+        patch("src.processing.pipeline.summarize_report", side_effect=summarize),
+        patch("src.processing.pipeline.mark_report_processed", new_callable=AsyncMock),
+    ):
+        stats = await process_reports(batch_size=3)
+
+    assert stats["processed"] == 3
+    assert stats["errors"] == 0
+
+
+async def test_process_reports_batch_records_batch_before_waiting():
+    """The batch id is stored before polling, then closed once results are written."""
+    reports = [{"id": i, "raw_text": f"report {i}", "team_ids": ["Texas"]} for i in (7, 8)]
+    events = []
+
+    async def fetch_reports(conn, limit):
+        return reports[:limit]
+
+    async def collect(batch_id, count):
+        events.append("collect")
+        return [{"summary": "s", "sentiment_score": 0.1}, None]
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield MagicMock()
+
+    with (
+        patch("src.processing.pipeline.get_read_connection", side_effect=conn_ctx),
+        patch("src.processing.pipeline.get_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.pipeline.get_open_summary_batch",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch("src.processing.pipeline.get_unprocessed_reports", side_effect=fetch_reports),
+        patch(
+            "src.processing.pipeline.submit_summary_batch",
+            new_callable=AsyncMock,
+            return_value="msgbatch_1",
+        ),
+        patch(
+            "src.processing.pipeline.insert_summary_batch",
+            new_callable=AsyncMock,
+            side_effect=lambda *args: events.append("insert"),
+        ) as mock_insert,
+        patch("src.processing.pipeline.collect_summary_batch", side_effect=collect),
+        patch("src.processing.pipeline.mark_report_processed", new_callable=AsyncMock) as mock_mark,
+        patch(
+            "src.processing.pipeline.complete_summary_batch", new_callable=AsyncMock
+        ) as mock_complete,
+    ):
+        stats = await process_reports(batch_size=10, use_batch_api=True)
+
+    assert events == ["insert", "collect"]
+    mock_insert.assert_awaited_once_with(ANY, "msgbatch_1", [7, 8])
+    assert [c.kwargs["report_id"] for c in mock_mark.call_args_list] == [7]
+    mock_complete.assert_awaited_once_with(ANY, "msgbatch_1")
+    assert (stats["processed"], stats["errors"]) == (1, 1)
+
+
+async def test_process_reports_batch_resumes_open_batch():
+    """An open batch is collected instead of submitting its reports again."""
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield MagicMock()
+
+    with (
+        patch("src.processing.pipeline.get_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.pipeline.get_open_summary_batch",
+            new_callable=AsyncMock,
+            return_value={"batch_id": "msgbatch_0", "report_ids": [3]},
+        ),
+        patch("src.processing.pipeline.get_unprocessed_reports") as mock_fetch,
+        patch("src.processing.pipeline.submit_summary_batch") as mock_submit,
+        patch(
+            "src.processing.pipeline.collect_summary_batch",
+            new_callable=AsyncMock,
+            return_value=[{"summary": "s", "sentiment_score": 0.1}],
+        ) as mock_collect,
+        patch("src.processing.pipeline.mark_report_processed", new_callable=AsyncMock) as mock_mark,
+        patch(
+            "src.processing.pipeline.complete_summary_batch", new_callable=AsyncMock
+        ) as mock_complete,
+    ):
+        stats = await process_reports(batch_size=10, use_batch_api=True)
+
+    mock_fetch.assert_not_called()
+    mock_submit.assert_not_called()
+    mock_collect.assert_awaited_once_with("msgbatch_0", 1)
+    assert mock_mark.call_args.kwargs["report_id"] == 3
+    mock_complete.assert_awaited_once_with(ANY, "msgbatch_0")
+    assert stats["processed"] == 1
+
+
+async def test_process_reports_batch_timeout_leaves_batch_open():
+    """Giving up on a slow batch writes nothing and keeps it for the next run."""
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield MagicMock()
+
+    with (
+        patch("src.processing.pipeline.get_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.pipeline.get_open_summary_batch",
+            new_callable=AsyncMock,
+            return_value={"batch_id": "msgbatch_0", "report_ids": [3, 4]},
+        ),
+        patch(
+            "src.processing.pipeline.collect_summary_batch",
+            new_callable=AsyncMock,
+            side_effect=TimeoutError("Summary batch msgbatch_0 still in_progress"),
+        ),
+        patch("src.processing.pipeline.mark_report_processed", new_callable=AsyncMock) as mock_mark,
+        patch(
+            "src.processing.pipeline.complete_summary_batch", new_callable=AsyncMock
+        ) as mock_complete,
+    ):
+        stats = await process_reports(batch_size=10, use_batch_api=True)
+
+    mock_mark.assert_not_awaited()
+    mock_complete.assert_not_awaited()
+    assert (stats["total"], stats["processed"], stats["errors"]) == (2, 0, 0)
@@ -1,10 +1,18 @@
 """Tests for player matching against roster data."""
 
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from psycopg import errors as pg_errors
 
 from src.processing.player_matching import (
+    FUZZY_CANDIDATE_LIMIT,
     PlayerMatch,
+    best_fuzzy_match,
+    best_fuzzy_matches,
     find_roster_match,
+    find_roster_matches,
     fuzzy_match_name,
 )
 
@@ -27,6 +35,156 @@ def test_fuzzy_match_name_different():
     assert score < 50
 
 
+def test_best_fuzzy_match_agrees_with_fuzzy_match_name():
+    """Picks the first highest fuzzy_match_name() score at or above threshold."""
+    choices = ["Quinn Ewers", "manning arch", "Arch Manning", "Archibald Manning"]
+    index, score = best_fuzzy_match("  ARCH MANNING ", choices)
+
+    assert index == 1  # ties keep the first candidate, like the old loop
+    assert score == fuzzy_match_name("  ARCH MANNING ", choices[1]) == 100
+    assert best_fuzzy_match("Arch Manning", ["Quinn Ewers", "Jaydon Blue"]) is None
+    assert best_fuzzy_match("Arch Manning", []) is None
+
+
+@pytest.mark.parametrize("parallel_min_pairs", [50_000, 1])
+def test_best_fuzzy_matches_agrees_with_best_fuzzy_match(monkeypatch, parallel_min_pairs):
+    """The batched scorer picks the same choice and score as the single one."""
+    monkeypatch.setattr(
+        "src.processing.player_matching.FUZZY_PARALLEL_MIN_PAIRS", parallel_min_pairs
+    )
+    choices = ["Quinn Ewers", "manning arch", "Arch Manning", "Archibald Manning"]
+    names = ["  ARCH MANNING ", "Quin Ewers", "Jaydon Blue"]
+
+    assert best_fuzzy_matches(names, choices) == [best_fuzzy_match(n, choices) for n in names]
+    assert best_fuzzy_matches(names, []) == [None, None, None]
+
+
+async def test_find_roster_matches_scores_trigram_candidates_per_query():
+    """Each query scores only its own trigram candidates, like find_roster_match()."""
+    rows = [
+        (1, 2, "Arch", "Manning", "Texas", "QB", 2025),
+        (1, 1, "Quinn", "Ewers", "Texas", "QB", 2025),
+        (2, 4, "Carson", "Beck", "Georgia", "QB", 2025),
+    ]
+    mock_cursor = AsyncMock()
+    mock_cursor.fetchall.return_value = rows
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    queries = [
+        ("Arch Maning", "Texas", "QB"),
+        ("Carson Beck", "georgia", None),
+        ("Carson Beck", "Texas", None),
+    ]
+    with patch("src.processing.player_matching.get_read_connection", side_effect=conn_ctx):
+        matches = await find_roster_matches(queries, year=2025)
+
+    mock_cursor.execute.assert_awaited_once()
+    sql, params = mock_cursor.execute.call_args.args
+    assert "%% LOWER(q.name)" in sql
+    assert params == (
+        ["Arch Maning", "Carson Beck", "Carson Beck"],
+        ["Texas", "georgia", "Texas"],
+        ["QB", None, None],
+        2025,
+        FUZZY_CANDIDATE_LIMIT,
+    )
+    assert matches[0].source_id == "2"
+    assert matches[0].confidence == fuzzy_match_name("Arch Maning", "Arch Manning")
+    assert matches[1].source_id == "4"
+    # Carson Beck is not a trigram candidate on Texas, so nothing matches
+    assert matches[2] is None
+
+
+async def test_find_roster_matches_without_pg_trgm_scores_rosters():
+    """Without pg_trgm, rosters for every team are fetched once and scored per group."""
+    rows = [
+        (1, "Quinn", "Ewers", "Texas", "QB", 2025),
+        (2, "Arch", "Manning", "Texas", "QB", 2025),
+        (3, "Arch", "Manning", "Texas", "WR", 2025),
+        (4, "Carson", "Beck", "Georgia", "QB", 2025),
+    ]
+    mock_cursor = AsyncMock()
+    mock_cursor.execute.side_effect = [pg_errors.UndefinedFunction("similarity"), None]
+    mock_cursor.fetchall.return_value = rows
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_conn.rollback = AsyncMock()
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    queries = [
+        ("Arch Maning", "Texas", "wr"),
+        ("Carson Beck", "georgia", None),
+        ("Carson Beck", "Texas", None),
+    ]
+    with patch("src.processing.player_matching.get_read_connection", side_effect=conn_ctx):
+        matches = await find_roster_matches(queries, year=2025)
+
+    mock_conn.rollback.assert_awaited_once()
+    assert "similarity" not in mock_cursor.execute.call_args.args[0]
+    assert matches[0].source_id == "3"
+    assert matches[0].confidence == fuzzy_match_name("Arch Maning", "Arch Manning")
+    assert matches[1].source_id == "4"
+    assert matches[2] is None
+
+
+async def test_find_roster_match_scores_candidates():
+    """Fuzzy scoring of fetched roster rows returns the best match above threshold."""
+    rows = [
+        (1, "Quinn", "Ewers", "Texas", "QB", 2025),
+        (2, "Arch", "Manning", "Texas", "QB", 2025),
+    ]
+    mock_cursor = AsyncMock()
+    mock_cursor.fetchall.return_value = rows
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with patch("src.processing.player_matching.get_read_connection", side_effect=conn_ctx):
+        match = await find_roster_match("Arch Maning", team="Texas", year=2025)
+
+    assert match is not None
+    assert match.source_id == "2"
+    assert match.confidence == fuzzy_match_name("Arch Maning", "Arch Manning")
+
+    # Candidates are pre-filtered and ranked by trigram similarity in Postgres
+    sql, params = mock_cursor.execute.call_args.args
+    assert "%% LOWER(%s)" in sql
+    assert params[-1] == FUZZY_CANDIDATE_LIMIT
+
+
+async def test_find_roster_match_without_pg_trgm_scans_roster():
+    """Without pg_trgm the unfiltered roster query is scored in Python."""
+    mock_cursor = AsyncMock()
+    mock_cursor.execute.side_effect = [pg_errors.UndefinedFunction("similarity"), None]
+    mock_cursor.fetchall.return_value = [(2, "Arch", "Manning", "Texas", "QB", 2025)]
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_conn.rollback = AsyncMock()
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with patch("src.processing.player_matching.get_read_connection", side_effect=conn_ctx):
+        match = await find_roster_match("Arch Manning", team="Texas", year=2025)
+
+    assert match is not None and match.source_id == "2"
+    mock_conn.rollback.assert_awaited_once()
+    fallback_sql = mock_cursor.execute.call_args.args[0]
+    assert "similarity" not in fallback_sql
+
+
 @pytest.mark.skip(reason="requires database connection")
 async def test_find_roster_match_integration():
     """Test finding a match in actual roster data."""
@@ -56,6 +214,325 @@ async def test_deterministic_match_exact_name_team_year():
         assert result.match_method == "deterministic"
 
 
+async def test_match_player_with_review_tier1_single_query():
+    """athlete_id and name+team lookups share one query and skip later tiers."""
+    from src.processing.player_matching import match_player_with_review
+
+    mock_cursor = AsyncMock()
+    mock_cursor.fetchone.return_value = (2, "Arch", "Manning", "Texas", "QB", 2025)
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with (
+        patch("src.processing.player_matching.get_read_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.player_matching.find_vector_match", new_callable=AsyncMock
+        ) as mock_vector,
+    ):
+        match, pending_id = await match_player_with_review(
+            "Arch Manning", team="Texas", year=2025, athlete_id="123456"
+        )
+
+    assert match.source_id == "2"
+    assert match.match_method == "deterministic"
+    assert pending_id is None
+    mock_cursor.execute.assert_awaited_once()
+    params = mock_cursor.execute.call_args.args[1]
+    assert params["athlete_id"] == "123456" and params["team"] == "Texas"
+    mock_vector.assert_not_awaited()
+
+
+async def test_match_player_with_review_caches_misses():
+    """A query that matched nothing is answered from the cache next time."""
+    from src.processing.player_matching import match_player_with_review
+
+    with (
+        patch.dict("src.processing.player_matching._no_match_cache", clear=True),
+        patch(
+            "src.processing.player_matching.find_deterministic_match_unified",
+            new_callable=AsyncMock,
+            return_value=None,
+        ) as mock_tier1,
+        patch(
+            "src.processing.player_matching.has_similar_roster_name",
+            new_callable=AsyncMock,
+            return_value=True,
+        ),
+        patch(
+            "src.processing.player_matching.find_vector_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ) as mock_vector,
+        patch(
+            "src.processing.player_matching.find_roster_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ) as mock_fuzzy,
+        patch(
+            "src.processing.player_matching.find_recruit_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ) as mock_recruit,
+    ):
+        first = await match_player_with_review("Nobody Known", team="Texas", year=2025)
+        second = await match_player_with_review(" nobody known ", team="TEXAS", year=2025)
+
+    assert first == second == (None, None)
+    for mock in (mock_tier1, mock_vector, mock_fuzzy, mock_recruit):
+        assert mock.await_count == 1
+
+
+async def test_match_player_with_review_does_not_cache_failed_vector_tier():
+    """A miss after a failed embedding request is retried on the next call."""
+    from src.processing.player_matching import match_player_with_review
+
+    with (
+        patch.dict("src.processing.player_matching._no_match_cache", clear=True),
+        patch(
+            "src.processing.player_matching.find_deterministic_match_unified",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "src.processing.player_matching.has_similar_roster_name",
+            new_callable=AsyncMock,
+            return_value=True,
+        ),
+        patch(
+            "src.processing.player_matching.find_vector_match",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("rate limited"),
+        ) as mock_vector,
+        patch(
+            "src.processing.player_matching.find_roster_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "src.processing.player_matching.find_recruit_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+    ):
+        first = await match_player_with_review("Nobody Known", team="Texas", year=2025)
+        second = await match_player_with_review("Nobody Known", team="Texas", year=2025)
+
+    assert first == second == (None, None)
+    assert mock_vector.await_count == 2
+
+
+async def test_match_players_with_review_does_not_cache_failed_vector_tier():
+    """Batch misses fall through to fuzzy but stay uncached when embedding fails."""
+    from src.processing.player_matching import _no_match_cache, match_players_with_review
+
+    with (
+        patch.dict("src.processing.player_matching._no_match_cache", clear=True),
+        patch(
+            "src.processing.player_matching.has_similar_roster_names",
+            new_callable=AsyncMock,
+            return_value=[True],
+        ),
+        patch(
+            "src.processing.player_matching.find_vector_matches",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("rate limited"),
+        ),
+        patch(
+            "src.processing.player_matching.find_roster_matches",
+            new_callable=AsyncMock,
+            return_value=[None],
+        ) as mock_fuzzy,
+        patch(
+            "src.processing.player_matching.find_recruit_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+    ):
+        result = await match_players_with_review([("Nobody Known", "Texas", None)], year=2025)
+        assert not _no_match_cache
+
+    assert result == [(None, None)]
+    mock_fuzzy.assert_awaited_once()
+
+
+async def test_match_player_with_review_skips_vector_without_similar_names():
+    """No trigram-similar name on the team means no embedding request."""
+    from src.processing.player_matching import match_player_with_review
+
+    with (
+        patch.dict("src.processing.player_matching._no_match_cache", clear=True),
+        patch(
+            "src.processing.player_matching.find_deterministic_match_unified",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "src.processing.player_matching.has_similar_roster_name",
+            new_callable=AsyncMock,
+            return_value=False,
+        ) as mock_probe,
+        patch(
+            "src.processing.player_matching.find_vector_match",
+            new_callable=AsyncMock,
+        ) as mock_vector,
+        patch(
+            "src.processing.player_matching.find_roster_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "src.processing.player_matching.find_recruit_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+    ):
+        result = await match_player_with_review("Zzyzx Qwerty", team="Texas", year=2025)
+
+    assert result == (None, None)
+    mock_probe.assert_awaited_once_with("Zzyzx Qwerty", "Texas", 2025)
+    mock_vector.assert_not_awaited()
+
+
+async def test_match_players_with_review_batches_vector_and_fuzzy_tiers():
+    """Misses share one vector call and one roster call; each outcome lands in order."""
+    from src.processing.player_matching import match_players_with_review
+
+    def _match(first, last, confidence):
+        return PlayerMatch(
+            source="roster",
+            source_id="1",
+            first_name=first,
+            last_name=last,
+            team="Texas",
+            position="QB",
+            year=2025,
+            confidence=confidence,
+        )
+
+    vector_hit = _match("Arch", "Manning", 95.0)
+    fuzzy_hit = _match("Quinn", "Ewers", 96.0)
+    fuzzy_review = _match("Colin", "Simmons", 85.0)
+    queries = [
+        ("Arch Manning", "Texas", "QB"),
+        ("Quinn Ewer", "Texas", None),
+        ("Colin Simons", "Texas", None),
+        ("Nobody Known", "Texas", None),
+    ]
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield MagicMock()
+
+    with (
+        patch.dict("src.processing.player_matching._no_match_cache", clear=True),
+        patch("src.processing.player_matching.get_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.player_matching.has_similar_roster_names",
+            new_callable=AsyncMock,
+            return_value=[True, True, True, True],
+        ),
+        patch(
+            "src.processing.player_matching.find_vector_matches",
+            new_callable=AsyncMock,
+            return_value=[vector_hit, None, None, None],
+        ) as mock_vector,
+        patch(
+            "src.processing.player_matching.find_roster_matches",
+            new_callable=AsyncMock,
+            return_value=[fuzzy_hit, fuzzy_review, None],
+        ) as mock_fuzzy,
+        patch(
+            "src.processing.player_matching.insert_pending_link",
+            new_callable=AsyncMock,
+            return_value=99,
+        ) as mock_pending,
+        patch(
+            "src.processing.player_matching.find_recruit_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+    ):
+        results = await match_players_with_review(queries, year=2025)
+        again = await match_players_with_review([queries[3]], year=2025)
+
+    assert results == [(vector_hit, None), (fuzzy_hit, None), (None, 99), (None, None)]
+    assert again == [(None, None)]
+    # The cached miss never reaches the tiers on the second call
+    mock_vector.assert_awaited_once_with(queries, year=2025)
+    mock_fuzzy.assert_awaited_once_with(queries[1:], year=2025)
+    assert mock_pending.call_args.kwargs["source_name"] == "Colin Simons"
+
+
+async def test_match_players_with_review_skips_vector_without_similar_names():
+    """One trigram probe covers the batch; dissimilar team names skip embedding."""
+    from src.processing.player_matching import match_players_with_review
+
+    queries = [
+        ("Zzyzx Qwerty", "Texas", None),
+        ("Arch Manning", "Texas", "QB"),
+        ("Arch Manning", None, "QB"),
+    ]
+    with (
+        patch.dict("src.processing.player_matching._no_match_cache", clear=True),
+        patch(
+            "src.processing.player_matching.has_similar_roster_names",
+            new_callable=AsyncMock,
+            return_value=[False, True],
+        ) as mock_probe,
+        patch(
+            "src.processing.player_matching.find_vector_matches",
+            new_callable=AsyncMock,
+            return_value=[None, None],
+        ) as mock_vector,
+        patch(
+            "src.processing.player_matching.find_roster_matches",
+            new_callable=AsyncMock,
+            return_value=[None, None],
+        ),
+        patch(
+            "src.processing.player_matching.find_roster_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "src.processing.player_matching.find_recruit_match",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+    ):
+        results = await match_players_with_review(queries, year=2025)
+
+    assert results == [(None, None)] * 3
+    mock_probe.assert_awaited_once_with(
+        [("Zzyzx Qwerty", "Texas"), ("Arch Manning", "Texas")], year=2025
+    )
+    mock_vector.assert_awaited_once_with(queries[1:], year=2025)
+
+
+async def test_has_similar_roster_name_without_pg_trgm_rolls_back():
+    """A missing pg_trgm skips nothing and leaves the pooled connection usable."""
+    from src.processing.player_matching import has_similar_roster_name
+
+    mock_cursor = AsyncMock()
+    mock_cursor.execute.side_effect = pg_errors.UndefinedFunction("similarity")
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_conn.rollback = AsyncMock()
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with patch("src.processing.player_matching.get_read_connection", side_effect=conn_ctx):
+        assert await has_similar_roster_name("Arch Manning", "Texas", 2025) is True
+
+    mock_conn.rollback.assert_awaited_once()
+
+
 @pytest.mark.skip(reason="requires database connection")
 async def test_deterministic_match_athlete_id_link():
     """Test athlete_id link to roster returns 100% confidence."""
@@ -71,6 +548,112 @@ async def test_deterministic_match_athlete_id_link():
 # Tests for Tier 2: Vector Similarity Matching
 
 
+async def test_find_vector_match_uses_joined_roster_row():
+    """The accepted candidate is built from the roster columns of the same query."""
+    from src.processing.player_matching import find_vector_match
+
+    candidates = [
+        {
+            "roster_id": "7",
+            "identity_text": "Arch Manning | QB | Georgia | 2025",
+            "similarity": 0.99,
+            "id": 7,
+            "first_name": "Arch",
+            "last_name": "Manning",
+            "team": "Georgia",
+            "position": "QB",
+            "year": 2025,
+        },
+        {
+            "roster_id": "8",
+            "identity_text": "Arch Manning | QB | Texas | 2025",
+            "similarity": 0.95,
+            "id": 8,
+            "first_name": "Arch",
+            "last_name": "Manning",
+            "team": "Texas",
+            "position": "QB",
+            "year": 2025,
+        },
+    ]
+    mock_conn = MagicMock()
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with (
+        patch("src.processing.player_matching.get_read_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.player_matching.find_similar_roster_by_embedding",
+            new_callable=AsyncMock,
+            return_value=candidates,
+        ),
+    ):
+        match = await find_vector_match("Arch Manning", team="Texas", position="QB", year=2025)
+
+    assert match is not None
+    assert match.source_id == "8"  # other-team candidate skipped
+    assert match.match_method == "vector"
+    assert match.confidence == pytest.approx(95.0)
+    mock_conn.cursor.assert_not_called()
+
+
+async def test_find_vector_matches_embeds_and_searches_once():
+    """All uncached queries share one embeddings request and one pgvector query."""
+    from src.processing.embeddings import EmbeddingResult
+    from src.processing.player_matching import find_vector_matches
+
+    texas = {
+        "roster_id": "8",
+        "identity_text": "Arch Manning | QB | Texas | 2025",
+        "similarity": 0.95,
+        "id": 8,
+        "first_name": "Arch",
+        "last_name": "Manning",
+        "team": "Texas",
+        "position": "QB",
+        "year": 2025,
+    }
+    mock_conn = MagicMock()
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with (
+        patch("src.processing.player_matching.get_read_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.embeddings.generate_embeddings",
+            new_callable=AsyncMock,
+            side_effect=lambda texts: [EmbeddingResult(text, [0.5]) for text in texts],
+        ) as mock_embed,
+        patch(
+            "src.processing.player_matching.find_similar_roster_by_embeddings",
+            new_callable=AsyncMock,
+            return_value=[[texas], [texas]],
+        ) as mock_search,
+    ):
+        matches = await find_vector_matches(
+            [("Arch Manning", "Texas", "QB"), ("Arch Manning", "Georgia", "QB")], year=2025
+        )
+        # Cached texts are not embedded again; only the new one is
+        await find_vector_matches(
+            [("Arch Manning", "Texas", "QB"), ("Quinn Ewers", "Texas", "QB")], year=2025
+        )
+
+    assert mock_embed.await_count == 2
+    assert mock_embed.call_args_list[0].args[0] == [
+        "Arch Manning | QB | Texas | 2025",
+        "Arch Manning | QB | Georgia | 2025",
+    ]
+    assert mock_embed.call_args_list[1].args[0] == ["Quinn Ewers | QB | Texas | 2025"]
+    assert mock_search.await_count == 2
+    assert mock_search.call_args_list[1].kwargs["embeddings"] == [[0.5], [0.5]]
+    assert matches[0].source_id == "8"
+    assert matches[1] is None  # only a Texas candidate for a Georgia query
+
+
 @pytest.mark.skip(reason="requires database connection")
 async def test_vector_match_returns_high_similarity():
     """Test vector matching uses embeddings for similarity."""
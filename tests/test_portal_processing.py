@@ -1,9 +1,15 @@
 """Tests for transfer portal processing."""
 
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from psycopg import errors as pg_errors
 
 from src.processing.transfer_portal import (
+    analyze_team_portal_impact,
     extract_portal_mentions,
+    generate_portal_snapshot,
     predict_destination,
 )
 
@@ -17,6 +23,16 @@ def test_extract_portal_mentions_finds_keywords():
     assert "entered" in result["event_type"]
 
 
+def test_extract_portal_mentions_event_priority():
+    """Event types are checked in EVENT_PATTERNS order, not text order."""
+    text = "Carson Beck COMMITTED TO Miami two weeks after he Entered The Transfer Portal"
+    result = extract_portal_mentions(text)
+
+    assert result["is_portal_related"] is True
+    assert result["event_type"] == "entered"
+    assert result["confidence"] == 0.8
+
+
 def test_extract_portal_mentions_no_match():
     """Test text without portal mentions."""
     text = "Arch Manning had a great game against Alabama"
@@ -25,6 +41,105 @@ def test_extract_portal_mentions_no_match():
     assert result["is_portal_related"] is False
 
 
+async def test_analyze_team_portal_impact_from_aggregates():
+    """Counts and averages are rebuilt from per-position aggregate rows."""
+    mock_cur = MagicMock()
+    mock_cur.execute = AsyncMock()
+    # (direction, position, count, grade_sum, graded_count)
+    mock_cur.fetchall = AsyncMock(
+        return_value=[
+            ("lost", "QB", 2, 160, 2),
+            ("lost", "WR", 1, 0, 0),
+            ("gained", "QB", 1, 90, 1),
+            ("gained", "CB", 2, 70, 1),
+        ]
+    )
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cur
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with patch("src.processing.transfer_portal.get_read_connection", side_effect=conn_ctx):
+        impact = await analyze_team_portal_impact("Texas")
+
+    mock_cur.execute.assert_awaited_once()
+    assert impact["outgoing_count"] == 3
+    assert impact["incoming_count"] == 3
+    assert impact["net_transfers"] == 0
+    assert impact["avg_grade_lost"] == 80.0
+    assert impact["avg_grade_gained"] == 80.0
+    assert impact["grade_delta"] == 0.0
+    assert impact["position_impact"] == {
+        "QB": {"lost": 2, "gained": 1},
+        "WR": {"lost": 1, "gained": 0},
+        "CB": {"lost": 0, "gained": 2},
+    }
+
+
+async def test_predict_destination_reads_prior_view():
+    """Destinations come from transfer_dest_prior, falling back to raw events."""
+    mock_cur = MagicMock()
+    mock_cur.execute = AsyncMock(side_effect=[pg_errors.UndefinedTable("missing"), None])
+    mock_cur.fetchall = AsyncMock(return_value=[("Miami", 3), ("LSU", 1)])
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cur
+    mock_conn.rollback = AsyncMock()
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with patch("src.processing.transfer_portal.get_read_connection", side_effect=conn_ctx):
+        predictions = await predict_destination(position="QB", from_team="Georgia")
+
+    first_sql = mock_cur.execute.call_args_list[0].args[0]
+    assert "scouting.transfer_dest_prior" in first_sql
+    mock_conn.rollback.assert_awaited_once()
+    assert [p["team"] for p in predictions] == ["Miami", "LSU"]
+    assert predictions[0]["probability"] == 0.75
+
+
+async def test_generate_portal_snapshot_uses_summary():
+    """The snapshot is built from SQL aggregates, not the full portal list."""
+    summary = {
+        "by_position": {"QB": 2, "Unknown": 1},
+        "notable": [{"name": "Carson Beck", "position": "QB", "composite_grade": 88}],
+    }
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield MagicMock()
+
+    with (
+        patch("src.processing.transfer_portal.get_connection", side_effect=conn_ctx),
+        patch(
+            "src.processing.transfer_portal.get_portal_summary",
+            new_callable=AsyncMock,
+            return_value=summary,
+        ),
+        patch(
+            "src.processing.transfer_portal.insert_portal_snapshot",
+            new_callable=AsyncMock,
+            return_value=7,
+        ) as mock_insert,
+        patch(
+            "src.processing.transfer_portal.refresh_transfer_dest_prior",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as mock_refresh,
+    ):
+        snapshot = await generate_portal_snapshot()
+
+    assert snapshot["snapshot_id"] == 7
+    assert snapshot["total_in_portal"] == 3
+    assert snapshot["by_position"] == {"QB": 2, "Unknown": 1}
+    assert snapshot["notable_entries"] == ["Carson Beck (QB, 88)"]
+    assert mock_insert.call_args.kwargs["total_in_portal"] == 3
+    mock_refresh.assert_awaited_once()
+
+
 @pytest.mark.skip(reason="requires database connection")
 async def test_predict_destination_returns_list():
     """Test destination prediction returns ranked list."""
@@ -1,9 +1,18 @@
 # tests/test_summarizer.py
 """Tests for Claude summarization."""
 
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
-from src.processing.summarizer import extract_sentiment, summarize_report
+from src.processing.summarizer import (
+    collect_summary_batch,
+    extract_sentiment,
+    submit_summary_batch,
+    summarize_report,
+)
 
 
 @pytest.mark.asyncio
@@ -26,6 +35,25 @@ async def test_extract_sentiment_clamps_to_range(mock_anthropic):
     assert sentiment == 0.65
 
 
+@pytest.mark.asyncio
+async def test_extract_sentiment_forces_tool_call(mock_anthropic):
+    """The score is read from a forced record_sentiment tool call."""
+    await extract_sentiment("Good game.")
+
+    kwargs = mock_anthropic.messages.create.call_args.kwargs
+    assert kwargs["tool_choice"] == {"type": "tool", "name": "record_sentiment"}
+    assert kwargs["tools"][0]["input_schema"]["required"] == ["sentiment"]
+
+
+@pytest.mark.asyncio
+async def test_extract_sentiment_missing_tool_call(mock_anthropic):
+    """A reply without a tool call falls back to neutral sentiment."""
+    block = SimpleNamespace(type="text", text="0.9")
+    mock_anthropic.messages.create = AsyncMock(return_value=SimpleNamespace(content=[block]))
+
+    assert await extract_sentiment("Good game.") == 0.0
+
+
 @pytest.mark.asyncio
 async def test_summarize_report_returns_summary(mock_anthropic):
     """Test summarize_report returns a SummaryResult dict."""
@@ -51,3 +79,70 @@ async def test_summarize_report_with_team_context(mock_anthropic):
     # AsyncMock stores kwargs — extract the messages kwarg
     prompt = str(call_args)
     assert "Texas" in prompt
+
+
+@pytest.mark.asyncio
+async def test_summary_batch_maps_results_by_custom_id(mock_anthropic):
+    """Batch results come back out of order and are mapped to input order."""
+
+    def succeeded(custom_id: str, summary: str) -> SimpleNamespace:
+        text = json.dumps({"summary": summary, "sentiment_score": 0.2})
+        message = SimpleNamespace(content=[SimpleNamespace(text=text)])
+        result = SimpleNamespace(type="succeeded", message=message)
+        return SimpleNamespace(custom_id=custom_id, result=result)
+
+    async def results_stream():
+        yield succeeded("2", "third")
+        yield SimpleNamespace(custom_id="1", result=SimpleNamespace(type="errored"))
+        yield succeeded("0", "first")
+
+    batches = mock_anthropic.messages.batches
+    batches.create = AsyncMock(
+        return_value=SimpleNamespace(id="msgbatch_1", processing_status="in_progress")
+    )
+    batches.retrieve = AsyncMock(
+        side_effect=[
+            SimpleNamespace(id="msgbatch_1", processing_status="in_progress"),
+            SimpleNamespace(id="msgbatch_1", processing_status="ended"),
+        ]
+    )
+    batches.results = AsyncMock(return_value=results_stream())
+
+    batch_id = await submit_summary_batch(["a", "b", "c"], [["Texas"], None, None])
+    with patch("src.processing.summarizer.asyncio.sleep", new_callable=AsyncMock):
+        results = await collect_summary_batch(batch_id, 3)
+
+    requests = batches.create.call_args.kwargs["requests"]
+    assert batch_id == "msgbatch_1"
+    assert [r["custom_id"] for r in requests] == ["0", "1", "2"]
+    assert "Texas" in requests[0]["params"]["messages"][0]["content"]
+    assert batches.retrieve.await_count == 2
+    assert results[0]["summary"] == "first"
+    assert results[1] is None
+    assert results[2]["summary"] == "third"
+
+
+@pytest.mark.asyncio
+async def test_submit_summary_batch_rejects_misaligned_team_contexts(mock_anthropic):
+    """Team contexts of the wrong length fail instead of being truncated."""
+    mock_anthropic.messages.batches.create = AsyncMock()
+
+    with pytest.raises(ValueError):
+        await submit_summary_batch(["a", "b"], [["Texas"]])
+
+    mock_anthropic.messages.batches.create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_collect_summary_batch_gives_up_after_max_wait(mock_anthropic):
+    """A batch still processing at the deadline raises TimeoutError, no results read."""
+    batches = mock_anthropic.messages.batches
+    batches.retrieve = AsyncMock(
+        return_value=SimpleNamespace(id="msgbatch_1", processing_status="in_progress")
+    )
+    batches.results = AsyncMock()
+
+    with pytest.raises(TimeoutError):
+        await collect_summary_batch("msgbatch_1", 3, max_wait_seconds=0)
+
+    batches.results.assert_not_awaited()
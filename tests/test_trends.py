@@ -1,8 +1,15 @@
 """Tests for trend analysis."""
 
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
 from src.processing.trends import (
     TrendDirection,
+    calculate_slope,
     calculate_trend,
+    classify_slope,
+    get_falling_stocks,
+    get_rising_stocks,
 )
 
 
@@ -32,3 +39,66 @@ def test_calculate_trend_insufficient_data():
     grades = [70, 75]  # Only 2 points
     result = calculate_trend(grades)
     assert result == TrendDirection.UNKNOWN
+
+
+def test_classify_slope():
+    """Test slope classification against the default threshold."""
+    assert classify_slope(1.2) == TrendDirection.RISING
+    assert classify_slope(-0.8) == TrendDirection.FALLING
+    assert classify_slope(0.5) == TrendDirection.STABLE
+
+
+def test_calculate_slope():
+    """Test least-squares slope over snapshot index."""
+    assert calculate_slope([60, 65, 70, 75, 80]) == 5.0
+    assert calculate_slope([80, 75, 70]) == -5.0
+    assert calculate_slope([70]) == 0.0
+
+
+async def test_get_rising_stocks_single_query():
+    """Slopes are ranked and filtered in one query; rows map to trend dicts."""
+    rows = [
+        (1, "Arch Manning", "Texas", "QB", 5.0, 10, 3),
+        (4, "Jeremiah Smith", "Ohio State", "WR", 1.25, 4, 5),
+    ]
+    mock_cursor = AsyncMock()
+    mock_cursor.fetchall.return_value = rows
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with patch("src.processing.trends.get_read_connection", side_effect=conn_ctx):
+        rising = await get_rising_stocks(limit=10, days=90)
+
+    mock_cursor.execute.assert_awaited_once()
+    params = mock_cursor.execute.call_args.args[1]
+    assert params["sign"] == 1
+    assert params["threshold"] == 0.5
+    assert params["limit"] == 10
+    assert [r["player_id"] for r in rising] == [1, 4]
+    assert rising[0]["slope"] == 5.0
+    assert rising[0]["grade_change"] == 10.0
+    assert rising[0]["direction"] == "rising"
+    assert rising[0]["data_points"] == 3
+
+
+async def test_get_falling_stocks_flips_sign():
+    """Falling stocks rank by the negated slope."""
+    mock_cursor = AsyncMock()
+    mock_cursor.fetchall.return_value = [(2, "Carson Beck", "Miami", "QB", -5.0, -10, 3)]
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    @asynccontextmanager
+    async def conn_ctx():
+        yield mock_conn
+
+    with patch("src.processing.trends.get_read_connection", side_effect=conn_ctx):
+        falling = await get_falling_stocks(days=90)
+
+    assert mock_cursor.execute.call_args.args[1]["sign"] == -1
+    assert falling[0]["direction"] == "falling"
+    assert falling[0]["slope"] == -5.0